@@ -65,6 +65,16 @@ async def startup_event() -> None:
     pass
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Application shutdown handler: let queued DB housekeeping finish."""
+    from app.services.scenario_runner import shutdown_grid_executor
+    from app.storage.housekeeping import housekeeper
+
+    housekeeper.stop(timeout=5)
+    shutdown_grid_executor()
+
+
 @app.get(
     "/api/v1/health",
     response_model=HealthResponse,
@@ -11,6 +11,7 @@ import io
 import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
@@ -46,6 +47,8 @@ from app.routers.schemas import (
 )
 from app.services.constants import RATE_LIMIT, SYSTEM_VERSION
 from app.services.scenario_runner import run_single_scenario, run_grid_scenarios, run_single_scenario_v2, run_grid_scenarios_v2
+from app.services.models import GridResult as GridResultModel
+from app.services.models import ScenarioResult as ScenarioResultModel
 from app.services.models import ScenarioStatus
 from app.storage.database import get_db
 from app.storage.models import AnalysisResult as AnalysisResultModel
@@ -65,6 +68,52 @@ limiter = Limiter(key_func=get_remote_address)
 # V1 endpoints removed - use V2 endpoints (/v2/scenario, /v2/grid) with decimal rates (0.0-1.0)
 
 
+def _run_scenario(
+    workspace_id: str,
+    census_id: str,
+    adoption_rate: float,
+    contribution_rate: float,
+    seed: int,
+    include_debug: bool,
+) -> ScenarioResultModel:
+    """Load the census participants and run one v2 scenario."""
+    participants = ParticipantRepository(get_db(workspace_id)).get_as_calculation_dicts(census_id)
+    return run_single_scenario_v2(
+        participants=participants,
+        adoption_rate=adoption_rate,
+        contribution_rate=contribution_rate,
+        seed=seed,
+        include_debug=include_debug,
+    )
+
+
+def _run_grid(
+    workspace_id: str,
+    census_id: str,
+    adoption_rates: tuple[float, ...],
+    contribution_rates: tuple[float, ...],
+    seed: int,
+    include_debug: bool,
+) -> GridResultModel:
+    """Load the census participants and run a v2 grid."""
+    participants = ParticipantRepository(get_db(workspace_id)).get_as_calculation_dicts(census_id)
+    return run_grid_scenarios_v2(
+        participants=participants,
+        adoption_rates=list(adoption_rates),
+        contribution_rates=list(contribution_rates),
+        seed=seed,
+        include_debug=include_debug,
+    )
+
+
+# Results are deterministic for a census, seed and rates, and a census'
+# participants never change after upload, so requests that repeat an explicit
+# seed (e.g. a dashboard re-opening a scenario) are served from memory.
+# Callers must confirm the census still exists before using these.
+_run_scenario_cached = lru_cache(maxsize=128)(_run_scenario)
+_run_grid_cached = lru_cache(maxsize=16)(_run_grid)
+
+
 @router.get(
     "/census/{census_id}/results",
     response_model=AnalysisResultListResponse,
@@ -154,20 +203,18 @@ async def run_scenario_v2(
             detail=f"Census {scenario.census_id} not found",
         )
 
-    # Get participants for calculation
-    participant_repo = ParticipantRepository(conn)
-    participants = participant_repo.get_as_calculation_dicts(scenario.census_id)
-
     # Generate seed if not provided
     seed = scenario.seed if scenario.seed is not None else int(time.time() * 1000) % (2**31)
 
-    # Run the v2 scenario
-    result = run_single_scenario_v2(
-        participants=participants,
-        adoption_rate=scenario.adoption_rate,
-        contribution_rate=scenario.contribution_rate,
-        seed=seed,
-        include_debug=scenario.include_debug,
+    # Run the v2 scenario; a generated seed is one-off, so skip the cache
+    run_scenario = _run_scenario_cached if scenario.seed is not None else _run_scenario
+    result = run_scenario(
+        workspace_id,
+        scenario.census_id,
+        scenario.adoption_rate,
+        scenario.contribution_rate,
+        seed,
+        scenario.include_debug,
     )
 
     # Convert to API response schema
@@ -273,20 +320,18 @@ async def run_grid_v2(
             detail=f"Census {grid_request.census_id} not found",
         )
 
-    # Get participants for calculation
-    participant_repo = ParticipantRepository(conn)
-    participants = participant_repo.get_as_calculation_dicts(grid_request.census_id)
-
     # Generate seed if not provided
     seed = grid_request.seed if grid_request.seed is not None else int(time.time() * 1000) % (2**31)
 
-    # Run the v2 grid analysis
-    result = run_grid_scenarios_v2(
-        participants=participants,
-        adoption_rates=grid_request.adoption_rates,
-        contribution_rates=grid_request.contribution_rates,
-        seed=seed,
-        include_debug=grid_request.include_debug,
+    # Run the v2 grid analysis; a generated seed is one-off, so skip the cache
+    run_grid = _run_grid_cached if grid_request.seed is not None else _run_grid
+    result = run_grid(
+        workspace_id,
+        grid_request.census_id,
+        tuple(grid_request.adoption_rates),
+        tuple(grid_request.contribution_rates),
+        seed,
+        grid_request.include_debug,
     )
 
     # Convert scenarios to API response format
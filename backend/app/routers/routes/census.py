@@ -52,6 +52,7 @@ from app.storage.repository import (
     ParticipantRepository,
     create_census_from_dataframe,
 )
+from app.storage.utils import UnitOfWork
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -201,9 +202,6 @@ async def upload_census(
     participant_repo = ParticipantRepository(conn)
     import_metadata_repo = ImportMetadataRepository(conn)
 
-    census_repo.save(census)
-    participant_repo.bulk_insert(participants)
-
     # T016: Store import metadata
     import_metadata = ImportMetadata(
         id=str(uuid.uuid4()),
@@ -213,7 +211,12 @@ async def upload_census(
         row_count=len(participants),
         created_at=datetime.utcnow(),
     )
-    import_metadata_repo.save(import_metadata)
+
+    # Census, participants and metadata commit together as one transaction
+    with UnitOfWork(conn):
+        census_repo.save(census)
+        participant_repo.bulk_insert(participants)
+        import_metadata_repo.save(import_metadata)
 
     # T037: Log census creation
     logger.info(
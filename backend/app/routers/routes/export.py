@@ -8,16 +8,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.routers.dependencies import get_workspace_id_from_header
 from app.routers.schemas import Error
-from app.services.acp_eligibility import determine_acp_inclusion, plan_year_bounds
+from app.services.acp_eligibility import determine_acp_inclusion_batch, plan_year_bounds
 from app.services.constants import RATE_LIMIT
-from app.services.export import format_csv_export, generate_pdf_report
+from app.services.export import generate_pdf_report, iter_csv_export
 from app.storage.database import get_db
 from app.storage.models import Participant
 from app.storage.repository import (
@@ -49,45 +50,60 @@ def compute_post_exclusion_counts(
         Tuple of (included_hce_count, included_nhce_count, excluded_count)
     """
     plan_year_start, plan_year_end = plan_year_bounds(plan_year)
+    if not participants:
+        return 0, 0, 0
+
+    # One vectorized pass; rows missing DOB or hire date come back includable (fail open)
+    inclusion = determine_acp_inclusion_batch(
+        [p.dob for p in participants],
+        [p.hire_date for p in participants],
+        [p.termination_date for p in participants],
+        plan_year_start,
+        plan_year_end,
+    )
+    is_hce = np.fromiter((p.is_hce for p in participants), dtype=bool, count=len(participants))
+    includable = inclusion.acp_includable
 
-    included_hce_count = 0
-    included_nhce_count = 0
-    excluded_count = 0
-
-    for p in participants:
-        # Skip eligibility check if missing required dates (fail open)
-        if p.dob is None or p.hire_date is None:
-            if p.is_hce:
-                included_hce_count += 1
-            else:
-                included_nhce_count += 1
-            continue
-
-        try:
-            result = determine_acp_inclusion(
-                dob=p.dob,
-                hire_date=p.hire_date,
-                termination_date=p.termination_date,
-                plan_year_start=plan_year_start,
-                plan_year_end=plan_year_end,
-            )
-            if result.acp_includable:
-                if p.is_hce:
-                    included_hce_count += 1
-                else:
-                    included_nhce_count += 1
-            else:
-                excluded_count += 1
-        except Exception:
-            # On any error, include participant (fail open)
-            if p.is_hce:
-                included_hce_count += 1
-            else:
-                included_nhce_count += 1
+    included_hce_count = int(np.count_nonzero(includable & is_hce))
+    included_nhce_count = int(np.count_nonzero(includable & ~is_hce))
+    excluded_count = len(participants) - included_hce_count - included_nhce_count
 
     return included_hce_count, included_nhce_count, excluded_count
 
 
+def _prefix_range_response(
+    request: Request,
+    content: bytes,
+    media_type: str,
+    headers: dict[str, str],
+) -> Response:
+    """
+    Serve content, honoring a ``Range: bytes=0-N`` prefix request.
+
+    Lets clients fetch just a prefix (e.g. the PDF magic bytes). Reports are
+    rebuilt on every request and embed their generation time, so two
+    responses never share bytes past the prefix; resuming a download would
+    splice two different files. Accept-Ranges is therefore not advertised and
+    any other range, including a malformed one, gets the full body.
+    """
+    range_header = request.headers.get("range", "")
+    unit, _, spec = range_header.partition("=")
+    first, _, last = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or first.strip() != "0" or not last.strip().isdigit():
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    end = min(int(last), len(content) - 1)
+    if end < 0:
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    return Response(
+        content=content[:end + 1],
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers={**headers, "Content-Range": f"bytes 0-{end}/{len(content)}"},
+    )
+
+
 @router.get(
     "/export/{census_id}/csv",
     summary="Export results as CSV",
@@ -149,7 +165,8 @@ async def export_csv(
         "hce_count": census.hce_count,
         "nhce_count": census.nhce_count,
     }
-    results_dicts = [
+    # Rows are built lazily while the response streams
+    results_dicts = (
         {
             "adoption_rate": r.adoption_rate,
             "contribution_rate": r.contribution_rate,
@@ -163,7 +180,7 @@ async def export_csv(
             "run_timestamp": r.run_timestamp.isoformat(),
         }
         for r in results
-    ]
+    )
 
     # Compute post-exclusion counts for accurate reporting
     participant_repo = ParticipantRepository(conn)
@@ -172,8 +189,8 @@ async def export_csv(
         census.plan_year, participants
     )
 
-    # Generate CSV with post-exclusion counts
-    csv_content = format_csv_export(
+    # Stream CSV with post-exclusion counts
+    csv_chunks = iter_csv_export(
         census_dict,
         results_dicts,
         seed,
@@ -189,8 +206,8 @@ async def export_csv(
     seed_part = f"_Run{seed}" if seed else ""
     filename = f"{safe_name}_{census.plan_year}{seed_part}_{export_date}.csv"
 
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        csv_chunks,
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
@@ -210,6 +227,7 @@ async def export_csv(
             "description": "PDF file",
             "content": {"application/pdf": {}},
         },
+        206: {"description": "Requested byte range of the PDF file"},
         404: {"model": Error, "description": "Census or results not found"},
     },
 )
@@ -251,7 +269,7 @@ async def export_pdf(
         "hce_count": census.hce_count,
         "nhce_count": census.nhce_count,
     }
-    results_dicts = [
+    results_dicts = (
         {
             "adoption_rate": r.adoption_rate,
             "contribution_rate": r.contribution_rate,
@@ -265,7 +283,7 @@ async def export_pdf(
             "run_timestamp": r.run_timestamp.isoformat(),
         }
         for r in results
-    ]
+    )
 
     # Get grid summary and seed if applicable
     grid_summary = None
@@ -307,8 +325,9 @@ async def export_pdf(
     seed_part = f"_Run{seed}" if seed else ""
     filename = f"{safe_name}_{census.plan_year}{seed_part}_{export_date}.pdf"
 
-    return Response(
-        content=pdf_content,
+    return _prefix_range_response(
+        request,
+        pdf_content,
         media_type="application/pdf",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
@@ -81,6 +81,8 @@ from app.storage.repository import (
     ValidationIssueRepository,
     ImportLogRepository,
 )
+from app.storage.housekeeping import housekeeper
+from app.storage.utils import UnitOfWork
 
 
 router = APIRouter(prefix="/import", tags=["Import Wizard"])
@@ -212,6 +214,7 @@ async def create_import_session(
 
     # Save session
     repo.save(session)
+    housekeeper.schedule(workspace_id, repo.conn)
 
     return ImportSessionSchema(
         id=session.id,
@@ -295,6 +298,7 @@ async def create_workspace_import_session(
 
     # Save session
     repo.save(session)
+    housekeeper.schedule(workspace_id, repo.conn)
 
     return ImportSessionSchema(
         id=session.id,
@@ -652,9 +656,6 @@ async def run_validation(
     if not file_path.exists():
         raise HTTPException(status_code=410, detail="Uploaded file no longer available")
 
-    # Clear previous validation issues
-    issue_repo.delete_by_session(session_id)
-
     # Parse and validate file
     start_time = datetime.utcnow()
 
@@ -676,10 +677,6 @@ async def run_validation(
         issues.extend(dup_issues)
         error_count += len(dup_issues)
 
-    # Save issues
-    issue_repo.bulk_insert(issues)
-
-    # Update session
     end_time = datetime.utcnow()
     duration = (end_time - start_time).total_seconds()
 
@@ -691,7 +688,12 @@ async def run_validation(
         "valid_count": max(0, valid_count),
     }
     session.current_step = "preview"
-    repo.update(session)
+
+    # Replace previous issues and update the session in one transaction
+    with UnitOfWork(repo.conn):
+        issue_repo.delete_by_session(session_id)
+        issue_repo.bulk_insert(issues)
+        repo.update(session)
 
     return ValidationResult(
         session_id=session_id,
@@ -1151,15 +1153,6 @@ async def execute_import(
 
                 # Get database connection for this workspace
                 db_conn = get_db(session.workspace_id)
-                census_repo = CensusRepository(db_conn)
-
-                # Check if census with same name exists and delete it (reload behavior)
-                existing_censuses, _ = census_repo.list()
-                for existing in existing_censuses:
-                    if existing.name == request.census_name:
-                        print(f"DEBUG: Deleting existing census '{existing.name}' (id={existing.id}) for reload")
-                        census_repo.delete(existing.id)
-                        break
 
                 # Create Census record in DuckDB
                 census_model = CensusModel(
@@ -1177,7 +1170,6 @@ async def execute_import(
                     salt=census_salt,
                     version="1.0.0",
                 )
-                census_repo.save(census_model)
 
                 # Create Participant records in DuckDB
                 from datetime import date as date_type, datetime as datetime_type
@@ -1208,38 +1200,86 @@ async def execute_import(
                             continue
                     return None
 
-                participant_models = []
-                for idx, row in processed_df.iterrows():
-                    # Parse dates - convert strings to date objects
-                    dob_str = str(row.get("dob", "")).strip()
-                    hire_str = str(row.get("hire_date", "")).strip()
-                    term_str = str(row.get("termination_date", "")).strip()
+                def parse_date_column(col: str) -> list[date_type | None]:
+                    """Parse a date column, parsing each distinct string once."""
+                    values = processed_df[col].astype(str).str.strip().tolist()
+                    parsed = {value: parse_date_str(value) for value in set(values)}
+                    return [parsed[value] for value in values]
 
-                    participant_model = ParticipantModel(
+                # Convert whole columns once instead of walking rows with iterrows()
+                participant_models = [
+                    ParticipantModel(
                         id=str(uuid4()),
                         census_id=census_id,
-                        internal_id=str(row["internal_id"]),
-                        is_hce=bool(row["is_hce"]),
-                        compensation_cents=int(row["compensation_cents"]),
-                        deferral_rate=float(row["deferral_rate"]) * 100,  # Convert to percentage
-                        match_rate=float(row["match_rate"]) * 100,
-                        after_tax_rate=float(row["after_tax_rate"]) * 100,
-                        dob=parse_date_str(dob_str),
-                        hire_date=parse_date_str(hire_str),
-                        termination_date=parse_date_str(term_str),
+                        internal_id=str(internal_id),
+                        is_hce=bool(is_hce),
+                        compensation_cents=int(compensation_cents),
+                        deferral_rate=deferral_rate * 100,  # Convert to percentage
+                        match_rate=match_rate * 100,
+                        after_tax_rate=after_tax_rate * 100,
+                        dob=dob,
+                        hire_date=hire_date,
+                        termination_date=termination_date,
                         # Include contribution amounts
-                        employee_pre_tax_cents=int(row.get("pre_tax_cents", 0)),
-                        employee_after_tax_cents=int(row.get("after_tax_cents", 0)),
-                        employee_roth_cents=int(row.get("roth_cents", 0)),
-                        employer_match_cents=int(row.get("match_cents", 0)),
-                        employer_non_elective_cents=int(row.get("non_elective_cents", 0)),
+                        employee_pre_tax_cents=int(pre_tax_cents),
+                        employee_after_tax_cents=int(after_tax_cents),
+                        employee_roth_cents=int(roth_cents),
+                        employer_match_cents=int(match_cents),
+                        employer_non_elective_cents=int(non_elective_cents),
                         # SSN hash for duplicate detection
-                        ssn_hash=row.get("ssn_hash"),
+                        ssn_hash=ssn_hash,
                     )
-                    participant_models.append(participant_model)
+                    for (
+                        internal_id,
+                        is_hce,
+                        compensation_cents,
+                        deferral_rate,
+                        match_rate,
+                        after_tax_rate,
+                        dob,
+                        hire_date,
+                        termination_date,
+                        pre_tax_cents,
+                        after_tax_cents,
+                        roth_cents,
+                        match_cents,
+                        non_elective_cents,
+                        ssn_hash,
+                    ) in zip(
+                        processed_df["internal_id"].tolist(),
+                        processed_df["is_hce"].tolist(),
+                        processed_df["compensation_cents"].tolist(),
+                        processed_df["deferral_rate"].astype(float).tolist(),
+                        processed_df["match_rate"].astype(float).tolist(),
+                        processed_df["after_tax_rate"].astype(float).tolist(),
+                        parse_date_column("dob"),
+                        parse_date_column("hire_date"),
+                        parse_date_column("termination_date"),
+                        processed_df["pre_tax_cents"].tolist(),
+                        processed_df["after_tax_cents"].tolist(),
+                        processed_df["roth_cents"].tolist(),
+                        processed_df["match_cents"].tolist(),
+                        processed_df["non_elective_cents"].tolist(),
+                        processed_df["ssn_hash"].tolist(),
+                        strict=True,
+                    )
+                ]
 
+                census_repo = CensusRepository(db_conn)
                 participant_repo = ParticipantRepository(db_conn)
-                participant_repo.bulk_insert(participant_models)
+
+                # Check if census with same name exists and delete it (reload behavior)
+                existing_censuses, _ = census_repo.list()
+                for existing in existing_censuses:
+                    if existing.name == request.census_name:
+                        print(f"DEBUG: Deleting existing census '{existing.name}' (id={existing.id}) for reload")
+                        census_repo.delete(existing.id)
+                        break
+
+                # The census and its participants commit together as one transaction
+                with UnitOfWork(db_conn):
+                    census_repo.save(census_model)
+                    participant_repo.bulk_insert(participant_models)
 
                 # Set census_id on import log
                 import_log.census_id = census_id
@@ -1258,12 +1298,13 @@ async def execute_import(
     import_log.warning_count = warning_count
     import_log.completed_at = datetime.utcnow()
 
-    log_repo.save(import_log)
-
     # Update session
     session.current_step = "completed"
     session.import_result_id = import_log.id
-    repo.update(session)
+
+    with UnitOfWork(log_repo.conn):
+        log_repo.save(import_log)
+        repo.update(session)
 
     duration = (import_log.completed_at - start_time).total_seconds()
 
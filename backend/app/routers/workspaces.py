@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 from uuid import UUID, uuid4
 
 import pandas as pd
@@ -23,7 +22,7 @@ from app.models.analysis import GridResult, GridSummary, ScenarioResult as Scena
 from app.models.run import Run, RunCreate, RunListResponse, RunStatus
 from app.services.census_parser import CensusValidationError, process_census_bytes
 from app.services.scenario_runner import run_grid_scenarios_v2, run_single_scenario_v2
-from app.services.acp_calculator import calculate_acp_limits
+from app.services.acp_calculator import acp_limits_for
 from app.services.models import ScenarioResult as ScenarioResultModel, ScenarioStatus
 from app.services.acp_eligibility import (
     ACPInclusionError,
@@ -36,6 +35,19 @@ from app.storage.repository import CensusRepository
 
 router = APIRouter(prefix="/api/workspaces", tags=["Workspaces"])
 
+# Rows rendered per chunk when streaming a census DataFrame to CSV
+CENSUS_CSV_CHUNK_ROWS = 50_000
+
+
+def _iter_census_csv(df: pd.DataFrame) -> Iterator[bytes]:
+    """Render a census DataFrame as UTF-8 CSV a block of rows at a time."""
+    if df.empty:
+        yield df.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(df), CENSUS_CSV_CHUNK_ROWS):
+        block = df.iloc[start:start + CENSUS_CSV_CHUNK_ROWS]
+        yield block.to_csv(index=False, header=start == 0).encode("utf-8")
+
 
 @router.get("", response_model=WorkspaceListResponse)
 def list_workspaces() -> WorkspaceListResponse:
@@ -135,7 +147,7 @@ async def upload_census(
         )
 
         # Save census data as CSV
-        storage.save_census_data(workspace_id, df.to_csv(index=False))
+        storage.save_census_data_stream(workspace_id, _iter_census_csv(df))
 
         # Calculate statistics
         hce_count = int(df["is_hce"].sum())
@@ -418,15 +430,15 @@ def create_run(workspace_id: UUID, data: RunCreate) -> Run:
                 or binding_rule is None
                 or max_allowed_acp is None
             ):
-                limits = calculate_acp_limits(Decimal(str(nhce_acp)))
-                limit_125 = limit_125 or float(limits["limit_125"])
-                limit_2pct_uncapped = limit_2pct_uncapped or float(limits["limit_2pct_uncapped"])
-                cap_2x = cap_2x or float(limits["cap_2x"])
-                limit_2pct_capped = limit_2pct_capped or float(limits["limit_2pct_capped"])
-                effective_limit = effective_limit or float(limits["effective_limit"])
+                limits = acp_limits_for(nhce_acp)
+                limit_125 = limit_125 or limits.limit_125
+                limit_2pct_uncapped = limit_2pct_uncapped or limits.limit_2pct_uncapped
+                cap_2x = cap_2x or limits.cap_2x
+                limit_2pct_capped = limit_2pct_capped or limits.limit_2pct_capped
+                effective_limit = effective_limit or limits.effective_limit
                 if binding_rule is None:
-                    binding_rule = "1.25x" if limits["limit_125"] >= limits["limit_2pct_capped"] else "2pct/2x"
-                max_allowed_acp = max_allowed_acp or float(limits["effective_limit"])
+                    binding_rule = limits.binding_rule
+                max_allowed_acp = max_allowed_acp or limits.effective_limit
 
             return {
                 "status": s.status.value,
@@ -467,13 +479,10 @@ def create_run(workspace_id: UUID, data: RunCreate) -> Run:
             "seed_used": grid_result.seed_used,
         }
 
-        # Save results
-        storage.save_run_results(workspace_id, run.id, results_dict)
-
-        # Update run status
+        # Save results together with the completed run status
         run.status = RunStatus.COMPLETED
         run.completed_at = datetime.utcnow()
-        storage.update_run(workspace_id, run)
+        storage.save_run_with_results(workspace_id, run, results_dict)
 
     except Exception as e:
         # Mark run as failed
@@ -916,17 +925,14 @@ def get_employee_impact(
             )
         )
         if needs_limits:
-            limits = calculate_acp_limits(Decimal(str(scenario_summary["nhce_acp"])))
-            scenario_summary.setdefault("limit_125", float(limits["limit_125"]))
-            scenario_summary.setdefault("limit_2pct_uncapped", float(limits["limit_2pct_uncapped"]))
-            scenario_summary.setdefault("cap_2x", float(limits["cap_2x"]))
-            scenario_summary.setdefault("limit_2pct_capped", float(limits["limit_2pct_capped"]))
-            scenario_summary.setdefault("effective_limit", float(limits["effective_limit"]))
-            scenario_summary.setdefault(
-                "binding_rule",
-                "1.25x" if limits["limit_125"] >= limits["limit_2pct_capped"] else "2pct/2x",
-            )
-            scenario_summary.setdefault("max_allowed_acp", float(limits["effective_limit"]))
+            limits = acp_limits_for(scenario_summary["nhce_acp"])
+            scenario_summary.setdefault("limit_125", limits.limit_125)
+            scenario_summary.setdefault("limit_2pct_uncapped", limits.limit_2pct_uncapped)
+            scenario_summary.setdefault("cap_2x", limits.cap_2x)
+            scenario_summary.setdefault("limit_2pct_capped", limits.limit_2pct_capped)
+            scenario_summary.setdefault("effective_limit", limits.effective_limit)
+            scenario_summary.setdefault("binding_rule", limits.binding_rule)
+            scenario_summary.setdefault("max_allowed_acp", limits.effective_limit)
 
     return {
         "census_id": census_summary.id,
@@ -956,8 +962,7 @@ from fastapi.responses import StreamingResponse
 def export_csv(workspace_id: UUID, run_id: UUID):
     """Export run results as CSV."""
     storage = get_workspace_storage()
-    from decimal import Decimal
-    from app.services.acp_calculator import calculate_acp_limits
+    from app.services.acp_calculator import acp_limits_for
 
     # Verify workspace exists
     workspace = storage.get_workspace(workspace_id)
@@ -1019,16 +1024,13 @@ def export_csv(workspace_id: UUID, run_id: UUID):
     for scenario in results.get("scenarios", []):
         nhce_acp = scenario.get("nhce_acp")
         if nhce_acp is not None and scenario.get("effective_limit") is None:
-            limits = calculate_acp_limits(Decimal(str(nhce_acp)))
-            scenario.setdefault("limit_125", float(limits["limit_125"]))
-            scenario.setdefault("limit_2pct_uncapped", float(limits["limit_2pct_uncapped"]))
-            scenario.setdefault("cap_2x", float(limits["cap_2x"]))
-            scenario.setdefault("limit_2pct_capped", float(limits["limit_2pct_capped"]))
-            scenario.setdefault("effective_limit", float(limits["effective_limit"]))
-            scenario.setdefault(
-                "binding_rule",
-                "1.25x" if limits["limit_125"] >= limits["limit_2pct_capped"] else "2pct/2x",
-            )
+            limits = acp_limits_for(nhce_acp)
+            scenario.setdefault("limit_125", limits.limit_125)
+            scenario.setdefault("limit_2pct_uncapped", limits.limit_2pct_uncapped)
+            scenario.setdefault("cap_2x", limits.cap_2x)
+            scenario.setdefault("limit_2pct_capped", limits.limit_2pct_capped)
+            scenario.setdefault("effective_limit", limits.effective_limit)
+            scenario.setdefault("binding_rule", limits.binding_rule)
             scenario.setdefault("max_allowed_acp", scenario.get("effective_limit"))
 
         row = [
@@ -1068,8 +1070,7 @@ def export_csv(workspace_id: UUID, run_id: UUID):
 def export_pdf(workspace_id: UUID, run_id: UUID):
     """Export run results as PDF report."""
     storage = get_workspace_storage()
-    from decimal import Decimal
-    from app.services.acp_calculator import calculate_acp_limits
+    from app.services.acp_calculator import acp_limits_for
 
     # Verify workspace exists
     workspace = storage.get_workspace(workspace_id)
@@ -1130,14 +1131,11 @@ def export_pdf(workspace_id: UUID, run_id: UUID):
     export_results = []
     for s in results.get("scenarios", []):
         nhce_acp = s.get("nhce_acp")
-        limits = None
+        limit_125 = limit_2pct_uncapped = cap_2x = limit_2pct_capped = effective_limit = 0
         if nhce_acp is not None:
-            limits = calculate_acp_limits(Decimal(str(nhce_acp)))
-        limit_125 = float(limits["limit_125"]) if limits else 0
-        limit_2pct_uncapped = float(limits["limit_2pct_uncapped"]) if limits else 0
-        cap_2x = float(limits["cap_2x"]) if limits else 0
-        limit_2pct_capped = float(limits["limit_2pct_capped"]) if limits else 0
-        effective_limit = float(limits["effective_limit"]) if limits else 0
+            limit_125, limit_2pct_uncapped, cap_2x, limit_2pct_capped, effective_limit, _ = (
+                acp_limits_for(nhce_acp)
+            )
         export_results.append({
             "adoption_rate": s.get("adoption_rate", 0) * 100,  # Convert to percentage
             "contribution_rate": s.get("contribution_rate", 0) * 100,  # Convert to percentage
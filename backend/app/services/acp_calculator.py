@@ -9,13 +9,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Literal
+from functools import lru_cache
+from typing import Iterable, Literal, NamedTuple
+
+import numpy as np
 
 from app.services.constants import ACP_MULTIPLIER, ACP_ADDER, get_415c_limit
 from app.services.models import LimitingBound
 
 
-@dataclass
+@dataclass(slots=True)
 class ACPResult:
     """Result of an ACP test calculation."""
     nhce_acp: Decimal
@@ -33,14 +36,187 @@ class ACPResult:
     binding_rule: Literal["1.25x", "2pct/2x"]
 
 
+def _as_id_set(ids: Iterable[str]) -> set[str] | frozenset[str]:
+    """Return ids as a set for O(1) membership, reusing it if it already is one."""
+    if isinstance(ids, (set, frozenset)):
+        return ids
+    return frozenset(ids)
+
+
+@dataclass(slots=True, frozen=True)
+class CensusColumns:
+    """
+    Participant data as parallel NumPy columns (structure of arrays).
+
+    Built once from participant dictionaries so several calculations over the
+    same census skip per-participant dictionary lookups.
+    """
+    internal_ids: tuple[str, ...]
+    contribution_cents: np.ndarray  # match + after-tax, int64
+    compensation_cents: np.ndarray  # int64
+    is_hce: np.ndarray  # bool
+
+    @classmethod
+    def from_dicts(cls, participants: list[dict]) -> CensusColumns:
+        """Convert participant dictionaries (same keys the calculators read)."""
+        count = len(participants)
+        return cls(
+            internal_ids=tuple(p.get("internal_id", "") for p in participants),
+            contribution_cents=np.fromiter(
+                (p.get("match_cents", 0) + p.get("after_tax_cents", 0) for p in participants),
+                dtype=np.int64,
+                count=count,
+            ),
+            compensation_cents=np.fromiter(
+                (p.get("compensation_cents", 0) for p in participants),
+                dtype=np.int64,
+                count=count,
+            ),
+            is_hce=np.fromiter(
+                (bool(p.get("is_hce", False)) for p in participants),
+                dtype=bool,
+                count=count,
+            ),
+        )
+
+    def adopting_mask(self, adopting_hce_ids: Iterable[str]) -> np.ndarray:
+        """Mask of HCEs whose internal ID is in adopting_hce_ids."""
+        adopting_set = _as_id_set(adopting_hce_ids)
+        adopting = np.fromiter(
+            (internal_id in adopting_set for internal_id in self.internal_ids),
+            dtype=bool,
+            count=len(self.internal_ids),
+        )
+        return adopting & self.is_hce
+
+
 _ACP_QUANTIZE = Decimal("0.000001")
 
 
+# Per-participant ACPs are carried as integers in millionths of a percent, the
+# same 6-place precision as _ACP_QUANTIZE, so census loops use native int math
+# and only the group result is converted to Decimal
+_ACP_SCALE = 1_000_000
+_ACP_SCALE_EXPONENT = -6
+
+
 def _quantize_percent(value: Decimal) -> Decimal:
     """Quantize ACP percentages to 6 decimal places for consistent precision."""
     return value.quantize(_ACP_QUANTIZE, rounding=ROUND_HALF_UP)
 
 
+def _div_round_half_up(numerator: int, denominator: int) -> int:
+    """Divide integers, rounding ties away from zero like ROUND_HALF_UP."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def _scaled_to_decimal(value: int) -> Decimal:
+    """Convert a fixed-point ACP to the quantized Decimal the API returns."""
+    return Decimal(value).scaleb(_ACP_SCALE_EXPONENT)
+
+
+def _individual_acp_scaled(
+    match_cents: int,
+    after_tax_cents: int,
+    compensation_cents: int
+) -> int:
+    """Individual ACP in millionths of a percent (0 when compensation is 0)."""
+    if compensation_cents == 0:
+        return 0
+    return _div_round_half_up(
+        (match_cents + after_tax_cents) * 100 * _ACP_SCALE, compensation_cents
+    )
+
+
+# Largest contribution (in cents) whose scaled numerator, and twice its
+# remainder, still fit in int64 for the vectorized path (about $46M)
+_MAX_VECTOR_CONTRIBUTION_CENTS = np.iinfo(np.int64).max // (200 * _ACP_SCALE)
+
+
+def _sum_individual_acps_scaled(
+    contribution_cents: list[int] | np.ndarray,
+    compensation_cents: list[int] | np.ndarray
+) -> int:
+    """
+    Sum fixed-point individual ACPs over paired census columns in one NumPy pass.
+
+    Equivalent to summing _individual_acp_scaled per participant; columns
+    outside the int64-safe range (or with negative values) take that exact
+    per-participant path instead.
+    """
+    try:
+        contribution = np.asarray(contribution_cents, dtype=np.int64)
+        compensation = np.asarray(compensation_cents, dtype=np.int64)
+    except OverflowError:
+        contribution = compensation = None
+    if (
+        contribution is None
+        or contribution.size == 0
+        or contribution.min() < 0
+        or contribution.max() > _MAX_VECTOR_CONTRIBUTION_CENTS
+        or compensation.min() < 0
+    ):
+        return sum(
+            _individual_acp_scaled(int(contribution), 0, int(compensation))
+            for contribution, compensation in zip(contribution_cents, compensation_cents, strict=True)
+        )
+
+    no_compensation = compensation == 0
+    divisor = np.where(no_compensation, 1, compensation)
+    acps, remainder = np.divmod(contribution * (100 * _ACP_SCALE), divisor)
+    acps += 2 * remainder >= divisor
+    acps[no_compensation] = 0
+
+    if acps.max() > np.iinfo(np.int64).max // acps.size:
+        return sum(acps.tolist())
+    return int(acps.sum())
+
+
+def _group_acp_scaled(total: int, count: int) -> Decimal:
+    """Average fixed-point individual ACPs into a quantized Decimal group ACP."""
+    if count == 0:
+        return Decimal("0")
+    return _scaled_to_decimal(_div_round_half_up(total, count))
+
+
+def _contribution_rate_ratio(contribution_rate: Decimal) -> tuple[int, int]:
+    """Exact (numerator, denominator) of contribution_rate / 100."""
+    numerator, denominator = contribution_rate.as_integer_ratio()
+    return numerator, denominator * 100
+
+
+def _simulated_contribution_cents(
+    compensation_cents: int,
+    rate_ratio: tuple[int, int]
+) -> int:
+    """Simulated mega-backdoor contribution (compensation * rate / 100), truncated."""
+    numerator, denominator = rate_ratio
+    product = compensation_cents * numerator
+    simulated = abs(product) // denominator
+    return simulated if product >= 0 else -simulated
+
+
+def _simulated_contributions_cents(
+    compensation_cents: np.ndarray,
+    rate_ratio: tuple[int, int]
+) -> np.ndarray:
+    """Vectorized _simulated_contribution_cents over non-negative compensations."""
+    numerator, denominator = rate_ratio
+    if compensation_cents.size == 0:
+        return compensation_cents.copy()
+    if numerator < 0 or int(compensation_cents.max()) * numerator > np.iinfo(np.int64).max:
+        return np.array(
+            [_simulated_contribution_cents(c, rate_ratio) for c in compensation_cents.tolist()],
+            dtype=np.int64,
+        )
+    return compensation_cents * numerator // denominator
+
+
 def calculate_individual_acp(
     match_cents: int,
     after_tax_cents: int,
@@ -62,10 +238,9 @@ def calculate_individual_acp(
     if compensation_cents == 0:
         return Decimal("0")
 
-    total_contribution = Decimal(match_cents + after_tax_cents)
-    compensation = Decimal(compensation_cents)
-
-    return _quantize_percent(total_contribution / compensation * 100)
+    return _scaled_to_decimal(
+        _individual_acp_scaled(match_cents, after_tax_cents, compensation_cents)
+    )
 
 
 def calculate_group_acp(individual_acps: list[Decimal]) -> Decimal:
@@ -87,12 +262,12 @@ def calculate_group_acp(individual_acps: list[Decimal]) -> Decimal:
     return _quantize_percent(total / count)
 
 
-def calculate_nhce_acp(participants: list[dict]) -> Decimal:
+def calculate_nhce_acp(participants: list[dict] | CensusColumns) -> Decimal:
     """
     Calculate NHCE group ACP from participant data.
 
     Args:
-        participants: List of participant dictionaries with:
+        participants: CensusColumns, or list of participant dictionaries with:
             - match_cents: int
             - after_tax_cents: int
             - compensation_cents: int
@@ -101,22 +276,30 @@ def calculate_nhce_acp(participants: list[dict]) -> Decimal:
     Returns:
         NHCE group ACP as a Decimal percentage
     """
-    nhce_acps = []
+    if isinstance(participants, CensusColumns):
+        nhce = ~participants.is_hce
+        return _group_acp_scaled(
+            _sum_individual_acps_scaled(
+                participants.contribution_cents[nhce], participants.compensation_cents[nhce]
+            ),
+            int(np.count_nonzero(nhce)),
+        )
+
+    contributions = []
+    compensations = []
     for p in participants:
         if not p.get("is_hce", False):
-            acp = calculate_individual_acp(
-                match_cents=p.get("match_cents", 0),
-                after_tax_cents=p.get("after_tax_cents", 0),
-                compensation_cents=p.get("compensation_cents", 0)
-            )
-            nhce_acps.append(acp)
+            contributions.append(p.get("match_cents", 0) + p.get("after_tax_cents", 0))
+            compensations.append(p.get("compensation_cents", 0))
 
-    return calculate_group_acp(nhce_acps)
+    return _group_acp_scaled(
+        _sum_individual_acps_scaled(contributions, compensations), len(contributions)
+    )
 
 
 def calculate_hce_acp(
-    participants: list[dict],
-    adopting_hce_ids: list[str],
+    participants: list[dict] | CensusColumns,
+    adopting_hce_ids: Iterable[str],
     contribution_rate: Decimal
 ) -> Decimal:
     """
@@ -126,39 +309,49 @@ def calculate_hce_acp(
     contributions at the specified contribution_rate.
 
     Args:
-        participants: List of participant dictionaries
-        adopting_hce_ids: List of internal IDs of HCEs adopting mega-backdoor
+        participants: CensusColumns or list of participant dictionaries
+        adopting_hce_ids: Internal IDs of HCEs adopting mega-backdoor (list or set)
         contribution_rate: Mega-backdoor contribution rate as percentage (0-15)
 
     Returns:
         HCE group ACP as a Decimal percentage
     """
-    hce_acps = []
-    adopting_set = set(adopting_hce_ids)
+    if isinstance(participants, CensusColumns):
+        hce = participants.is_hce
+        adopting = participants.adopting_mask(adopting_hce_ids)
+        contributions = participants.contribution_cents.copy()
+        contributions[adopting] += _simulated_contributions_cents(
+            participants.compensation_cents[adopting],
+            _contribution_rate_ratio(contribution_rate),
+        )
+        return _group_acp_scaled(
+            _sum_individual_acps_scaled(contributions[hce], participants.compensation_cents[hce]),
+            int(np.count_nonzero(hce)),
+        )
+
+    contributions = []
+    compensations = []
+    adopting_set = _as_id_set(adopting_hce_ids)
+    rate_ratio = _contribution_rate_ratio(contribution_rate)
 
     for p in participants:
         if p.get("is_hce", False):
-            match_cents = p.get("match_cents", 0)
-            after_tax_cents = p.get("after_tax_cents", 0)
+            contribution_cents = p.get("match_cents", 0) + p.get("after_tax_cents", 0)
             compensation_cents = p.get("compensation_cents", 0)
 
             # Add simulated contribution if this HCE is adopting
             internal_id = p.get("internal_id", "")
             if internal_id in adopting_set:
-                # Simulated contribution = compensation * contribution_rate / 100
-                simulated_cents = int(
-                    Decimal(compensation_cents) * contribution_rate / 100
+                contribution_cents += _simulated_contribution_cents(
+                    compensation_cents, rate_ratio
                 )
-                after_tax_cents += simulated_cents
 
-            acp = calculate_individual_acp(
-                match_cents=match_cents,
-                after_tax_cents=after_tax_cents,
-                compensation_cents=compensation_cents
-            )
-            hce_acps.append(acp)
+            contributions.append(contribution_cents)
+            compensations.append(compensation_cents)
 
-    return calculate_group_acp(hce_acps)
+    return _group_acp_scaled(
+        _sum_individual_acps_scaled(contributions, compensations), len(contributions)
+    )
 
 
 def calculate_margin(threshold: Decimal, hce_acp: Decimal) -> Decimal:
@@ -179,6 +372,30 @@ def calculate_margin(threshold: Decimal, hce_acp: Decimal) -> Decimal:
     return _quantize_percent(threshold - hce_acp)
 
 
+# Cap on the +2.0 limit, as a multiple of NHCE ACP (IRC 401(m)(2)(B)(ii))
+_ACP_CAP_MULTIPLIER = Decimal("2.0")
+
+
+def _acp_limits(nhce_acp: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+    """
+    Dual-test limits for an NHCE ACP.
+
+    Returns:
+        (limit_125, limit_2pct_uncapped, cap_2x, limit_2pct_capped, effective_limit)
+    """
+    limit_125 = _quantize_percent(nhce_acp * ACP_MULTIPLIER)
+    limit_2pct_uncapped = _quantize_percent(nhce_acp + ACP_ADDER)
+    cap_2x = _quantize_percent(nhce_acp * _ACP_CAP_MULTIPLIER)
+    limit_2pct_capped = min(limit_2pct_uncapped, cap_2x)
+    return (
+        limit_125,
+        limit_2pct_uncapped,
+        cap_2x,
+        limit_2pct_capped,
+        max(limit_125, limit_2pct_capped),
+    )
+
+
 def calculate_acp_limits(nhce_acp: Decimal) -> dict[str, Decimal]:
     """
     Calculate ACP permissible limits with 1.25x and 2%/2x cap rules.
@@ -187,11 +404,9 @@ def calculate_acp_limits(nhce_acp: Decimal) -> dict[str, Decimal]:
         Dictionary with limit_125, limit_2pct_uncapped, cap_2x,
         limit_2pct_capped, effective_limit.
     """
-    limit_125 = _quantize_percent(nhce_acp * ACP_MULTIPLIER)
-    limit_2pct_uncapped = _quantize_percent(nhce_acp + ACP_ADDER)
-    cap_2x = _quantize_percent(nhce_acp * Decimal("2.0"))
-    limit_2pct_capped = min(limit_2pct_uncapped, cap_2x)
-    effective_limit = max(limit_125, limit_2pct_capped)
+    limit_125, limit_2pct_uncapped, cap_2x, limit_2pct_capped, effective_limit = (
+        _acp_limits(nhce_acp)
+    )
     return {
         "limit_125": limit_125,
         "limit_2pct_uncapped": limit_2pct_uncapped,
@@ -201,6 +416,46 @@ def calculate_acp_limits(nhce_acp: Decimal) -> dict[str, Decimal]:
     }
 
 
+class ACPLimits(NamedTuple):
+    """Dual-test limits as floats, the form stored and exported with results."""
+    limit_125: float
+    limit_2pct_uncapped: float
+    cap_2x: float
+    limit_2pct_capped: float
+    effective_limit: float
+    binding_rule: Literal["1.25x", "2pct/2x"]
+
+
+@lru_cache(maxsize=1024)
+def acp_limits_for(nhce_acp: float) -> ACPLimits:
+    """
+    calculate_acp_limits for a stored (float) NHCE ACP, as an immutable record.
+
+    Every scenario of a grid shares its NHCE ACP, so results are cached by
+    value and filling in limits for a whole grid computes them once.
+    """
+    limit_125, limit_2pct_uncapped, cap_2x, limit_2pct_capped, effective_limit = (
+        _acp_limits(Decimal(str(nhce_acp)))
+    )
+    return ACPLimits(
+        float(limit_125),
+        float(limit_2pct_uncapped),
+        float(cap_2x),
+        float(limit_2pct_capped),
+        float(effective_limit),
+        "1.25x" if limit_125 >= limit_2pct_capped else "2pct/2x",
+    )
+
+
+# (limiting_test, limiting_bound, binding_rule), indexed by whether 1.25x wins
+_LIMITING_RULES: tuple[
+    tuple[Literal["1.25x", "+2.0"], LimitingBound, Literal["1.25x", "2pct/2x"]], ...
+] = (
+    ("+2.0", LimitingBound.ADDITIVE, "2pct/2x"),
+    ("1.25x", LimitingBound.MULTIPLE, "1.25x"),
+)
+
+
 def apply_acp_test(nhce_acp: Decimal, hce_acp: Decimal) -> ACPResult:
     """
     Apply the IRS ACP dual test.
@@ -218,72 +473,120 @@ def apply_acp_test(nhce_acp: Decimal, hce_acp: Decimal) -> ACPResult:
     Returns:
         ACPResult with threshold, margin, result, and limiting test
     """
-    limits = calculate_acp_limits(nhce_acp)
-    limit_125 = limits["limit_125"]
-    limit_2pct_capped = limits["limit_2pct_capped"]
-    effective_limit = limits["effective_limit"]
+    return ACPResult(*_acp_test_fields(nhce_acp, hce_acp))
+
+
+def apply_acp_test_into(result: ACPResult, nhce_acp: Decimal, hce_acp: Decimal) -> ACPResult:
+    """
+    Apply the IRS ACP dual test, overwriting an existing ACPResult.
+
+    Lets a sweep reuse one result holder instead of allocating one per
+    scenario; apply_acp_test returns a fresh ACPResult with the same values.
+
+    Returns:
+        result, updated in place
+    """
+    (
+        result.nhce_acp,
+        result.hce_acp,
+        result.limit_125,
+        result.limit_2pct_uncapped,
+        result.cap_2x,
+        result.limit_2pct_capped,
+        result.effective_limit,
+        result.threshold,
+        result.margin,
+        result.result,
+        result.limiting_test,
+        result.limiting_bound,
+        result.binding_rule,
+    ) = _acp_test_fields(nhce_acp, hce_acp)
+    return result
+
+
+def _acp_test_fields(nhce_acp: Decimal, hce_acp: Decimal) -> tuple:
+    """ACP dual-test outcome as a tuple in ACPResult field order."""
+    limit_125, limit_2pct_uncapped, cap_2x, limit_2pct_capped, effective_limit = (
+        _acp_limits(nhce_acp)
+    )
 
     # Use the more favorable (higher) threshold
     # T019: Update to use LimitingBound enum alongside legacy field
-    if limit_125 >= limit_2pct_capped:
-        limiting_test = "1.25x"
-        limiting_bound = LimitingBound.MULTIPLE
-        binding_rule: Literal["1.25x", "2pct/2x"] = "1.25x"
-    else:
-        limiting_test = "+2.0"
-        limiting_bound = LimitingBound.ADDITIVE
-        binding_rule = "2pct/2x"
+    limiting_test, limiting_bound, binding_rule = _LIMITING_RULES[limit_125 >= limit_2pct_capped]
 
     # Calculate margin and determine result
     margin = calculate_margin(effective_limit, hce_acp)
     result: Literal["PASS", "FAIL"] = "PASS" if hce_acp <= effective_limit else "FAIL"
 
-    return ACPResult(
-        nhce_acp=nhce_acp,
-        hce_acp=hce_acp,
-        limit_125=limit_125,
-        limit_2pct_uncapped=limits["limit_2pct_uncapped"],
-        cap_2x=limits["cap_2x"],
-        limit_2pct_capped=limit_2pct_capped,
-        effective_limit=effective_limit,
-        threshold=effective_limit,
-        margin=margin,
-        result=result,
-        limiting_test=limiting_test,
-        limiting_bound=limiting_bound,
-        binding_rule=binding_rule,
+    return (
+        nhce_acp,
+        hce_acp,
+        limit_125,
+        limit_2pct_uncapped,
+        cap_2x,
+        limit_2pct_capped,
+        effective_limit,
+        effective_limit,  # threshold
+        margin,
+        result,
+        limiting_test,
+        limiting_bound,
+        binding_rule,
     )
 
 
 # T020: Calculate total mega-backdoor amount across adopting HCEs
 def calculate_total_mega_backdoor(
-    participants: list[dict],
-    adopting_hce_ids: list[str],
+    participants: list[dict] | CensusColumns,
+    adopting_hce_ids: Iterable[str],
     contribution_rate: Decimal
 ) -> int:
     """
     Calculate total simulated mega-backdoor contributions in cents.
 
     Args:
-        participants: List of participant dictionaries
-        adopting_hce_ids: List of internal IDs of HCEs adopting mega-backdoor
+        participants: CensusColumns or list of participant dictionaries
+        adopting_hce_ids: Internal IDs of HCEs adopting mega-backdoor (list or set)
         contribution_rate: Mega-backdoor contribution rate as percentage (0-100)
 
     Returns:
         Total mega-backdoor amount in cents
     """
-    adopting_set = set(adopting_hce_ids)
+    if isinstance(participants, CensusColumns):
+        simulated = _simulated_contributions_cents(
+            participants.compensation_cents[participants.adopting_mask(adopting_hce_ids)],
+            _contribution_rate_ratio(contribution_rate),
+        )
+        return sum(simulated.tolist())
+
+    adopting_set = _as_id_set(adopting_hce_ids)
+    rate_ratio = _contribution_rate_ratio(contribution_rate)
     total_cents = 0
 
     for p in participants:
         if p.get("is_hce", False) and p.get("internal_id", "") in adopting_set:
-            compensation_cents = p.get("compensation_cents", 0)
-            simulated_cents = int(Decimal(compensation_cents) * contribution_rate / 100)
-            total_cents += simulated_cents
+            total_cents += _simulated_contribution_cents(
+                p.get("compensation_cents", 0), rate_ratio
+            )
 
     return total_cents
 
 
+# 415(c) limit assumed for plan years missing from plan_constants.yaml (2024 limit)
+_DEFAULT_415C_LIMIT_DOLLARS = 69000
+
+
+@lru_cache(maxsize=16)
+def _limit_415c_cents(plan_year: int) -> int:
+    """IRC 415(c) annual additions limit for a plan year, in cents."""
+    try:
+        limit_dollars = get_415c_limit(plan_year)
+    except ValueError:
+        # If year not configured, use a reasonable default
+        limit_dollars = _DEFAULT_415C_LIMIT_DOLLARS
+    return limit_dollars * 100
+
+
 def check_415c_limit(
     compensation_cents: int,
     deferral_cents: int,
@@ -312,13 +615,7 @@ def check_415c_limit(
             - limit: int (in cents)
             - warning_message: str or None
     """
-    try:
-        limit_dollars = get_415c_limit(plan_year)
-    except ValueError:
-        # If year not configured, use a reasonable default
-        limit_dollars = 69000  # 2024 limit as fallback
-
-    limit_cents = limit_dollars * 100
+    limit_cents = _limit_415c_cents(plan_year)
 
     total_contributions = (
         deferral_cents
@@ -333,7 +630,7 @@ def check_415c_limit(
     if exceeds:
         warning = (
             f"Total contributions (${total_contributions / 100:,.2f}) exceed "
-            f"IRC 415(c) limit (${limit_dollars:,}). "
+            f"IRC 415(c) limit (${limit_cents // 100:,}). "
             "Actual contributions would need adjustment."
         )
 
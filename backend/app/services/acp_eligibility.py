@@ -7,10 +7,14 @@ entry dates, and plan year boundaries.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Literal
 
+import numpy as np
+
 
 ACPExclusionReason = Literal["TERMINATED_BEFORE_ENTRY", "NOT_ELIGIBLE_DURING_YEAR"]
 
@@ -19,9 +23,13 @@ class ACPInclusionError(ValueError):
     """Raised when required data for ACP eligibility is missing or invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ACPInclusionResult:
-    """Computed ACP eligibility fields for a participant."""
+    """Computed ACP eligibility fields for a participant.
+
+    Slotted and immutable: one is built per participant, and memoized
+    results are shared between callers.
+    """
 
     eligibility_date: date
     entry_date: date
@@ -40,6 +48,48 @@ _DATE_FORMATS = (
     "%d-%m-%Y",
 )
 
+# A format can only match strings containing its separator, so each string is
+# tried against just those formats, in the same priority order as above
+_DATE_FORMATS_BY_SEPARATOR = {
+    separator: tuple(fmt for fmt in _DATE_FORMATS if separator in fmt)
+    for separator in ("/", "-")
+}
+
+# MM/DD/YYYY, the usual census export format; matched once and built from the
+# captured fields instead of walking the strptime formats
+_US_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value_str: str) -> date | None:
+    """Parse a stripped date string, returning None if no known format matches.
+
+    Census dates repeat heavily across rows, so results are memoized.
+    """
+    # Fast path for canonical YYYY-MM-DD, parsed in C without format lookup
+    if len(value_str) == 10 and value_str[4] == "-" and value_str[7] == "-":
+        try:
+            return date.fromisoformat(value_str)
+        except ValueError:
+            pass
+
+    us_match = _US_DATE_PATTERN.fullmatch(value_str)
+    if us_match is not None:
+        month, day, year = us_match.groups()
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            # Not a valid month-first date; DD/MM/YYYY is tried below
+            pass
+
+    separator = "/" if "/" in value_str else "-"
+    for fmt in _DATE_FORMATS_BY_SEPARATOR[separator]:
+        try:
+            return datetime.strptime(value_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
 
 def _parse_date_value(value: object, field_name: str) -> date:
     """Parse a date value into a date, raising ACPInclusionError on failure."""
@@ -57,13 +107,24 @@ def _parse_date_value(value: object, field_name: str) -> date:
     if not value_str:
         raise ACPInclusionError(f"Missing {field_name}")
 
-    for fmt in _DATE_FORMATS:
-        try:
-            return datetime.strptime(value_str, fmt).date()
-        except ValueError:
-            continue
+    parsed = _parse_date_string(value_str)
+    if parsed is None:
+        raise ACPInclusionError(f"Invalid {field_name} format: {value_str}")
+    return parsed
 
-    raise ACPInclusionError(f"Invalid {field_name} format: {value_str}")
+
+@dataclass(frozen=True)
+class ACPInclusionBatch:
+    """ACP eligibility fields for a whole census, one array element per participant.
+
+    Participants missing DOB or hire date have NaT eligibility and entry
+    dates and are treated as includable (fail open).
+    """
+
+    eligibility_date: np.ndarray  # datetime64[D]
+    entry_date: np.ndarray  # datetime64[D]
+    acp_includable: np.ndarray  # bool
+    acp_exclusion_reason: np.ndarray  # object: ACPExclusionReason | None
 
 
 def _add_years(value: date, years: int) -> date:
@@ -76,15 +137,43 @@ def _add_years(value: date, years: int) -> date:
 
 def _next_entry_date(eligibility_date: date) -> date:
     """Return the first Jan 1 or Jul 1 on or after eligibility_date."""
-    jan_1 = date(eligibility_date.year, 1, 1)
-    jul_1 = date(eligibility_date.year, 7, 1)
-    if eligibility_date <= jan_1:
-        return jan_1
-    if eligibility_date <= jul_1:
-        return jul_1
+    # Compare month/day directly so only the returned date is constructed
+    month, day = eligibility_date.month, eligibility_date.day
+    if month == 1 and day == 1:
+        return eligibility_date
+    if month < 7 or (month == 7 and day == 1):
+        return date(eligibility_date.year, 7, 1)
     return date(eligibility_date.year + 1, 1, 1)
 
 
+def _add_years_array(values: np.ndarray, years: int) -> np.ndarray:
+    """Vectorized _add_years over datetime64[D] values (Feb 29 maps to Feb 28)."""
+    year_start = values.astype("datetime64[Y]")
+    month_start = values.astype("datetime64[M]")
+    new_year = year_start.astype(np.int64) + 1970 + years
+    month_offset = (month_start - year_start.astype("datetime64[M]")).astype(np.int64)
+    day_offset = (values - month_start.astype("datetime64[D]")).astype(np.int64)
+
+    is_leap = (new_year % 4 == 0) & ((new_year % 100 != 0) | (new_year % 400 == 0))
+    day_offset = np.where((month_offset == 1) & (day_offset == 28) & ~is_leap, 27, day_offset)
+
+    shifted = (
+        (new_year - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+        + month_offset.astype("timedelta64[M]")
+    ).astype("datetime64[D]") + day_offset.astype("timedelta64[D]")
+    return np.where(np.isnat(values), np.datetime64("NaT", "D"), shifted)
+
+
+def _next_entry_date_array(eligibility_dates: np.ndarray) -> np.ndarray:
+    """Vectorized _next_entry_date over datetime64[D] values."""
+    year_start = eligibility_dates.astype("datetime64[Y]")
+    jan_1 = year_start.astype("datetime64[D]")
+    jul_1 = (year_start.astype("datetime64[M]") + np.timedelta64(6, "M")).astype("datetime64[D]")
+    next_jan_1 = (year_start + np.timedelta64(1, "Y")).astype("datetime64[D]")
+    entry = np.where(eligibility_dates <= jan_1, jan_1, np.where(eligibility_dates <= jul_1, jul_1, next_jan_1))
+    return np.where(np.isnat(eligibility_dates), np.datetime64("NaT", "D"), entry)
+
+
 def plan_year_bounds(plan_year: int) -> tuple[date, date]:
     """Return plan year start and end dates for a calendar-year plan."""
     return date(plan_year, 1, 1), date(plan_year, 12, 31)
@@ -142,6 +231,22 @@ def determine_acp_inclusion(
     if termination_date is not None and str(termination_date).strip():
         term_date = _parse_date_value(termination_date, "termination date")
 
+    return _determine_acp_inclusion(
+        dob_date, hire_date_value, term_date, plan_year_start, plan_year_end
+    )
+
+
+# Keyed on normalized dates; the same participant is re-evaluated for every
+# scenario run against a census
+@lru_cache(maxsize=65536)
+def _determine_acp_inclusion(
+    dob_date: date,
+    hire_date_value: date,
+    term_date: date | None,
+    plan_year_start: date,
+    plan_year_end: date,
+) -> ACPInclusionResult:
+    """Apply the inclusion rules to already-parsed dates."""
     age21_date = _add_years(dob_date, 21)
     yos1_date = _add_years(hire_date_value, 1)
     eligibility_date = max(age21_date, yos1_date)
@@ -168,3 +273,54 @@ def determine_acp_inclusion(
         acp_includable=acp_includable,
         acp_exclusion_reason=exclusion_reason,
     )
+
+
+def determine_acp_inclusion_batch(
+    dobs: object,
+    hire_dates: object,
+    termination_dates: object,
+    plan_year_start: date,
+    plan_year_end: date,
+) -> ACPInclusionBatch:
+    """
+    Vectorized determine_acp_inclusion over a whole census.
+
+    Applies the same rules as determine_acp_inclusion to every participant in
+    one pass of NumPy datetime64 arithmetic. Inputs are array-likes of equal
+    length holding dates, ISO date strings, datetime64 values or None; use
+    None (NaT) for missing dates. Rows missing DOB or hire date cannot be
+    evaluated and come back includable, as callers fail open for them.
+
+    Args:
+        dobs: Dates of birth
+        hire_dates: Hire dates
+        termination_dates: Termination dates (None where still employed)
+        plan_year_start: Start of plan year
+        plan_year_end: End of plan year
+
+    Returns:
+        ACPInclusionBatch with one element per participant
+    """
+    dob_dates = np.asarray(dobs, dtype="datetime64[D]")
+    hire = np.asarray(hire_dates, dtype="datetime64[D]")
+    term = np.asarray(termination_dates, dtype="datetime64[D]")
+    plan_end = np.datetime64(plan_year_end, "D")
+
+    eligibility_date = np.maximum(_add_years_array(dob_dates, 21), _add_years_array(hire, 1))
+    entry_date = _next_entry_date_array(eligibility_date)
+
+    missing = np.isnat(entry_date)
+    terminated_before_entry = ~np.isnat(term) & (term < entry_date)
+    not_eligible_during_year = entry_date > plan_end
+    acp_includable = missing | ~(terminated_before_entry | not_eligible_during_year)
+
+    acp_exclusion_reason = np.full(acp_includable.shape, None, dtype=object)
+    acp_exclusion_reason[~acp_includable & not_eligible_during_year] = "NOT_ELIGIBLE_DURING_YEAR"
+    acp_exclusion_reason[~acp_includable & terminated_before_entry] = "TERMINATED_BEFORE_ENTRY"
+
+    return ACPInclusionBatch(
+        eligibility_date=eligibility_date,
+        entry_date=entry_date,
+        acp_includable=acp_includable,
+        acp_exclusion_reason=acp_exclusion_reason,
+    )
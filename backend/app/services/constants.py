@@ -8,6 +8,7 @@ Percentage) testing per IRC Section 401(m).
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -55,6 +56,9 @@ def _load_plan_constants() -> dict[str, Any]:
 # Load constants at module level
 _PLAN_CONSTANTS = _load_plan_constants()
 
+# Per-year IRS limits, looked up once here rather than on every limit query
+_ANNUAL_LIMITS: dict[int, dict[str, int]] = _PLAN_CONSTANTS.get("annual_limits", {})
+
 
 def get_annual_limits(plan_year: int) -> dict[str, int]:
     """
@@ -74,16 +78,16 @@ def get_annual_limits(plan_year: int) -> dict[str, int]:
     Raises:
         ValueError: If plan year is not available in configuration
     """
-    annual_limits = _PLAN_CONSTANTS.get("annual_limits", {})
-    if plan_year not in annual_limits:
-        available_years = sorted(annual_limits.keys())
+    if plan_year not in _ANNUAL_LIMITS:
+        available_years = sorted(_ANNUAL_LIMITS.keys())
         raise ValueError(
             f"Plan year {plan_year} not configured. "
             f"Available years: {available_years}"
         )
-    return annual_limits[plan_year]
+    return _ANNUAL_LIMITS[plan_year]
 
 
+@lru_cache(maxsize=None)
 def get_415c_limit(plan_year: int) -> int:
     """
     Get the IRC Section 415(c) annual additions limit for a plan year.
@@ -100,6 +104,7 @@ def get_415c_limit(plan_year: int) -> int:
     return limits["annual_additions_limit_415c"]
 
 
+@lru_cache(maxsize=None)
 def get_compensation_limit(plan_year: int) -> int:
     """
     Get the IRC Section 401(a)(17) compensation limit for a plan year.
@@ -116,6 +121,7 @@ def get_compensation_limit(plan_year: int) -> int:
     return limits["compensation_limit_401a17"]
 
 
+@lru_cache(maxsize=None)
 def get_hce_threshold(plan_year: int) -> int:
     """
     Get the HCE (Highly Compensated Employee) threshold for a plan year.
@@ -132,6 +138,7 @@ def get_hce_threshold(plan_year: int) -> int:
     return limits["hce_threshold"]
 
 
+@lru_cache(maxsize=None)
 def get_elective_deferral_limit(plan_year: int) -> int:
     """
     Get the IRC Section 402(g) elective deferral limit for a plan year.
@@ -6,13 +6,20 @@ Provides CSV and PDF export functionality with full audit metadata.
 
 from __future__ import annotations
 
+import csv
 import io
 from datetime import datetime
-from decimal import Decimal
-from typing import Any
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator
 
+from app.services.acp_calculator import acp_limits_for
 from app.services.constants import SYSTEM_VERSION
-from app.services.acp_calculator import calculate_acp_limits
+
+# A PDF renderer: (census, results, grid_summary, excluded_count, hce_count,
+# nhce_count) -> PDF bytes
+PDFBackend = Callable[[dict, Iterable[dict], dict | None, int, int | None, int | None], bytes]
 
 
 def _ensure_limit_fields(result: dict) -> dict:
@@ -20,38 +27,72 @@ def _ensure_limit_fields(result: dict) -> dict:
     if nhce is None:
         return result
 
-    limits = calculate_acp_limits(Decimal(str(nhce)))
-    result.setdefault("limit_125", float(limits["limit_125"]))
-    result.setdefault("limit_2pct_uncapped", float(limits["limit_2pct_uncapped"]))
-    result.setdefault("cap_2x", float(limits["cap_2x"]))
-    result.setdefault("limit_2pct_capped", float(limits["limit_2pct_capped"]))
-    result.setdefault("effective_limit", float(limits["effective_limit"]))
-    result.setdefault("binding_rule", "1.25x" if limits["limit_125"] >= limits["limit_2pct_capped"] else "2pct/2x")
+    limits = acp_limits_for(nhce)
+    result.setdefault("limit_125", limits.limit_125)
+    result.setdefault("limit_2pct_uncapped", limits.limit_2pct_uncapped)
+    result.setdefault("cap_2x", limits.cap_2x)
+    result.setdefault("limit_2pct_capped", limits.limit_2pct_capped)
+    result.setdefault("effective_limit", limits.effective_limit)
+    result.setdefault("binding_rule", limits.binding_rule)
     result.setdefault("threshold", result.get("effective_limit"))
     return result
 
 
-def format_csv_export(
+# Data rows rendered per chunk when streaming CSV output
+CSV_EXPORT_CHUNK_ROWS = 256
+
+# Result rows shown in the PDF report; the rest are summarized in a note
+PDF_MAX_RESULT_ROWS = 100
+
+
+def _csv_row(r: dict) -> tuple:
+    """Format one result (with limit fields filled in) as the CSV export's column values."""
+    return (
+        f"{r['adoption_rate']:.1f}",
+        f"{r['contribution_rate']:.1f}",
+        f"{r['nhce_acp']:.2f}" if r.get("nhce_acp") is not None else "",
+        f"{r['hce_acp']:.2f}" if r.get("hce_acp") is not None else "",
+        f"{r['limit_125']:.2f}" if r.get("limit_125") is not None else "",
+        f"{r['limit_2pct_uncapped']:.2f}" if r.get("limit_2pct_uncapped") is not None else "",
+        f"{r['cap_2x']:.2f}" if r.get("cap_2x") is not None else "",
+        f"{r['limit_2pct_capped']:.2f}" if r.get("limit_2pct_capped") is not None else "",
+        f"{r['effective_limit']:.2f}" if r.get("effective_limit") is not None else "",
+        r.get("binding_rule", ""),
+        f"{r['threshold']:.2f}" if r.get("threshold") is not None else "",
+        f"{r['margin']:.2f}" if r.get("margin") is not None else "",
+        r.get("result", ""),
+        r.get("limiting_test", ""),
+        str(r.get("seed", "")),
+        r.get("run_timestamp", ""),
+    )
+
+
+def iter_csv_export(
     census: dict,
-    results: list[dict],
+    results: Iterable[dict],
     seed: int | None = None,
     included_hce_count: int | None = None,
     included_nhce_count: int | None = None,
     excluded_count: int | None = None,
-) -> str:
+) -> Iterator[str]:
     """
-    Format analysis results as CSV with audit metadata header.
+    Generate the CSV export in chunks, for streaming responses.
+
+    The metadata header and column row come first, then data rows in
+    blocks of CSV_EXPORT_CHUNK_ROWS. Results are consumed lazily, so a
+    generator of rows is never materialized. Joining the chunks gives
+    exactly format_csv_export's output.
 
     Args:
         census: Census metadata dictionary
-        results: List of analysis result dictionaries
+        results: Analysis result dictionaries, in output order
         seed: Optional seed value (for grid analysis)
         included_hce_count: Optional post-exclusion HCE count
         included_nhce_count: Optional post-exclusion NHCE count
         excluded_count: Optional number of excluded participants
 
-    Returns:
-        CSV string with header and data
+    Yields:
+        CSV text chunks
     """
     lines = []
 
@@ -97,54 +138,125 @@ def format_csv_export(
     ]
     lines.append(",".join(columns))
 
-    # Data rows
-    for r in results:
-        _ensure_limit_fields(r)
-        row = [
-            f"{r['adoption_rate']:.1f}",
-            f"{r['contribution_rate']:.1f}",
-            f"{r['nhce_acp']:.2f}" if r.get("nhce_acp") is not None else "",
-            f"{r['hce_acp']:.2f}" if r.get("hce_acp") is not None else "",
-            f"{r['limit_125']:.2f}" if r.get("limit_125") is not None else "",
-            f"{r['limit_2pct_uncapped']:.2f}" if r.get("limit_2pct_uncapped") is not None else "",
-            f"{r['cap_2x']:.2f}" if r.get("cap_2x") is not None else "",
-            f"{r['limit_2pct_capped']:.2f}" if r.get("limit_2pct_capped") is not None else "",
-            f"{r['effective_limit']:.2f}" if r.get("effective_limit") is not None else "",
-            r.get("binding_rule", ""),
-            f"{r['threshold']:.2f}" if r.get("threshold") is not None else "",
-            f"{r['margin']:.2f}" if r.get("margin") is not None else "",
-            r.get("result", ""),
-            r.get("limiting_test", ""),
-            str(r.get("seed", "")),
-            r.get("run_timestamp", ""),
-        ]
-        lines.append(",".join(row))
+    yield "\n".join(lines)
+
+    # Data rows go through csv.writer (C-level joining and quoting) one block at
+    # a time; each block is preceded by the separator so no trailing newline is
+    # emitted
+    results = iter(results)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    while True:
+        chunk = list(islice(results, CSV_EXPORT_CHUNK_ROWS))
+        if not chunk:
+            return
+        writer.writerows(map(_csv_row, map(_ensure_limit_fields, chunk)))
+        block = buffer.getvalue()
+        yield "\n" + block[:-1]
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def format_csv_export(
+    census: dict,
+    results: Iterable[dict],
+    seed: int | None = None,
+    included_hce_count: int | None = None,
+    included_nhce_count: int | None = None,
+    excluded_count: int | None = None,
+) -> str:
+    """
+    Format analysis results as CSV with audit metadata header.
 
-    return "\n".join(lines)
+    Args:
+        census: Census metadata dictionary
+        results: Analysis result dictionaries (any iterable; consumed once)
+        seed: Optional seed value (for grid analysis)
+        included_hce_count: Optional post-exclusion HCE count
+        included_nhce_count: Optional post-exclusion NHCE count
+        excluded_count: Optional number of excluded participants
+
+    Returns:
+        CSV string with header and data
+    """
+    return "".join(iter_csv_export(
+        census,
+        results,
+        seed,
+        included_hce_count=included_hce_count,
+        included_nhce_count=included_nhce_count,
+        excluded_count=excluded_count,
+    ))
+
+
+@lru_cache(maxsize=1)
+def _pdf_paragraph_styles() -> tuple[Any, Any, Any]:
+    """
+    Build the report's title, heading and body paragraph styles once.
+
+    getSampleStyleSheet() constructs a fresh stylesheet on every call, and
+    paragraphs only read their styles, so all reports share these.
+    """
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        textColor=HexColor('#1e40af'),  # blue-800
+        fontSize=20,
+        spaceAfter=12,
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        textColor=HexColor('#2563eb'),  # blue-600
+        fontSize=14,
+        spaceBefore=12,
+        spaceAfter=8,
+    )
+    return title_style, heading_style, styles["Normal"]
 
 
 def generate_pdf_report(
     census: dict,
-    results: list[dict],
+    results: Iterable[dict],
     grid_summary: dict | None = None,
     excluded_count: int = 0,
     hce_count: int | None = None,
     nhce_count: int | None = None,
+    *,
+    backend: PDFBackend | None = None,
 ) -> bytes:
     """
     Generate PDF report for analysis results.
 
     Args:
         census: Census metadata dictionary
-        results: List of analysis result dictionaries
+        results: Analysis result dictionaries (any iterable; consumed once)
         grid_summary: Optional grid analysis summary
         excluded_count: Number of participants excluded from ACP test
         hce_count: Optional post-exclusion HCE count (overrides census value)
         nhce_count: Optional post-exclusion NHCE count (overrides census value)
+        backend: Renderer to use instead of the module default (reportlab)
 
     Returns:
         PDF file bytes
     """
+    render = backend if backend is not None else _default_pdf_backend
+    return render(census, results, grid_summary, excluded_count, hce_count, nhce_count)
+
+
+def _render_pdf_reportlab(
+    census: dict,
+    results: Iterable[dict],
+    grid_summary: dict | None,
+    excluded_count: int,
+    hce_count: int | None,
+    nhce_count: int | None,
+) -> bytes:
+    """Render the PDF report with reportlab."""
     # Use provided post-exclusion counts or fall back to census values
     display_hce_count = hce_count if hce_count is not None else census['hce_count']
     display_nhce_count = nhce_count if nhce_count is not None else census['nhce_count']
@@ -152,7 +264,6 @@ def generate_pdf_report(
         from reportlab.lib import colors
         from reportlab.lib.colors import HexColor
         from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.lib.units import inch
         from reportlab.platypus import (
             SimpleDocTemplate,
@@ -167,7 +278,6 @@ def generate_pdf_report(
     # Define colors matching frontend theme
     BLUE_PRIMARY = HexColor('#2563eb')      # blue-600
     BLUE_LIGHT = HexColor('#dbeafe')        # blue-100
-    BLUE_DARK = HexColor('#1e40af')         # blue-800
     GREEN_PRIMARY = HexColor('#22c55e')     # green-500
     GREEN_LIGHT = HexColor('#dcfce7')       # green-100
     RED_PRIMARY = HexColor('#ef4444')       # red-500
@@ -189,23 +299,7 @@ def generate_pdf_report(
         bottomMargin=0.5 * inch,
     )
 
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        textColor=BLUE_DARK,
-        fontSize=20,
-        spaceAfter=12,
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        textColor=BLUE_PRIMARY,
-        fontSize=14,
-        spaceBefore=12,
-        spaceAfter=8,
-    )
-    normal_style = styles["Normal"]
+    title_style, heading_style, normal_style = _pdf_paragraph_styles()
 
     elements = []
 
@@ -312,12 +406,16 @@ def generate_pdf_report(
         "Result",
     ]
 
-    # Limit results for PDF (show first 100)
-    display_results = results[:100]
+    # Limit results for PDF (show first PDF_MAX_RESULT_ROWS); the rest are only
+    # counted, so a large grid is never materialized here
+    results = iter(results)
+    display_results = [
+        _ensure_limit_fields(r) for r in islice(results, PDF_MAX_RESULT_ROWS)
+    ]
+    total_results = len(display_results) + sum(1 for _ in results)
     table_data = [header]
 
     for r in display_results:
-        _ensure_limit_fields(r)
         row = [
             f"{r['adoption_rate']:.0f}",
             f"{r['contribution_rate']:.1f}",
@@ -363,10 +461,10 @@ def generate_pdf_report(
     results_table.setStyle(TableStyle(style_commands))
     elements.append(results_table)
 
-    if len(results) > 100:
+    if total_results > PDF_MAX_RESULT_ROWS:
         elements.append(Spacer(1, 6))
         elements.append(Paragraph(
-            f"<i>Note: Showing first 100 of {len(results)} results. See CSV export for complete data.</i>",
+            f"<i>Note: Showing first {PDF_MAX_RESULT_ROWS} of {total_results} results. See CSV export for complete data.</i>",
             normal_style
         ))
 
@@ -387,8 +485,8 @@ def generate_pdf_report(
     ]))
     elements.append(audit_table)
 
-    # Scenario compliance table (show all results)
-    if results:
+    # Scenario compliance table (same results as the main table)
+    if display_results:
         elements.append(Spacer(1, 12))
         elements.append(Paragraph("Scenario Compliance Metrics", heading_style))
         compliance_header = [
@@ -404,7 +502,6 @@ def generate_pdf_report(
         ]
         compliance_rows = [compliance_header]
         for r in display_results:
-            _ensure_limit_fields(r)
             compliance_rows.append([
                 f"{r['adoption_rate']:.0f}",
                 f"{r['contribution_rate']:.1f}",
@@ -442,6 +539,19 @@ def generate_pdf_report(
     return buffer.read()
 
 
+# Renderer used by generate_pdf_report when no backend is passed
+_default_pdf_backend: PDFBackend = _render_pdf_reportlab
+
+
+# Formula display templates, bound once so each result pays only for the format call
+_FORMULA_125X = "HCE ACP ({0:.2f}%) ≤ NHCE ACP ({1:.2f}%) × 1.25 = {2:.2f}%".format
+_FORMULA_PLUS2 = "HCE ACP ({0:.2f}%) ≤ min(NHCE ACP ({1:.2f}%) + 2.0%, 2× NHCE ACP) = {2:.2f}%".format
+_FORMULA_RESULT = "HCE ACP ({0:.2f}%) {1} Effective Limit ({2:.2f}%) → {3}".format
+_formula_fields = itemgetter(
+    "hce_acp", "nhce_acp", "limit_125", "limit_2pct_capped", "effective_limit", "result"
+)
+
+
 def add_formula_strings(result: dict) -> dict:
     """
     Add formula display strings to an analysis result.
@@ -453,17 +563,10 @@ def add_formula_strings(result: dict) -> dict:
         Result with added formula_125x and formula_plus2 fields
     """
     _ensure_limit_fields(result)
-    nhce = result["nhce_acp"]
-    hce = result["hce_acp"]
-
-    result["formula_125x"] = f"HCE ACP ({hce:.2f}%) ≤ NHCE ACP ({nhce:.2f}%) × 1.25 = {result['limit_125']:.2f}%"
-    result["formula_plus2"] = (
-        f"HCE ACP ({hce:.2f}%) ≤ min(NHCE ACP ({nhce:.2f}%) + 2.0%, 2× NHCE ACP) = "
-        f"{result['limit_2pct_capped']:.2f}%"
+    hce, nhce, limit_125, limit_2pct_capped, effective_limit, outcome = _formula_fields(result)
+    result["formula_125x"] = _FORMULA_125X(hce, nhce, limit_125)
+    result["formula_plus2"] = _FORMULA_PLUS2(hce, nhce, limit_2pct_capped)
+    result["formula_result"] = _FORMULA_RESULT(
+        hce, "≤" if outcome == "PASS" else ">", effective_limit, outcome
     )
-    result["formula_result"] = (
-        f"HCE ACP ({hce:.2f}%) {'≤' if result['result'] == 'PASS' else '>'} "
-        f"Effective Limit ({result['effective_limit']:.2f}%) → {result['result']}"
-    )
-
     return result
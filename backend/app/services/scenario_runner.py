@@ -8,8 +8,14 @@ seeded random HCE selection for reproducible results.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from decimal import Decimal
+from itertools import repeat
 from typing import Literal
 
 import numpy as np
@@ -17,6 +23,7 @@ import numpy as np
 logger = logging.getLogger("acp_analyzer.core.scenario")
 
 from app.services.acp_calculator import (
+    CensusColumns,
     calculate_nhce_acp,
     calculate_hce_acp,
     apply_acp_test,
@@ -281,15 +288,18 @@ def run_single_scenario_v2(
 
     # T055/T056: Select adopting HCEs (handles 0% and 100% correctly)
     adopting_hce_ids = select_adopting_hces(hce_ids, adoption_rate, seed)
+    # Hashed once; every calculation below only tests membership
+    adopting_set = frozenset(adopting_hce_ids)
 
     # Convert contribution rate to percentage for calculation (0.06 -> 6.0)
     contribution_pct = Decimal(str(contribution_rate * 100))
 
-    # Calculate ACPs
-    nhce_acp = calculate_nhce_acp(participants)
+    # Calculate ACPs over a columnar copy of the census, built once
+    columns = CensusColumns.from_dicts(participants)
+    nhce_acp = calculate_nhce_acp(columns)
     hce_acp = calculate_hce_acp(
-        participants=participants,
-        adopting_hce_ids=adopting_hce_ids,
+        participants=columns,
+        adopting_hce_ids=adopting_set,
         contribution_rate=contribution_pct
     )
 
@@ -307,8 +317,8 @@ def run_single_scenario_v2(
 
     # T025: Calculate total mega-backdoor amount
     total_mega_backdoor_cents = calculate_total_mega_backdoor(
-        participants=participants,
-        adopting_hce_ids=adopting_hce_ids,
+        participants=columns,
+        adopting_hce_ids=adopting_set,
         contribution_rate=contribution_pct
     )
     total_mega_backdoor_dollars = total_mega_backdoor_cents / 100.0
@@ -317,7 +327,6 @@ def run_single_scenario_v2(
     debug_details = None
     if include_debug:
         # Collect HCE contributions
-        adopting_set = set(adopting_hce_ids)
         hce_contributions = []
         hce_acp_sum = Decimal("0")
 
@@ -475,6 +484,93 @@ def run_grid_scenarios(
     return results
 
 
+# Grids below this many participant-scenario evaluations run in-process;
+# starting worker processes would cost more than it saves
+GRID_PARALLEL_MIN_WORK = 500_000
+
+# Worker pool shared by every large grid, created on first use
+_grid_executor: ProcessPoolExecutor | None = None
+_grid_executor_lock = threading.Lock()
+
+
+def _grid_mp_context() -> multiprocessing.context.BaseContext:
+    """Start grid workers from a forkserver where available, else by spawning.
+
+    Either way workers never fork the (threaded) API server process; Windows
+    has no forkserver.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _get_grid_executor() -> ProcessPoolExecutor:
+    """Return the shared grid worker pool, starting it on first use."""
+    global _grid_executor
+    with _grid_executor_lock:
+        if _grid_executor is None:
+            _grid_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=_grid_mp_context(),
+            )
+        return _grid_executor
+
+
+def shutdown_grid_executor() -> None:
+    """Stop the shared grid worker pool, if one was started."""
+    global _grid_executor
+    with _grid_executor_lock:
+        executor, _grid_executor = _grid_executor, None
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+
+
+def _run_grid_batch(
+    participants: list[dict],
+    cells: list[tuple[float, float, int, bool]],
+) -> list[ScenarioResultV2]:
+    """Run grid scenarios in order against one census."""
+    return [
+        run_single_scenario_v2(
+            participants=participants,
+            adoption_rate=adoption_rate,
+            contribution_rate=contribution_rate,
+            seed=seed,
+            include_debug=include_debug,
+        )
+        for adoption_rate, contribution_rate, seed, include_debug in cells
+    ]
+
+
+def _run_grid_cells(
+    participants: list[dict],
+    cells: list[tuple[float, float, int, bool]],
+) -> list[ScenarioResultV2]:
+    """Run grid scenarios in order, across worker processes when the grid is large.
+
+    Scenarios are independent and CPU-bound, so processes (not threads) give
+    the speedup. The grid is cut into one contiguous batch per worker, so the
+    census is sent to each worker once per request.
+    """
+    global _grid_executor
+    workers = min(len(cells), os.cpu_count() or 1)
+    if workers < 2 or len(participants) * len(cells) < GRID_PARALLEL_MIN_WORK:
+        return _run_grid_batch(participants, cells)
+
+    batch_size = -(-len(cells) // workers)
+    batches = [cells[i:i + batch_size] for i in range(0, len(cells), batch_size)]
+    executor = _get_grid_executor()
+    try:
+        results = list(executor.map(_run_grid_batch, repeat(participants), batches))
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next grid starts a fresh one
+        with _grid_executor_lock:
+            if _grid_executor is executor:
+                _grid_executor = None
+        raise
+    return [scenario for batch in results for scenario in batch]
+
+
 # T032-T033: V2 grid scenario runner returning GridResult model
 def run_grid_scenarios_v2(
     participants: list[dict],
@@ -506,19 +602,13 @@ def run_grid_scenarios_v2(
         len(contribution_rates)
     )
 
-    scenarios = []
-
     # FR-017: Same seed used for all scenarios in grid
-    for adoption_rate in adoption_rates:
-        for contribution_rate in contribution_rates:
-            result = run_single_scenario_v2(
-                participants=participants,
-                adoption_rate=adoption_rate,
-                contribution_rate=contribution_rate,
-                seed=seed,  # Same seed for all scenarios
-                include_debug=include_debug
-            )
-            scenarios.append(result)
+    cells = [
+        (adoption_rate, contribution_rate, seed, include_debug)
+        for adoption_rate in adoption_rates
+        for contribution_rate in contribution_rates
+    ]
+    scenarios = _run_grid_cells(participants, cells)
 
     # Compute summary
     summary = compute_grid_summary(scenarios, adoption_rates, contribution_rates)
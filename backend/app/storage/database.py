@@ -17,9 +17,22 @@ from app.services.constants import WORKSPACE_BASE_DIR, WORKSPACE_DB_FILENAME
 # Current schema version for migrations
 SCHEMA_VERSION = 1
 
+# Connection settings for file-backed databases. DuckDB always journals through
+# its own WAL (there is no journal_mode/synchronous PRAGMA); raising the
+# checkpoint threshold from the 16MiB default means a large census import is
+# checkpointed once at the end instead of repeatedly mid-import. New database
+# files use the v1.2.0 storage format, which is required for the zstd-compressed
+# JSON columns in SCHEMA_SQL (older formats store them uncompressed).
+DB_CONFIG = {
+    "checkpoint_threshold": "64MiB",
+    "storage_compatibility_version": "v1.2.0",
+}
+
 # DuckDB Schema Definition
 # Note: DuckDB enforces foreign keys by default, no PRAGMA needed
 # Note: DuckDB does NOT support ON DELETE CASCADE/SET NULL - delete dependent records manually
+# Note: DuckDB has no partial indexes, and UPDATEs of an indexed column on a row that is
+# referenced by a foreign key fail, so don't index mutable columns like import_log.deleted_at
 # Tables must be created in dependency order
 SCHEMA_SQL = """
 -- Schema version tracking for migrations
@@ -124,7 +137,7 @@ CREATE TABLE IF NOT EXISTS import_log (
     replaced_count INTEGER NOT NULL DEFAULT 0,
     skipped_count INTEGER NOT NULL DEFAULT 0,
     column_mapping_used VARCHAR NOT NULL,
-    detailed_results VARCHAR,
+    detailed_results VARCHAR USING COMPRESSION zstd,
     deleted_at TIMESTAMP
 );
 
@@ -143,9 +156,9 @@ CREATE TABLE IF NOT EXISTS import_session (
     file_size_bytes BIGINT,
     row_count INTEGER,
     headers VARCHAR,
-    column_mapping VARCHAR,
-    validation_results VARCHAR,
-    duplicate_resolution VARCHAR,
+    column_mapping VARCHAR USING COMPRESSION zstd,
+    validation_results VARCHAR USING COMPRESSION zstd,
+    duplicate_resolution VARCHAR USING COMPRESSION zstd,
     date_format VARCHAR,
     import_result_id VARCHAR REFERENCES import_log(id)
 );
@@ -186,6 +199,7 @@ CREATE TABLE IF NOT EXISTS validation_issue (
 -- Indexes for efficient queries
 CREATE INDEX IF NOT EXISTS idx_census_plan_year ON census(plan_year);
 CREATE INDEX IF NOT EXISTS idx_census_upload ON census(upload_timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_census_year_upload ON census(plan_year, upload_timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_census_client ON census(client_name);
 CREATE INDEX IF NOT EXISTS idx_participant_census ON participant(census_id);
 CREATE INDEX IF NOT EXISTS idx_participant_hce ON participant(census_id, is_hce);
@@ -193,16 +207,21 @@ CREATE INDEX IF NOT EXISTS idx_participant_ssn_hash ON participant(ssn_hash);
 CREATE INDEX IF NOT EXISTS idx_result_census ON analysis_result(census_id);
 CREATE INDEX IF NOT EXISTS idx_result_grid ON analysis_result(grid_analysis_id);
 CREATE INDEX IF NOT EXISTS idx_result_timestamp ON analysis_result(run_timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_result_census_grid ON analysis_result(census_id, grid_analysis_id, run_timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_grid_census ON grid_analysis(census_id);
 CREATE INDEX IF NOT EXISTS idx_import_metadata_census ON import_metadata(census_id);
 CREATE INDEX IF NOT EXISTS idx_import_session_expires ON import_session(expires_at);
 CREATE INDEX IF NOT EXISTS idx_import_session_user ON import_session(user_id);
+CREATE INDEX IF NOT EXISTS idx_import_session_user_expires ON import_session(user_id, expires_at);
 CREATE INDEX IF NOT EXISTS idx_import_session_workspace ON import_session(workspace_id);
 CREATE INDEX IF NOT EXISTS idx_mapping_profile_user ON mapping_profile(user_id);
 CREATE INDEX IF NOT EXISTS idx_mapping_profile_workspace ON mapping_profile(workspace_id);
+CREATE INDEX IF NOT EXISTS idx_mapping_profile_name_workspace ON mapping_profile(name, workspace_id);
 CREATE INDEX IF NOT EXISTS idx_validation_issue_session ON validation_issue(session_id);
 CREATE INDEX IF NOT EXISTS idx_validation_issue_severity ON validation_issue(session_id, severity);
+CREATE INDEX IF NOT EXISTS idx_validation_issue_session_row ON validation_issue(session_id, row_number, severity);
 CREATE INDEX IF NOT EXISTS idx_import_log_census ON import_log(census_id);
+CREATE INDEX IF NOT EXISTS idx_import_log_census_created ON import_log(census_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_import_log_created ON import_log(created_at DESC);
 """
 
@@ -241,8 +260,9 @@ def create_connection(db_path: Path) -> duckdb.DuckDBPyConnection:
         DatabaseError: If connection cannot be established
     """
     try:
-        conn = duckdb.connect(str(db_path))
-        return conn
+        if str(db_path) == ":memory:":
+            return duckdb.connect(":memory:")
+        return duckdb.connect(str(db_path), config=DB_CONFIG)
     except Exception as e:
         raise DatabaseError(f"Failed to connect to database at {db_path}: {e}")
 
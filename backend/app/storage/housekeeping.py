@@ -0,0 +1,99 @@
+"""
+Background housekeeping for workspace databases.
+
+Purging expired import sessions and checkpointing the WAL are not needed to
+answer any request, so routes schedule them here and return immediately. A
+single daemon thread works through the queue, at most once per workspace per
+HOUSEKEEPING_INTERVAL_SECONDS.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+
+import duckdb
+
+from app.storage.repository import ImportSessionRepository
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between housekeeping runs for the same workspace
+HOUSEKEEPING_INTERVAL_SECONDS = 300
+
+
+def run_housekeeping(conn: duckdb.DuckDBPyConnection) -> int:
+    """
+    Delete expired import sessions, then checkpoint the database.
+
+    Runs on its own cursor because DuckDB connections must not be shared
+    between threads.
+
+    Returns count of deleted sessions.
+    """
+    cursor = conn.cursor()
+    try:
+        deleted = ImportSessionRepository(cursor).delete_expired()
+        cursor.execute("CHECKPOINT")
+        return deleted
+    finally:
+        cursor.close()
+
+
+class Housekeeper:
+    """Queue of workspaces awaiting housekeeping, drained by a worker thread."""
+
+    def __init__(self, interval_seconds: float = HOUSEKEEPING_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._queue: queue.Queue[tuple[str, duckdb.DuckDBPyConnection] | None] = queue.Queue()
+        self._last_run: dict[str, float] = {}
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, workspace_id: str, conn: duckdb.DuckDBPyConnection) -> None:
+        """Queue housekeeping for a workspace unless it ran or is queued recently."""
+        with self._lock:
+            if workspace_id in self._pending:
+                return
+            last_run = self._last_run.get(workspace_id)
+            if last_run is not None and time.monotonic() - last_run < self.interval_seconds:
+                return
+            self._pending.add(workspace_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._work, name="db-housekeeping", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((workspace_id, conn))
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the worker thread after it finishes queued work."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _work(self) -> None:
+        while (item := self._queue.get()) is not None:
+            workspace_id, conn = item
+            try:
+                deleted = run_housekeeping(conn)
+                logger.debug(
+                    f"Housekeeping for workspace {workspace_id}: "
+                    f"deleted {deleted} expired import sessions"
+                )
+            except Exception:
+                logger.exception(f"Housekeeping failed for workspace {workspace_id}")
+            finally:
+                with self._lock:
+                    self._pending.discard(workspace_id)
+                    self._last_run[workspace_id] = time.monotonic()
+
+
+# Process-wide housekeeper used by the routes
+housekeeper = Housekeeper()
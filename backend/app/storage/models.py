@@ -7,25 +7,55 @@ Dataclass models representing census, participant, and analysis entities.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, date
 from typing import Literal, Any
 
+import orjson
+
 
 # Type alias for HCE determination mode
 HCEMode = Literal["explicit", "compensation_threshold"]
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO datetime string; memoized since rows often share timestamps."""
+    return datetime.fromisoformat(value)
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse datetime from various formats (string or datetime object)."""
-    if value is None:
-        return None
+    # DuckDB returns datetime objects directly, so check that first
     if isinstance(value, datetime):
         return value
+    if value is None:
+        return None
     if isinstance(value, str):
-        return datetime.fromisoformat(value)
+        return _parse_iso_datetime(value)
     raise ValueError(f"Cannot parse datetime from {type(value)}: {value}")
 
 
+def _dumps_json(value: Any) -> str:
+    """Serialize a JSON column value with orjson (stored as VARCHAR)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _dumps_json_optional(value: Any) -> str | None:
+    """Serialize a nullable JSON column; empty values are stored as NULL."""
+    return _dumps_json(value) if value else None
+
+
+def _loads_json(value: str | bytes) -> Any:
+    """Deserialize a JSON column value with orjson."""
+    return orjson.loads(value)
+
+
+def _loads_json_optional(value: str | bytes | None) -> Any:
+    """Deserialize a nullable JSON column; NULL and empty strings become None."""
+    return orjson.loads(value) if value else None
+
+
 def _parse_date(value: Any) -> date | None:
     """Parse date from various formats (string, date, or datetime object)."""
     if value is None:
@@ -39,7 +69,7 @@ def _parse_date(value: Any) -> date | None:
     raise ValueError(f"Cannot parse date from {type(value)}: {value}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Census:
     """
     A collection of participant records for a single plan.
@@ -68,24 +98,6 @@ class Census:
             return None
         return self.avg_compensation_cents / 100
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "client_name": self.client_name,
-            "plan_year": self.plan_year,
-            "hce_mode": self.hce_mode,
-            "upload_timestamp": self.upload_timestamp.isoformat(),
-            "participant_count": self.participant_count,
-            "hce_count": self.hce_count,
-            "nhce_count": self.nhce_count,
-            "avg_compensation_cents": self.avg_compensation_cents,
-            "avg_deferral_rate": self.avg_deferral_rate,
-            "salt": self.salt,
-            "version": self.version,
-        }
-
     @classmethod
     def from_row(cls, row: dict) -> "Census":
         """Create Census from database row."""
@@ -106,7 +118,7 @@ class Census:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     """
     An individual plan participant with ACP-relevant attributes.
@@ -143,28 +155,6 @@ class Participant:
         """Calculate after-tax contribution in cents."""
         return int(self.compensation_cents * self.after_tax_rate / 100)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "census_id": self.census_id,
-            "internal_id": self.internal_id,
-            "is_hce": 1 if self.is_hce else 0,
-            "compensation_cents": self.compensation_cents,
-            "deferral_rate": self.deferral_rate,
-            "match_rate": self.match_rate,
-            "after_tax_rate": self.after_tax_rate,
-            "dob": self.dob,  # DuckDB accepts date objects directly
-            "hire_date": self.hire_date,
-            "termination_date": self.termination_date,
-            "employee_pre_tax_cents": self.employee_pre_tax_cents,
-            "employee_after_tax_cents": self.employee_after_tax_cents,
-            "employee_roth_cents": self.employee_roth_cents,
-            "employer_match_cents": self.employer_match_cents,
-            "employer_non_elective_cents": self.employer_non_elective_cents,
-            "ssn_hash": self.ssn_hash,
-        }
-
     def to_calculation_dict(self) -> dict:
         """Convert to dictionary for ACP calculations."""
         return {
@@ -196,16 +186,16 @@ class Participant:
             dob=_parse_date(row.get("dob")),
             hire_date=_parse_date(row.get("hire_date")),
             termination_date=_parse_date(row.get("termination_date")),
-            employee_pre_tax_cents=row.get("employee_pre_tax_cents", 0) or 0,
-            employee_after_tax_cents=row.get("employee_after_tax_cents", 0) or 0,
-            employee_roth_cents=row.get("employee_roth_cents", 0) or 0,
-            employer_match_cents=row.get("employer_match_cents", 0) or 0,
-            employer_non_elective_cents=row.get("employer_non_elective_cents", 0) or 0,
+            employee_pre_tax_cents=row.get("employee_pre_tax_cents") or 0,
+            employee_after_tax_cents=row.get("employee_after_tax_cents") or 0,
+            employee_roth_cents=row.get("employee_roth_cents") or 0,
+            employer_match_cents=row.get("employer_match_cents") or 0,
+            employer_non_elective_cents=row.get("employer_non_elective_cents") or 0,
             ssn_hash=row.get("ssn_hash"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     The outcome of running one scenario against a census.
@@ -227,25 +217,6 @@ class AnalysisResult:
     run_timestamp: datetime
     version: str
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "census_id": self.census_id,
-            "grid_analysis_id": self.grid_analysis_id,
-            "adoption_rate": self.adoption_rate,
-            "contribution_rate": self.contribution_rate,
-            "seed": self.seed,
-            "nhce_acp": self.nhce_acp,
-            "hce_acp": self.hce_acp,
-            "threshold": self.threshold,
-            "margin": self.margin,
-            "result": self.result,
-            "limiting_test": self.limiting_test,
-            "run_timestamp": self.run_timestamp.isoformat(),
-            "version": self.version,
-        }
-
     @classmethod
     def from_row(cls, row: dict) -> "AnalysisResult":
         """Create AnalysisResult from database row."""
@@ -267,7 +238,7 @@ class AnalysisResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GridAnalysis:
     """
     A collection of analysis results across multiple scenarios.
@@ -288,37 +259,35 @@ class GridAnalysis:
         """Calculate total number of scenarios."""
         return len(self.adoption_rates) * len(self.contribution_rates)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        import json
-        return {
-            "id": self.id,
-            "census_id": self.census_id,
-            "name": self.name,
-            "created_timestamp": self.created_timestamp.isoformat(),
-            "seed": self.seed,
-            "adoption_rates": json.dumps(self.adoption_rates),
-            "contribution_rates": json.dumps(self.contribution_rates),
-            "version": self.version,
-        }
+    def to_db_tuple(self) -> tuple:
+        """Parameters for _INSERT_GRID_ANALYSIS_SQL, in column order."""
+        return (
+            self.id,
+            self.census_id,
+            self.name,
+            self.created_timestamp,
+            self.seed,
+            _dumps_json(self.adoption_rates),
+            _dumps_json(self.contribution_rates),
+            self.version,
+        )
 
     @classmethod
     def from_row(cls, row: dict) -> "GridAnalysis":
         """Create GridAnalysis from database row."""
-        import json
         return cls(
             id=row["id"],
             census_id=row["census_id"],
             name=row["name"],
             created_timestamp=_parse_datetime(row["created_timestamp"]),
             seed=row["seed"],
-            adoption_rates=json.loads(row["adoption_rates"]),
-            contribution_rates=json.loads(row["contribution_rates"]),
+            adoption_rates=_loads_json(row["adoption_rates"]),
+            contribution_rates=_loads_json(row["contribution_rates"]),
             version=row["version"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportMetadata:
     """
     Information about how a census was imported.
@@ -332,27 +301,25 @@ class ImportMetadata:
     row_count: int
     created_at: datetime
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        import json
-        return {
-            "id": self.id,
-            "census_id": self.census_id,
-            "source_filename": self.source_filename,
-            "column_mapping": json.dumps(self.column_mapping),
-            "row_count": self.row_count,
-            "created_at": self.created_at.isoformat(),
-        }
+    def to_db_tuple(self) -> tuple:
+        """Parameters for _INSERT_IMPORT_METADATA_SQL, in column order."""
+        return (
+            self.id,
+            self.census_id,
+            self.source_filename,
+            _dumps_json(self.column_mapping),
+            self.row_count,
+            self.created_at,
+        )
 
     @classmethod
     def from_row(cls, row: dict) -> "ImportMetadata":
         """Create ImportMetadata from database row."""
-        import json
         return cls(
             id=row["id"],
             census_id=row["census_id"],
             source_filename=row["source_filename"],
-            column_mapping=json.loads(row["column_mapping"]),
+            column_mapping=_loads_json(row["column_mapping"]),
             row_count=row["row_count"],
             created_at=_parse_datetime(row["created_at"]),
         )
@@ -368,7 +335,7 @@ Severity = Literal["error", "warning", "info"]
 DuplicateResolutionAction = Literal["replace", "skip"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportSession:
     """
     Represents an in-progress import wizard session.
@@ -394,33 +361,50 @@ class ImportSession:
     duplicate_resolution: dict[str, DuplicateResolutionAction] | None = None
     import_result_id: str | None = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        import json
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "workspace_id": self.workspace_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "expires_at": self.expires_at.isoformat(),
-            "current_step": self.current_step,
-            "file_reference": self.file_reference,
-            "original_filename": self.original_filename,
-            "file_size_bytes": self.file_size_bytes,
-            "row_count": self.row_count,
-            "headers": json.dumps(self.headers) if self.headers else None,
-            "column_mapping": json.dumps(self.column_mapping) if self.column_mapping else None,
-            "date_format": self.date_format,
-            "validation_results": json.dumps(self.validation_results) if self.validation_results else None,
-            "duplicate_resolution": json.dumps(self.duplicate_resolution) if self.duplicate_resolution else None,
-            "import_result_id": self.import_result_id,
-        }
+    def to_db_tuple(self) -> tuple:
+        """Parameters for _INSERT_IMPORT_SESSION_SQL, in column order."""
+        return (
+            self.id,
+            self.user_id,
+            self.created_at,
+            self.updated_at,
+            self.expires_at,
+            self.current_step,
+            self.file_reference,
+            self.original_filename,
+            self.file_size_bytes,
+            self.row_count,
+            _dumps_json_optional(self.headers),
+            _dumps_json_optional(self.column_mapping),
+            _dumps_json_optional(self.validation_results),
+            _dumps_json_optional(self.duplicate_resolution),
+            self.import_result_id,
+            self.workspace_id,
+            self.date_format,
+        )
+
+    def to_update_tuple(self) -> tuple:
+        """Parameters for _UPDATE_IMPORT_SESSION_SQL (mutable columns, then id)."""
+        return (
+            self.updated_at,
+            self.current_step,
+            self.file_reference,
+            self.original_filename,
+            self.file_size_bytes,
+            self.row_count,
+            _dumps_json_optional(self.headers),
+            _dumps_json_optional(self.column_mapping),
+            _dumps_json_optional(self.validation_results),
+            _dumps_json_optional(self.duplicate_resolution),
+            self.import_result_id,
+            self.workspace_id,
+            self.date_format,
+            self.id,
+        )
 
     @classmethod
     def from_row(cls, row: dict) -> "ImportSession":
         """Create ImportSession from database row."""
-        import json
         return cls(
             id=row["id"],
             user_id=row.get("user_id"),
@@ -433,16 +417,16 @@ class ImportSession:
             original_filename=row.get("original_filename"),
             file_size_bytes=row.get("file_size_bytes"),
             row_count=row.get("row_count"),
-            headers=json.loads(row["headers"]) if row.get("headers") else None,
-            column_mapping=json.loads(row["column_mapping"]) if row.get("column_mapping") else None,
+            headers=_loads_json_optional(row.get("headers")),
+            column_mapping=_loads_json_optional(row.get("column_mapping")),
             date_format=row.get("date_format"),
-            validation_results=json.loads(row["validation_results"]) if row.get("validation_results") else None,
-            duplicate_resolution=json.loads(row["duplicate_resolution"]) if row.get("duplicate_resolution") else None,
+            validation_results=_loads_json_optional(row.get("validation_results")),
+            duplicate_resolution=_loads_json_optional(row.get("duplicate_resolution")),
             import_result_id=row.get("import_result_id"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingProfile:
     """
     Saved column mapping configuration for reuse.
@@ -463,27 +447,39 @@ class MappingProfile:
     expected_headers: list[str] | None = None
     is_default: bool = False  # T005: Auto-apply on new imports
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        import json
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "workspace_id": self.workspace_id,
-            "name": self.name,
-            "description": self.description,
-            "date_format": self.date_format,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "column_mapping": json.dumps(self.column_mapping),
-            "expected_headers": json.dumps(self.expected_headers) if self.expected_headers else None,
-            "is_default": 1 if self.is_default else 0,
-        }
+    def to_db_tuple(self) -> tuple:
+        """Parameters for _INSERT_MAPPING_PROFILE_SQL, in column order."""
+        return (
+            self.id,
+            self.user_id,
+            self.name,
+            self.description,
+            self.created_at,
+            # A new profile's updated_at defaults to its creation time
+            self.updated_at or self.created_at,
+            _dumps_json(self.column_mapping),
+            _dumps_json_optional(self.expected_headers),
+            self.workspace_id,
+            self.date_format,
+            self.is_default,
+        )
+
+    def to_update_tuple(self) -> tuple:
+        """Parameters for _UPDATE_MAPPING_PROFILE_SQL (mutable columns, then id)."""
+        return (
+            self.name,
+            self.description,
+            self.updated_at,
+            _dumps_json(self.column_mapping),
+            _dumps_json_optional(self.expected_headers),
+            self.date_format,
+            self.is_default,
+            self.id,
+        )
 
     @classmethod
     def from_row(cls, row: dict) -> "MappingProfile":
         """Create MappingProfile from database row."""
-        import json
         return cls(
             id=row["id"],
             user_id=row.get("user_id"),
@@ -493,13 +489,13 @@ class MappingProfile:
             date_format=row.get("date_format"),
             created_at=_parse_datetime(row["created_at"]),
             updated_at=_parse_datetime(row.get("updated_at")),
-            column_mapping=json.loads(row["column_mapping"]),
-            expected_headers=json.loads(row["expected_headers"]) if row.get("expected_headers") else None,
-            is_default=bool(row.get("is_default", 0)),
+            column_mapping=_loads_json(row["column_mapping"]),
+            expected_headers=_loads_json_optional(row.get("expected_headers")),
+            is_default=row.get("is_default") is True,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """
     Individual data quality problem found during validation.
@@ -519,22 +515,6 @@ class ValidationIssue:
     raw_value: str | None = None
     related_row: int | None = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "row_number": self.row_number,
-            "field_name": self.field_name,
-            "source_column": self.source_column,
-            "severity": self.severity,
-            "issue_code": self.issue_code,
-            "message": self.message,
-            "suggestion": self.suggestion,
-            "raw_value": self.raw_value,
-            "related_row": self.related_row,
-        }
-
     @classmethod
     def from_row(cls, row: dict) -> "ValidationIssue":
         """Create ValidationIssue from database row."""
@@ -553,7 +533,7 @@ class ValidationIssue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportLog:
     """
     Completed import operation results and audit trail.
@@ -577,31 +557,44 @@ class ImportLog:
     detailed_results: list[dict] | None = None
     deleted_at: datetime | None = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for database storage."""
-        import json
-        return {
-            "id": self.id,
-            "session_id": self.session_id,
-            "census_id": self.census_id,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "original_filename": self.original_filename,
-            "total_rows": self.total_rows,
-            "imported_count": self.imported_count,
-            "rejected_count": self.rejected_count,
-            "warning_count": self.warning_count,
-            "replaced_count": self.replaced_count,
-            "skipped_count": self.skipped_count,
-            "column_mapping_used": json.dumps(self.column_mapping_used),
-            "detailed_results": json.dumps(self.detailed_results) if self.detailed_results else None,
-            "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
-        }
+    def to_db_tuple(self) -> tuple:
+        """Parameters for _INSERT_IMPORT_LOG_SQL, in column order."""
+        return (
+            self.id,
+            self.session_id,
+            self.census_id,
+            self.created_at,
+            self.completed_at,
+            self.original_filename,
+            self.total_rows,
+            self.imported_count,
+            self.rejected_count,
+            self.warning_count,
+            self.replaced_count,
+            self.skipped_count,
+            _dumps_json(self.column_mapping_used),
+            _dumps_json_optional(self.detailed_results),
+            self.deleted_at,
+        )
+
+    def to_update_tuple(self) -> tuple:
+        """Parameters for _UPDATE_IMPORT_LOG_SQL (mutable columns, then id)."""
+        return (
+            self.census_id,
+            self.completed_at,
+            self.imported_count,
+            self.rejected_count,
+            self.warning_count,
+            self.replaced_count,
+            self.skipped_count,
+            _dumps_json_optional(self.detailed_results),
+            self.deleted_at,
+            self.id,
+        )
 
     @classmethod
     def from_row(cls, row: dict) -> "ImportLog":
         """Create ImportLog from database row."""
-        import json
         return cls(
             id=row["id"],
             session_id=row.get("session_id"),
@@ -615,7 +608,7 @@ class ImportLog:
             warning_count=row.get("warning_count", 0),
             replaced_count=row.get("replaced_count", 0),
             skipped_count=row.get("skipped_count", 0),
-            column_mapping_used=json.loads(row["column_mapping_used"]),
-            detailed_results=json.loads(row["detailed_results"]) if row.get("detailed_results") else None,
+            column_mapping_used=_loads_json(row["column_mapping_used"]),
+            detailed_results=_loads_json_optional(row.get("detailed_results")),
             deleted_at=_parse_datetime(row.get("deleted_at")),
         )
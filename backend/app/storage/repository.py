@@ -6,10 +6,11 @@ Provides CRUD operations for census, participant, and analysis entities.
 
 from __future__ import annotations
 
-import json
+import os
 import uuid
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Final, Iterable, Iterator
 
 import duckdb
 import pandas as pd
@@ -27,6 +28,13 @@ from app.storage.models import (
     ValidationIssue,
     ImportLog,
 )
+from app.storage.utils import UnitOfWork, auto_commit
+
+# Rows per executemany call in bulk inserts
+BULK_INSERT_CHUNK_SIZE = 5000
+
+# Rows per fetchmany call when streaming query results
+FETCH_BATCH_SIZE = 1000
 
 
 def row_to_dict(cursor: duckdb.DuckDBPyRelation, row: tuple) -> dict[str, Any]:
@@ -51,6 +59,82 @@ def row_to_dict(cursor: duckdb.DuckDBPyRelation, row: tuple) -> dict[str, Any]:
     return dict(zip(columns, row))
 
 
+def iter_dicts(cursor: duckdb.DuckDBPyConnection) -> Iterator[dict[str, Any]]:
+    """
+    Stream the remaining rows of a cursor as dictionaries.
+
+    Rows are pulled with fetchmany() in FETCH_BATCH_SIZE batches, so a large
+    result is never materialized as one list of tuples, and the column names
+    are read from cursor.description once per result set.
+    """
+    rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+    if not rows:
+        return
+    columns = [col[0] for col in cursor.description]
+    while rows:
+        for row in rows:
+            yield dict(zip(columns, row, strict=True))
+        rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+
+
+def fetch_page(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    where_clause: str,
+    params: list,
+    order_by: str,
+    limit: int,
+    offset: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Fetch one page of rows together with the total match count.
+
+    Uses COUNT(*) OVER () so the page and the total come from a single
+    query instead of a separate COUNT(*) round trip. Only an empty page that
+    cannot prove the total is zero (offset past the end, or limit=0 for a
+    count-only call) falls back to a COUNT query.
+
+    Args:
+        conn: DuckDB connection
+        table: Table to select from
+        where_clause: "WHERE ..." clause or empty string
+        params: Parameters for the WHERE clause
+        order_by: ORDER BY expression
+        limit: Maximum rows to return
+        offset: Pagination offset
+
+    Returns:
+        Tuple of (row dicts, total count)
+    """
+    cursor = conn.execute(
+        f"""
+        SELECT *, COUNT(*) OVER () AS _total FROM {table} {where_clause}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+        """,
+        params + [limit, offset],
+    )
+    rows = cursor.fetchall()
+    if not rows:
+        if offset == 0 and limit > 0:
+            return [], 0
+        count_cursor = conn.execute(f"SELECT COUNT(*) FROM {table} {where_clause}", params)
+        return [], count_cursor.fetchone()[0]
+
+    # _total is the last selected column
+    columns = [col[0] for col in cursor.description][:-1]
+    return [dict(zip(columns, row[:-1], strict=True)) for row in rows], rows[0][-1]
+
+
+# INSERT statements live at module level so repeated saves reuse one SQL string
+_INSERT_CENSUS_SQL: Final[str] = """
+INSERT INTO census (id, name, client_name, plan_year, hce_mode, upload_timestamp,
+                    participant_count, hce_count, nhce_count,
+                    avg_compensation_cents, avg_deferral_rate, salt, version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class CensusRepository:
     """
     Repository for Census entity operations.
@@ -61,22 +145,18 @@ class CensusRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, census: Census) -> Census:
         """Save a census to the database."""
         self.conn.execute(
-            """
-            INSERT INTO census (id, name, client_name, plan_year, hce_mode, upload_timestamp,
-                              participant_count, hce_count, nhce_count,
-                              avg_compensation_cents, avg_deferral_rate, salt, version)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_CENSUS_SQL,
             (
                 census.id,
                 census.name,
                 census.client_name,
                 census.plan_year,
                 census.hce_mode,
-                census.upload_timestamp.isoformat(),
+                census.upload_timestamp,
                 census.participant_count,
                 census.hce_count,
                 census.nhce_count,
@@ -86,9 +166,9 @@ class CensusRepository:
                 census.version,
             ),
         )
-        self.conn.commit()
         return census
 
+    @auto_commit
     def update(self, census_id: str, name: str | None = None, client_name: str | None = None) -> Census | None:
         """
         Update census metadata (name, client_name only).
@@ -101,10 +181,6 @@ class CensusRepository:
         Returns:
             Updated Census or None if not found
         """
-        census = self.get(census_id)
-        if census is None:
-            return None
-
         updates = []
         params = []
 
@@ -117,25 +193,29 @@ class CensusRepository:
             params.append(client_name)
 
         if not updates:
-            return census
+            return self.get(census_id)
 
+        # UPDATE returns the affected row count, so a missing census needs no
+        # separate existence check. RETURNING * is not used because DuckDB
+        # rejects it on rows still referenced by participant foreign keys.
         params.append(census_id)
-        self.conn.execute(
+        cursor = self.conn.execute(
             f"UPDATE census SET {', '.join(updates)} WHERE id = ?",
             params,
         )
-        self.conn.commit()
+        updated = cursor.fetchone()[0]
+        if not updated:
+            return None
 
         return self.get(census_id)
 
     def has_analyses(self, census_id: str) -> bool:
         """Check if a census has associated analyses."""
         cursor = self.conn.execute(
-            "SELECT COUNT(*) FROM analysis_result WHERE census_id = ?",
+            "SELECT EXISTS(SELECT 1 FROM analysis_result WHERE census_id = ?)",
             (census_id,),
         )
-        count = cursor.fetchone()[0]
-        return count > 0
+        return cursor.fetchone()[0]
 
     def get(self, census_id: str) -> Census | None:
         """Get a census by ID."""
@@ -182,26 +262,14 @@ class CensusRepository:
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM census {where_clause}",
-            params,
-        )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM census {where_clause}
-            ORDER BY upload_timestamp DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+        rows, total = fetch_page(
+            self.conn, "census", where_clause, params,
+            order_by="upload_timestamp DESC", limit=limit, offset=offset,
         )
-
-        censuses = [Census.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        censuses = [Census.from_row(row) for row in rows]
         return censuses, total
 
+    @auto_commit
     def delete(self, census_id: str) -> bool:
         """
         Delete a census and all associated data.
@@ -209,14 +277,13 @@ class CensusRepository:
         Returns True if census was deleted, False if not found.
 
         Note: DuckDB doesn't support ON DELETE CASCADE, so we manually
-        delete dependent records in order.
+        delete dependent records in order. DuckDB also rejects deleting the
+        census in the same transaction that removed its participants, so call
+        this outside a UnitOfWork.
         """
-        # Check if exists
-        if self.get(census_id) is None:
-            return False
-
         # Delete dependent records first (DuckDB doesn't support CASCADE)
-        # Order matters due to FK constraints
+        # Order matters due to FK constraints. For an unknown census these
+        # statements match nothing and the final DELETE reports not found.
 
         # Delete analysis results (depends on census and grid_analysis)
         self.conn.execute("DELETE FROM analysis_result WHERE census_id = ?", (census_id,))
@@ -234,9 +301,21 @@ class CensusRepository:
         self.conn.execute("DELETE FROM participant WHERE census_id = ?", (census_id,))
 
         # Finally delete the census
-        self.conn.execute("DELETE FROM census WHERE id = ?", (census_id,))
-        self.conn.commit()
-        return True
+        cursor = self.conn.execute(
+            "DELETE FROM census WHERE id = ? RETURNING id",
+            (census_id,),
+        )
+        return cursor.fetchone() is not None
+
+
+_INSERT_PARTICIPANT_SQL: Final[str] = """
+INSERT INTO participant (id, census_id, internal_id, is_hce,
+                         compensation_cents, deferral_rate, match_rate, after_tax_rate,
+                         dob, hire_date, termination_date,
+                         employee_pre_tax_cents, employee_after_tax_cents, employee_roth_cents,
+                         employer_match_cents, employer_non_elective_cents, ssn_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class ParticipantRepository:
@@ -249,49 +328,48 @@ class ParticipantRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
-    def bulk_insert(self, participants: list[Participant]) -> int:
+    def bulk_insert(self, participants: Iterable[Participant]) -> int:
         """
         Insert multiple participants at once.
 
+        Rows are fed to executemany in chunks of BULK_INSERT_CHUNK_SIZE inside
+        a single transaction, so peak memory stays bounded and the whole batch
+        commits once. Inside an open UnitOfWork the rows join its transaction.
+
         Returns count of inserted records.
         """
-        if not participants:
-            return 0
+        rows = (
+            (
+                p.id,
+                p.census_id,
+                p.internal_id,
+                p.is_hce,  # DuckDB uses native BOOLEAN
+                p.compensation_cents,
+                p.deferral_rate,
+                p.match_rate,
+                p.after_tax_rate,
+                p.dob,
+                p.hire_date,
+                p.termination_date,
+                p.employee_pre_tax_cents,
+                p.employee_after_tax_cents,
+                p.employee_roth_cents,
+                p.employer_match_cents,
+                p.employer_non_elective_cents,
+                p.ssn_hash,
+            )
+            for p in participants
+        )
 
-        self.conn.executemany(
-            """
-            INSERT INTO participant (id, census_id, internal_id, is_hce,
-                                    compensation_cents, deferral_rate, match_rate, after_tax_rate,
-                                    dob, hire_date, termination_date,
-                                    employee_pre_tax_cents, employee_after_tax_cents, employee_roth_cents,
-                                    employer_match_cents, employer_non_elective_cents, ssn_hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    p.id,
-                    p.census_id,
-                    p.internal_id,
-                    p.is_hce,  # DuckDB uses native BOOLEAN
-                    p.compensation_cents,
-                    p.deferral_rate,
-                    p.match_rate,
-                    p.after_tax_rate,
-                    p.dob,
-                    p.hire_date,
-                    p.termination_date,
-                    p.employee_pre_tax_cents,
-                    p.employee_after_tax_cents,
-                    p.employee_roth_cents,
-                    p.employer_match_cents,
-                    p.employer_non_elective_cents,
-                    p.ssn_hash,
+        count = 0
+        with UnitOfWork(self.conn):
+            while chunk := list(islice(rows, BULK_INSERT_CHUNK_SIZE)):
+                self.conn.executemany(
+                    _INSERT_PARTICIPANT_SQL,
+                    chunk,
                 )
-                for p in participants
-            ],
-        )
-        self.conn.commit()
-        return len(participants)
+                count += len(chunk)
+        return count
 
     def get_by_census(self, census_id: str) -> list[Participant]:
         """Get all participants for a census."""
@@ -299,7 +377,7 @@ class ParticipantRepository:
             "SELECT * FROM participant WHERE census_id = ?",
             (census_id,),
         )
-        return [Participant.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        return [Participant.from_row(row) for row in iter_dicts(cursor)]
 
     def get_hces_by_census(self, census_id: str) -> list[Participant]:
         """Get HCE participants for a census."""
@@ -307,7 +385,7 @@ class ParticipantRepository:
             "SELECT * FROM participant WHERE census_id = ? AND is_hce = TRUE",
             (census_id,),
         )
-        return [Participant.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        return [Participant.from_row(row) for row in iter_dicts(cursor)]
 
     def get_nhces_by_census(self, census_id: str) -> list[Participant]:
         """Get NHCE participants for a census."""
@@ -315,7 +393,7 @@ class ParticipantRepository:
             "SELECT * FROM participant WHERE census_id = ? AND is_hce = FALSE",
             (census_id,),
         )
-        return [Participant.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        return [Participant.from_row(row) for row in iter_dicts(cursor)]
 
     def get_as_calculation_dicts(self, census_id: str) -> list[dict]:
         """
@@ -407,25 +485,19 @@ class ParticipantRepository:
 
         where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM participant {where_clause}",
-            params,
+        rows, total = fetch_page(
+            self.conn, "participant", where_clause, params,
+            order_by="internal_id", limit=limit, offset=offset,
         )
-        total = count_cursor.fetchone()[0]
+        participants = [Participant.from_row(row) for row in rows]
+        return participants, total
 
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM participant {where_clause}
-            ORDER BY internal_id
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
-        )
 
-        participants = [Participant.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
-        return participants, total
+_INSERT_IMPORT_METADATA_SQL: Final[str] = """
+INSERT INTO import_metadata (id, census_id, source_filename,
+                             column_mapping, row_count, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
 
 
 class ImportMetadataRepository:
@@ -438,24 +510,10 @@ class ImportMetadataRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, metadata: ImportMetadata) -> ImportMetadata:
         """Save import metadata to the database."""
-        self.conn.execute(
-            """
-            INSERT INTO import_metadata (id, census_id, source_filename,
-                                        column_mapping, row_count, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                metadata.id,
-                metadata.census_id,
-                metadata.source_filename,
-                json.dumps(metadata.column_mapping),
-                metadata.row_count,
-                metadata.created_at.isoformat(),
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_IMPORT_METADATA_SQL, metadata.to_db_tuple())
         return metadata
 
     def get_by_census(self, census_id: str) -> ImportMetadata | None:
@@ -470,6 +528,15 @@ class ImportMetadataRepository:
         return ImportMetadata.from_row(row_to_dict(cursor, row))
 
 
+_INSERT_ANALYSIS_RESULT_SQL: Final[str] = """
+INSERT INTO analysis_result (id, census_id, grid_analysis_id, adoption_rate,
+                             contribution_rate, seed, nhce_acp, hce_acp,
+                             threshold, margin, result, limiting_test,
+                             run_timestamp, version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class AnalysisResultRepository:
     """
     Repository for AnalysisResult entity operations.
@@ -480,16 +547,11 @@ class AnalysisResultRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, result: AnalysisResult) -> AnalysisResult:
         """Save an analysis result to the database."""
         self.conn.execute(
-            """
-            INSERT INTO analysis_result (id, census_id, grid_analysis_id, adoption_rate,
-                                        contribution_rate, seed, nhce_acp, hce_acp,
-                                        threshold, margin, result, limiting_test,
-                                        run_timestamp, version)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_ANALYSIS_RESULT_SQL,
             (
                 result.id,
                 result.census_id,
@@ -503,11 +565,10 @@ class AnalysisResultRepository:
                 result.margin,
                 result.result,
                 result.limiting_test,
-                result.run_timestamp.isoformat(),
+                result.run_timestamp,
                 result.version,
             ),
         )
-        self.conn.commit()
         return result
 
     def get(self, result_id: str) -> AnalysisResult | None:
@@ -543,14 +604,7 @@ class AnalysisResultRepository:
         else:
             where_clause = "WHERE census_id = ?"
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM analysis_result {where_clause}",
-            params,
-        )
-        total = count_cursor.fetchone()[0]
-
-        # Get results
+        # Results are not paginated, so the total is simply the row count
         cursor = self.conn.execute(
             f"""
             SELECT * FROM analysis_result {where_clause}
@@ -559,8 +613,15 @@ class AnalysisResultRepository:
             params,
         )
 
-        results = [AnalysisResult.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
-        return results, total
+        results = [AnalysisResult.from_row(row) for row in iter_dicts(cursor)]
+        return results, len(results)
+
+
+_INSERT_GRID_ANALYSIS_SQL: Final[str] = """
+INSERT INTO grid_analysis (id, census_id, name, created_timestamp,
+                           seed, adoption_rates, contribution_rates, version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class GridAnalysisRepository:
@@ -573,26 +634,10 @@ class GridAnalysisRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, grid: GridAnalysis) -> GridAnalysis:
         """Save a grid analysis to the database."""
-        self.conn.execute(
-            """
-            INSERT INTO grid_analysis (id, census_id, name, created_timestamp,
-                                       seed, adoption_rates, contribution_rates, version)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                grid.id,
-                grid.census_id,
-                grid.name,
-                grid.created_timestamp.isoformat(),
-                grid.seed,
-                json.dumps(grid.adoption_rates),
-                json.dumps(grid.contribution_rates),
-                grid.version,
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_GRID_ANALYSIS_SQL, grid.to_db_tuple())
         return grid
 
     def get(self, grid_id: str) -> GridAnalysis | None:
@@ -612,7 +657,7 @@ class GridAnalysisRepository:
             "SELECT * FROM grid_analysis WHERE census_id = ? ORDER BY created_timestamp DESC",
             (census_id,),
         )
-        return [GridAnalysis.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        return [GridAnalysis.from_row(row) for row in iter_dicts(cursor)]
 
 
 def create_census_from_dataframe(
@@ -637,11 +682,12 @@ def create_census_from_dataframe(
     Returns:
         Tuple of (Census, list of Participants)
     """
-    census_id = str(uuid.uuid4())
+    census_id, *participant_ids = _batch_uuids(len(df) + 1)
 
-    # Count HCEs and NHCEs
-    hce_count = int(df[df["is_hce"] == True].shape[0])
-    nhce_count = int(df[df["is_hce"] == False].shape[0])
+    # Count HCEs and NHCEs in one pass over a boolean array (reused below)
+    is_hce = df["is_hce"].to_numpy(dtype=bool)
+    hce_count = int(is_hce.sum())
+    nhce_count = int(is_hce.size - hce_count)
 
     # Calculate summary statistics
     avg_compensation_cents = None
@@ -669,41 +715,105 @@ def create_census_from_dataframe(
         version=SYSTEM_VERSION,
     )
 
-    participants = []
-    for _, row in df.iterrows():
-        # Extract date fields if present (may be None or NaN)
-        dob = row.get("dob") if "dob" in row.index else None
-        hire_date = row.get("hire_date") if "hire_date" in row.index else None
-        termination_date = row.get("termination_date") if "termination_date" in row.index else None
-
-        # Convert NaN to None for date fields
-        dob = None if pd.isna(dob) else str(dob)
-        hire_date = None if pd.isna(hire_date) else str(hire_date)
-        termination_date = None if pd.isna(termination_date) else str(termination_date)
-
-        participant = Participant(
-            id=str(uuid.uuid4()),
+    # Pull each column out once as an array instead of building a Series per
+    # row with iterrows(), which dominates import time on large censuses
+    internal_ids = df["internal_id"].to_numpy()
+    compensation_cents = df["compensation_cents"].to_numpy()
+    deferral_rates = df["deferral_rate"].to_numpy()
+    match_rates = df["match_rate"].to_numpy()
+    after_tax_rates = df["after_tax_rate"].to_numpy()
+    dobs = _optional_str_column(df, "dob")
+    hire_dates = _optional_str_column(df, "hire_date")
+    termination_dates = _optional_str_column(df, "termination_date")
+
+    participants = [
+        Participant(
+            id=participant_id,
             census_id=census_id,
-            internal_id=row["internal_id"],
-            is_hce=bool(row["is_hce"]),
-            compensation_cents=int(row["compensation_cents"]),
-            deferral_rate=float(row["deferral_rate"]),
-            match_rate=float(row["match_rate"]),
-            after_tax_rate=float(row["after_tax_rate"]),
+            internal_id=internal_id,
+            is_hce=bool(hce),
+            compensation_cents=int(comp),
+            deferral_rate=float(deferral),
+            match_rate=float(match),
+            after_tax_rate=float(after_tax),
             dob=dob,
             hire_date=hire_date,
             termination_date=termination_date,
         )
-        participants.append(participant)
+        for participant_id, internal_id, hce, comp, deferral, match, after_tax, dob, hire_date, termination_date in zip(
+            participant_ids,
+            internal_ids,
+            is_hce,
+            compensation_cents,
+            deferral_rates,
+            match_rates,
+            after_tax_rates,
+            dobs,
+            hire_dates,
+            termination_dates,
+            strict=True,
+        )
+    ]
 
     return census, participants
 
 
+def _batch_uuids(n: int) -> list[str]:
+    """
+    Generate n random (version 4) UUID strings from a single urandom call.
+
+    Equivalent to calling uuid.uuid4() n times, without a syscall per ID.
+    """
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _optional_str_column(df: pd.DataFrame, column: str) -> list[str | None]:
+    """
+    Extract an optional date column as strings, mapping NaN/None to None.
+
+    Returns a list of None when the column is absent.
+    """
+    if column not in df.columns:
+        return [None] * len(df)
+    present = df[column].notna().to_numpy()
+    # tolist() keeps pandas scalars (e.g. Timestamp) so str() matches row access
+    return [str(value) if ok else None for value, ok in zip(df[column].tolist(), present, strict=True)]
+
+
 # ============================================================================
 # CSV Import Wizard Repositories (Feature 003-csv-import-wizard)
 # ============================================================================
 
 
+_INSERT_IMPORT_SESSION_SQL: Final[str] = """
+INSERT INTO import_session (
+    id, user_id, created_at, updated_at, expires_at, current_step,
+    file_reference, original_filename, file_size_bytes, row_count,
+    headers, column_mapping, validation_results, duplicate_resolution,
+    import_result_id, workspace_id, date_format
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_IMPORT_SESSION_SQL: Final[str] = """
+UPDATE import_session SET
+    updated_at = ?,
+    current_step = ?,
+    file_reference = ?,
+    original_filename = ?,
+    file_size_bytes = ?,
+    row_count = ?,
+    headers = ?,
+    column_mapping = ?,
+    validation_results = ?,
+    duplicate_resolution = ?,
+    import_result_id = ?,
+    workspace_id = ?,
+    date_format = ?
+WHERE id = ?
+"""
+
+
 class ImportSessionRepository:
     """
     Repository for ImportSession entity operations.
@@ -714,81 +824,17 @@ class ImportSessionRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, session: ImportSession) -> ImportSession:
         """Save a new import session to the database."""
-        data = session.to_dict()
-        self.conn.execute(
-            """
-            INSERT INTO import_session (
-                id, user_id, created_at, updated_at, expires_at, current_step,
-                file_reference, original_filename, file_size_bytes, row_count,
-                headers, column_mapping, validation_results, duplicate_resolution,
-                import_result_id, workspace_id, date_format
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["user_id"],
-                data["created_at"],
-                data["updated_at"],
-                data["expires_at"],
-                data["current_step"],
-                data["file_reference"],
-                data["original_filename"],
-                data["file_size_bytes"],
-                data["row_count"],
-                data["headers"],
-                data["column_mapping"],
-                data["validation_results"],
-                data["duplicate_resolution"],
-                data["import_result_id"],
-                data.get("workspace_id"),
-                data.get("date_format"),
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_IMPORT_SESSION_SQL, session.to_db_tuple())
         return session
 
+    @auto_commit
     def update(self, session: ImportSession) -> ImportSession:
         """Update an existing import session."""
         session.updated_at = datetime.utcnow()
-        data = session.to_dict()
-        self.conn.execute(
-            """
-            UPDATE import_session SET
-                updated_at = ?,
-                current_step = ?,
-                file_reference = ?,
-                original_filename = ?,
-                file_size_bytes = ?,
-                row_count = ?,
-                headers = ?,
-                column_mapping = ?,
-                validation_results = ?,
-                duplicate_resolution = ?,
-                import_result_id = ?,
-                workspace_id = ?,
-                date_format = ?
-            WHERE id = ?
-            """,
-            (
-                data["updated_at"],
-                data["current_step"],
-                data["file_reference"],
-                data["original_filename"],
-                data["file_size_bytes"],
-                data["row_count"],
-                data["headers"],
-                data["column_mapping"],
-                data["validation_results"],
-                data["duplicate_resolution"],
-                data["import_result_id"],
-                data.get("workspace_id"),
-                data.get("date_format"),
-                data["id"],
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_UPDATE_IMPORT_SESSION_SQL, session.to_update_tuple())
         return session
 
     def get(self, session_id: str) -> ImportSession | None:
@@ -828,56 +874,80 @@ class ImportSessionRepository:
             params.append(user_id)
 
         if not include_expired:
-            conditions.append("expires_at > current_timestamp")
+            # Bound as a naive UTC value to match how expires_at is stored
+            conditions.append("expires_at > ?")
+            params.append(datetime.utcnow())
 
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM import_session {where_clause}",
-            params,
+        rows, total = fetch_page(
+            self.conn, "import_session", where_clause, params,
+            order_by="created_at DESC", limit=limit, offset=offset,
         )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM import_session {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
-        )
-
-        sessions = [ImportSession.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        sessions = [ImportSession.from_row(row) for row in rows]
         return sessions, total
 
+    @auto_commit
     def delete(self, session_id: str) -> bool:
         """
         Delete an import session.
 
         Returns True if session was deleted, False if not found.
         """
-        if self.get(session_id) is None:
-            return False
-
-        self.conn.execute("DELETE FROM import_session WHERE id = ?", (session_id,))
-        self.conn.commit()
-        return True
+        cursor = self.conn.execute(
+            "DELETE FROM import_session WHERE id = ? RETURNING id",
+            (session_id,),
+        )
+        return cursor.fetchone() is not None
 
     def delete_expired(self) -> int:
         """
-        Delete all expired sessions.
+        Delete all expired sessions together with their validation issues.
+
+        validation_issue has no FK to import_session (see SCHEMA_SQL), so the
+        orphaned issues are removed here in the same transaction. Normally run
+        off the request path by app.storage.housekeeping.
 
         Returns count of deleted sessions.
         """
-        cursor = self.conn.execute(
-            "DELETE FROM import_session WHERE expires_at <= current_timestamp"
-        )
-        self.conn.commit()
-        return cursor.rowcount
+        now = datetime.utcnow()
+        with UnitOfWork(self.conn):
+            self.conn.execute(
+                """
+                DELETE FROM validation_issue WHERE session_id IN (
+                    SELECT id FROM import_session WHERE expires_at <= ?
+                )
+                """,
+                (now,),
+            )
+            cursor = self.conn.execute(
+                "DELETE FROM import_session WHERE expires_at <= ?",
+                (now,),
+            )
+            # DuckDB reports the deleted row count as the statement result
+            return cursor.fetchone()[0]
+
+
+_INSERT_MAPPING_PROFILE_SQL: Final[str] = """
+INSERT INTO mapping_profile (
+    id, user_id, name, description, created_at, updated_at,
+    column_mapping, expected_headers, workspace_id, date_format, is_default
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_MAPPING_PROFILE_SQL: Final[str] = """
+UPDATE mapping_profile SET
+    name = ?,
+    description = ?,
+    updated_at = ?,
+    column_mapping = ?,
+    expected_headers = ?,
+    date_format = ?,
+    is_default = ?
+WHERE id = ?
+"""
 
 
 class MappingProfileRepository:
@@ -890,63 +960,17 @@ class MappingProfileRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, profile: MappingProfile) -> MappingProfile:
         """Save a new mapping profile to the database."""
-        data = profile.to_dict()
-        # Use created_at for updated_at if not set (new profile)
-        updated_at = data["updated_at"] or data["created_at"]
-        self.conn.execute(
-            """
-            INSERT INTO mapping_profile (
-                id, user_id, name, description, created_at, updated_at,
-                column_mapping, expected_headers, workspace_id, date_format, is_default
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["user_id"],
-                data["name"],
-                data["description"],
-                data["created_at"],
-                updated_at,
-                data["column_mapping"],
-                data["expected_headers"],
-                data.get("workspace_id"),
-                data.get("date_format"),
-                data.get("is_default", False),
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_MAPPING_PROFILE_SQL, profile.to_db_tuple())
         return profile
 
+    @auto_commit
     def update(self, profile: MappingProfile) -> MappingProfile:
         """Update an existing mapping profile."""
         profile.updated_at = datetime.utcnow()
-        data = profile.to_dict()
-        self.conn.execute(
-            """
-            UPDATE mapping_profile SET
-                name = ?,
-                description = ?,
-                updated_at = ?,
-                column_mapping = ?,
-                expected_headers = ?,
-                date_format = ?,
-                is_default = ?
-            WHERE id = ?
-            """,
-            (
-                data["name"],
-                data["description"],
-                data["updated_at"],
-                data["column_mapping"],
-                data["expected_headers"],
-                data.get("date_format"),
-                data.get("is_default", False),
-                data["id"],
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_UPDATE_MAPPING_PROFILE_SQL, profile.to_update_tuple())
         return profile
 
     def get(self, profile_id: str) -> MappingProfile | None:
@@ -1023,24 +1047,11 @@ class MappingProfileRepository:
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM mapping_profile {where_clause}",
-            params,
+        rows, total = fetch_page(
+            self.conn, "mapping_profile", where_clause, params,
+            order_by="name ASC", limit=limit, offset=offset,
         )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM mapping_profile {where_clause}
-            ORDER BY name ASC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
-        )
-
-        profiles = [MappingProfile.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        profiles = [MappingProfile.from_row(row) for row in rows]
         return profiles, total
 
     def list_by_workspace(
@@ -1062,39 +1073,33 @@ class MappingProfileRepository:
         Returns:
             Tuple of (profiles list, total count)
         """
-        # Get total count
-        count_cursor = self.conn.execute(
-            "SELECT COUNT(*) FROM mapping_profile WHERE workspace_id = ?",
-            (workspace_id,),
-        )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            """
-            SELECT * FROM mapping_profile
-            WHERE workspace_id = ?
-            ORDER BY is_default DESC, name ASC
-            LIMIT ? OFFSET ?
-            """,
-            (workspace_id, limit, offset),
+        rows, total = fetch_page(
+            self.conn, "mapping_profile", "WHERE workspace_id = ?", [workspace_id],
+            order_by="is_default DESC, name ASC", limit=limit, offset=offset,
         )
-
-        profiles = [MappingProfile.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        profiles = [MappingProfile.from_row(row) for row in rows]
         return profiles, total
 
+    @auto_commit
     def delete(self, profile_id: str) -> bool:
         """
         Delete a mapping profile.
 
         Returns True if profile was deleted, False if not found.
         """
-        if self.get(profile_id) is None:
-            return False
+        cursor = self.conn.execute(
+            "DELETE FROM mapping_profile WHERE id = ? RETURNING id",
+            (profile_id,),
+        )
+        return cursor.fetchone() is not None
+
 
-        self.conn.execute("DELETE FROM mapping_profile WHERE id = ?", (profile_id,))
-        self.conn.commit()
-        return True
+_INSERT_VALIDATION_ISSUE_SQL: Final[str] = """
+INSERT INTO validation_issue (
+    id, session_id, row_number, field_name, source_column,
+    severity, issue_code, message, suggestion, raw_value, related_row
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class ValidationIssueRepository:
@@ -1107,41 +1112,49 @@ class ValidationIssueRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
-    def bulk_insert(self, issues: list[ValidationIssue]) -> int:
+    def bulk(self) -> UnitOfWork:
+        """
+        Share one transaction across several bulk_insert() calls.
+
+        Commits when the block exits normally and rolls back on error.
+        """
+        return UnitOfWork(self.conn)
+
+    def bulk_insert(self, issues: Iterable[ValidationIssue]) -> int:
         """
         Insert multiple validation issues at once.
 
+        Rows are written in chunks of BULK_INSERT_CHUNK_SIZE within a single
+        transaction (the enclosing unit of work's, if any).
+
         Returns count of inserted records.
         """
-        if not issues:
-            return 0
+        rows = (
+            (
+                i.id,
+                i.session_id,
+                i.row_number,
+                i.field_name,
+                i.source_column,
+                i.severity,
+                i.issue_code,
+                i.message,
+                i.suggestion,
+                i.raw_value,
+                i.related_row,
+            )
+            for i in issues
+        )
 
-        self.conn.executemany(
-            """
-            INSERT INTO validation_issue (
-                id, session_id, row_number, field_name, source_column,
-                severity, issue_code, message, suggestion, raw_value, related_row
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    i.id,
-                    i.session_id,
-                    i.row_number,
-                    i.field_name,
-                    i.source_column,
-                    i.severity,
-                    i.issue_code,
-                    i.message,
-                    i.suggestion,
-                    i.raw_value,
-                    i.related_row,
+        count = 0
+        with UnitOfWork(self.conn):
+            while chunk := list(islice(rows, BULK_INSERT_CHUNK_SIZE)):
+                self.conn.executemany(
+                    _INSERT_VALIDATION_ISSUE_SQL,
+                    chunk,
                 )
-                for i in issues
-            ],
-        )
-        self.conn.commit()
-        return len(issues)
+                count += len(chunk)
+        return count
 
     def get_by_session(
         self,
@@ -1170,24 +1183,11 @@ class ValidationIssueRepository:
 
         where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM validation_issue {where_clause}",
-            params,
-        )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM validation_issue {where_clause}
-            ORDER BY row_number ASC, severity DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+        rows, total = fetch_page(
+            self.conn, "validation_issue", where_clause, params,
+            order_by="row_number ASC, severity DESC", limit=limit, offset=offset,
         )
-
-        issues = [ValidationIssue.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        issues = [ValidationIssue.from_row(row) for row in rows]
         return issues, total
 
     def get_summary(self, session_id: str) -> dict[str, int]:
@@ -1198,21 +1198,19 @@ class ValidationIssueRepository:
         """
         cursor = self.conn.execute(
             """
-            SELECT severity, COUNT(*) as count
+            SELECT
+                COUNT(*) FILTER (WHERE severity = 'error'),
+                COUNT(*) FILTER (WHERE severity = 'warning'),
+                COUNT(*) FILTER (WHERE severity = 'info')
             FROM validation_issue
             WHERE session_id = ?
-            GROUP BY severity
             """,
             (session_id,),
         )
+        error, warning, info = cursor.fetchone()
+        return {"error": error, "warning": warning, "info": info}
 
-        result = {"error": 0, "warning": 0, "info": 0}
-        for row in cursor.fetchall():
-            # Row is tuple (severity, count)
-            result[row[0]] = row[1]
-
-        return result
-
+    @auto_commit
     def delete_by_session(self, session_id: str) -> int:
         """
         Delete all validation issues for a session.
@@ -1223,8 +1221,32 @@ class ValidationIssueRepository:
             "DELETE FROM validation_issue WHERE session_id = ?",
             (session_id,),
         )
-        self.conn.commit()
-        return cursor.rowcount
+        # DuckDB reports the deleted row count as the statement result
+        return cursor.fetchone()[0]
+
+
+_INSERT_IMPORT_LOG_SQL: Final[str] = """
+INSERT INTO import_log (
+    id, session_id, census_id, created_at, completed_at,
+    original_filename, total_rows, imported_count, rejected_count,
+    warning_count, replaced_count, skipped_count,
+    column_mapping_used, detailed_results, deleted_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_IMPORT_LOG_SQL: Final[str] = """
+UPDATE import_log SET
+    census_id = ?,
+    completed_at = ?,
+    imported_count = ?,
+    rejected_count = ?,
+    warning_count = ?,
+    replaced_count = ?,
+    skipped_count = ?,
+    detailed_results = ?,
+    deleted_at = ?
+WHERE id = ?
+"""
 
 
 class ImportLogRepository:
@@ -1237,70 +1259,16 @@ class ImportLogRepository:
     def __init__(self, conn: duckdb.DuckDBPyConnection):
         self.conn = conn
 
+    @auto_commit
     def save(self, log: ImportLog) -> ImportLog:
         """Save a new import log to the database."""
-        data = log.to_dict()
-        self.conn.execute(
-            """
-            INSERT INTO import_log (
-                id, session_id, census_id, created_at, completed_at,
-                original_filename, total_rows, imported_count, rejected_count,
-                warning_count, replaced_count, skipped_count,
-                column_mapping_used, detailed_results, deleted_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["id"],
-                data["session_id"],
-                data["census_id"],
-                data["created_at"],
-                data["completed_at"],
-                data["original_filename"],
-                data["total_rows"],
-                data["imported_count"],
-                data["rejected_count"],
-                data["warning_count"],
-                data["replaced_count"],
-                data["skipped_count"],
-                data["column_mapping_used"],
-                data["detailed_results"],
-                data["deleted_at"],
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_INSERT_IMPORT_LOG_SQL, log.to_db_tuple())
         return log
 
+    @auto_commit
     def update(self, log: ImportLog) -> ImportLog:
         """Update an existing import log."""
-        data = log.to_dict()
-        self.conn.execute(
-            """
-            UPDATE import_log SET
-                census_id = ?,
-                completed_at = ?,
-                imported_count = ?,
-                rejected_count = ?,
-                warning_count = ?,
-                replaced_count = ?,
-                skipped_count = ?,
-                detailed_results = ?,
-                deleted_at = ?
-            WHERE id = ?
-            """,
-            (
-                data["census_id"],
-                data["completed_at"],
-                data["imported_count"],
-                data["rejected_count"],
-                data["warning_count"],
-                data["replaced_count"],
-                data["skipped_count"],
-                data["detailed_results"],
-                data["deleted_at"],
-                data["id"],
-            ),
-        )
-        self.conn.commit()
+        self.conn.execute(_UPDATE_IMPORT_LOG_SQL, log.to_update_tuple())
         return log
 
     def get(self, log_id: str) -> ImportLog | None:
@@ -1346,36 +1314,25 @@ class ImportLogRepository:
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
 
-        # Get total count
-        count_cursor = self.conn.execute(
-            f"SELECT COUNT(*) FROM import_log {where_clause}",
-            params,
-        )
-        total = count_cursor.fetchone()[0]
-
-        # Get paginated results
-        cursor = self.conn.execute(
-            f"""
-            SELECT * FROM import_log {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+        rows, total = fetch_page(
+            self.conn, "import_log", where_clause, params,
+            order_by="created_at DESC", limit=limit, offset=offset,
         )
-
-        logs = [ImportLog.from_row(row_to_dict(cursor, row)) for row in cursor.fetchall()]
+        logs = [ImportLog.from_row(row) for row in rows]
         return logs, total
 
+    @auto_commit
     def soft_delete(self, log_id: str) -> bool:
         """
         Soft delete an import log.
 
         Returns True if log was deleted, False if not found.
         """
-        log = self.get(log_id)
-        if log is None:
-            return False
-
-        log.deleted_at = datetime.utcnow()
-        self.update(log)
-        return True
+        # Plain UPDATE: DuckDB rejects UPDATE ... RETURNING on rows referenced
+        # by a foreign key (import_session.import_result_id), so use the
+        # affected-row count it returns instead.
+        cursor = self.conn.execute(
+            "UPDATE import_log SET deleted_at = ? WHERE id = ? AND deleted_at IS NULL",
+            (datetime.utcnow(), log_id),
+        )
+        return cursor.fetchone()[0] > 0
@@ -1,24 +1,88 @@
-"""Storage utilities for atomic file operations."""
+"""Storage utilities for atomic file operations and database transactions."""
 
 from __future__ import annotations
 
 import os
 import tempfile
+from functools import wraps
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Iterable, Iterator, TypeVar, Union
+from weakref import WeakKeyDictionary
 
+import duckdb
 
-def atomic_write(file_path: Union[str, Path], content: str) -> None:
-    """
-    Write content to a file atomically using temp file + rename pattern.
+F = TypeVar("F", bound=Callable[..., Any])
 
-    This ensures that readers never see a partially written file.
+BytesLike = Union[bytes, bytearray, memoryview]
 
-    Args:
-        file_path: Path to the target file
-        content: Content to write
+# Files at least this large are dropped from the page cache once on disk
+FADVISE_DONTNEED_THRESHOLD = 1 << 20
+
+# Upper bound on buffers per writev() call (POSIX guarantees at least 1024)
+_IOV_MAX = 1024
+
+# Nesting depth of open UnitOfWork blocks per connection
+_open_units: WeakKeyDictionary[duckdb.DuckDBPyConnection, int] = WeakKeyDictionary()
+
+
+# fdatasync skips the metadata flush where the platform offers it (not macOS)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory so a rename inside it survives a crash (POSIX only)."""
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, chunks: list[memoryview]) -> None:
+    """Write every chunk to fd, using vectored writes where available."""
+    writev = getattr(os, "writev", None)
+    i = 0
+    while i < len(chunks):
+        if writev is not None:
+            written = writev(fd, chunks[i:i + _IOV_MAX])
+        else:
+            written = os.write(fd, chunks[i])
+        # Skip the chunks that went out whole, then trim a partial one
+        while i < len(chunks) and written >= len(chunks[i]):
+            written -= len(chunks[i])
+            i += 1
+        if written:
+            chunks[i] = chunks[i][written:]
+
+
+def _iter_chunk_batches(
+    content: Union[str, BytesLike, Iterable[BytesLike]],
+) -> Iterator[list[memoryview]]:
+    """Split content into lists of non-empty byte views, at most _IOV_MAX per list."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        content = (content,)
+    batch: list[memoryview] = []
+    for chunk in content:
+        view = memoryview(chunk).cast("B")
+        if view:
+            batch.append(view)
+        if len(batch) == _IOV_MAX:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _write_temp_file(file_path: Path, content: Union[str, BytesLike, Iterable[BytesLike]]) -> str:
+    """Write content durably to a temp file next to file_path and return its path.
+
+    Iterable content is consumed as it is written, so a generator of chunks
+    never needs to be held in memory as a whole.
     """
-    file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to temp file in the same directory (ensures same filesystem for rename)
@@ -29,13 +93,132 @@ def atomic_write(file_path: Union[str, Path], content: str) -> None:
     )
 
     try:
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
+        try:
+            # Write the bytes straight to the fd (no text wrapper)
+            size = 0
+            for batch in _iter_chunk_batches(content):
+                size += sum(len(view) for view in batch)
+                _write_all(fd, batch)
+            _fdatasync(fd)
+            # Large files are written once and rarely re-read right away
+            if size >= FADVISE_DONTNEED_THRESHOLD and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except Exception:
+        os.unlink(temp_path)
+        raise
+
+    return temp_path
+
 
-        # Atomic rename
-        os.replace(temp_path, file_path)
+def atomic_write(
+    file_path: Union[str, Path],
+    content: Union[str, BytesLike, Iterable[BytesLike]],
+) -> None:
+    """
+    Write content to a file atomically using temp file + rename pattern.
+
+    This ensures that readers never see a partially written file. The data
+    is flushed to disk before the rename and the parent directory afterwards,
+    so after a crash the file holds either the old or the new content.
+
+    Args:
+        file_path: Path to the target file
+        content: Text (encoded as UTF-8), bytes-like data written as-is,
+            or an iterable of bytes-like chunks written in order
+    """
+    atomic_write_many([(file_path, content)])
+
+
+def atomic_write_many(
+    files: Iterable[tuple[Union[str, Path], Union[str, BytesLike, Iterable[BytesLike]]]],
+) -> None:
+    """
+    Atomically write several files, sharing the flush of their directories.
+
+    Every temp file is written and flushed before any rename happens, then
+    the files are renamed into place in the given order and each distinct
+    parent directory is flushed once. Each file is replaced atomically on its
+    own; the batch as a whole is not.
+
+    Args:
+        files: (file_path, content) pairs, with content as for atomic_write
+    """
+    staged: list[tuple[str, Path]] = []
+    renamed = 0
+    try:
+        for file_path, content in files:
+            file_path = Path(file_path)
+            staged.append((_write_temp_file(file_path, content), file_path))
+
+        # Atomic renames
+        for temp_path, file_path in staged:
+            os.replace(temp_path, file_path)
+            renamed += 1
     except Exception:
-        # Clean up temp file on error
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+        # Clean up temp files that were not renamed
+        for temp_path, _ in staged[renamed:]:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
         raise
+
+    for directory in dict.fromkeys(file_path.parent for _, file_path in staged):
+        _fsync_directory(directory)
+
+
+class UnitOfWork:
+    """
+    Run several repository writes on one connection as a single transaction.
+
+    Repository methods decorated with @auto_commit skip their own commit while
+    a unit of work is open on their connection. The outermost block commits
+    once on exit, or rolls back if the block raises; nested blocks join it.
+
+    Example:
+        with UnitOfWork(conn):
+            issue_repo.delete_by_session(session_id)
+            issue_repo.bulk_insert(issues)
+            session_repo.update(session)
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection):
+        self.conn = conn
+
+    def __enter__(self) -> duckdb.DuckDBPyConnection:
+        depth = _open_units.get(self.conn, 0)
+        if depth == 0:
+            self.conn.begin()
+        _open_units[self.conn] = depth + 1
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        depth = _open_units.pop(self.conn) - 1
+        if depth:
+            _open_units[self.conn] = depth
+        elif exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+
+
+def in_unit_of_work(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Check whether a UnitOfWork currently owns the connection's transaction."""
+    return conn in _open_units
+
+
+def auto_commit(method: F) -> F:
+    """
+    Commit after a repository write unless a UnitOfWork is open.
+
+    The decorated method's instance must expose the connection as self.conn.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if not in_unit_of_work(self.conn):
+            self.conn.commit()
+        return result
+
+    return wrapper  # type: ignore[return-value]
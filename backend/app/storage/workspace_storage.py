@@ -2,18 +2,136 @@
 
 from __future__ import annotations
 
-import json
 import os
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional, TypeVar, Union
 from uuid import UUID
 
+import orjson
+from pydantic import BaseModel
+
 from app.models.census import CensusSummary
 from app.models.run import Run, RunStatus
 from app.models.workspace import Workspace, WorkspaceCreate, WorkspaceDetail, WorkspaceUpdate
-from app.storage.utils import atomic_write
+from app.storage.utils import atomic_write, atomic_write_many
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Directory mtimes newer than this are too fresh to validate a cached aggregate
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Read size used when copying a census stream to disk
+CENSUS_COPY_CHUNK_SIZE = 1 << 20
+
+# Parsed metadata files keyed by path, validated against (st_ino, st_mtime_ns,
+# st_size). Writes are atomic renames, so the inode changes on every rewrite even
+# when the size matches and the mtime lands in the same clock tick.
+# Bounded LRU shared by every WorkspaceStorage in the process.
+MODEL_CACHE_MAX_ENTRIES = 4096
+_model_cache: OrderedDict[Path, tuple[tuple[int, int, int], BaseModel]] = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+# Listings with at least this many entries load their files on a shared thread
+# pool so that cold-cache reads overlap; smaller listings stay sequential.
+PARALLEL_LOAD_THRESHOLD = 8
+_load_pool: Optional[ThreadPoolExecutor] = None
+_load_pool_lock = threading.Lock()
+
+
+def _get_load_pool() -> ThreadPoolExecutor:
+    """Get the process-wide pool used to load metadata files."""
+    global _load_pool
+    with _load_pool_lock:
+        if _load_pool is None:
+            _load_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="workspace-load",
+            )
+        return _load_pool
+
+
+def _store_model_cache(path: Path, st: os.stat_result, model: BaseModel) -> None:
+    """Cache a model for path as of the given stat, evicting the least recently used."""
+    with _model_cache_lock:
+        _model_cache[path] = ((st.st_ino, st.st_mtime_ns, st.st_size), model)
+        _model_cache.move_to_end(path)
+        while len(_model_cache) > MODEL_CACHE_MAX_ENTRIES:
+            _model_cache.popitem(last=False)
+
+
+def _load_model_cached(
+    path: Path, model: type[ModelT], skip_invalid: bool = True
+) -> Optional[ModelT]:
+    """Load a JSON metadata file as a model, reusing the parse while it is unchanged.
+
+    Returns None if the file is missing. An unparsable file also gives None
+    when skip_invalid is set and raises otherwise. A copy of the cached model
+    is returned so callers can mutate it freely.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        if skip_invalid:
+            return None
+        raise
+
+    with _model_cache_lock:
+        cached = _model_cache.get(path)
+        if cached is not None and cached[0] == (st.st_ino, st.st_mtime_ns, st.st_size):
+            _model_cache.move_to_end(path)
+            return cached[1].model_copy()
+
+    try:
+        # Parse and validate in one pass over the raw bytes
+        parsed = model.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        if skip_invalid:
+            return None
+        raise
+
+    _store_model_cache(path, st, parsed)
+    return parsed.model_copy()
+
+
+def _seed_model_cache(path: Path, model: BaseModel) -> None:
+    """Cache a model just written to path so the next read skips the disk."""
+    try:
+        st = path.stat()
+    except OSError:
+        _invalidate_model_cache(path)
+        return
+    _store_model_cache(path, st, model.model_copy())
+
+
+def _json_option(option: int = 0) -> int:
+    """orjson options for stored files; set ACP_PRETTY_JSON=1 to indent them for debugging."""
+    if os.environ.get("ACP_PRETTY_JSON", "").lower() in ("1", "true", "yes"):
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def _dump_model(model: BaseModel) -> bytes:
+    """Serialize a model for storage with orjson."""
+    return orjson.dumps(model.model_dump(mode="json"), option=_json_option())
+
+
+def _invalidate_model_cache(path: Path) -> None:
+    """Drop a cached file, or every cached file beneath a directory."""
+    with _model_cache_lock:
+        _model_cache.pop(path, None)
+        stale = [cached for cached in _model_cache if path in cached.parents]
+        for cached in stale:
+            del _model_cache[cached]
 
 
 def get_workspace_base_dir() -> Path:
@@ -33,10 +151,18 @@ class WorkspaceStorage:
         """
         self.base_dir = base_dir or get_workspace_base_dir()
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Memoized workspace and runs directories; every other path hangs off these
+        self._workspace_dirs: dict[UUID, Path] = {}
+        self._runs_dirs: dict[UUID, Path] = {}
+        # Run counts per workspace, valid while the runs directory mtime is unchanged
+        self._run_counts: dict[UUID, tuple[int, int]] = {}
 
     def _workspace_dir(self, workspace_id: UUID) -> Path:
         """Get directory path for a workspace."""
-        return self.base_dir / str(workspace_id)
+        path = self._workspace_dirs.get(workspace_id)
+        if path is None:
+            path = self._workspace_dirs[workspace_id] = self.base_dir / str(workspace_id)
+        return path
 
     def _workspace_file(self, workspace_id: UUID) -> Path:
         """Get path to workspace.json file."""
@@ -52,7 +178,10 @@ class WorkspaceStorage:
 
     def _runs_dir(self, workspace_id: UUID) -> Path:
         """Get path to runs directory."""
-        return self._workspace_dir(workspace_id) / "runs"
+        path = self._runs_dirs.get(workspace_id)
+        if path is None:
+            path = self._runs_dirs[workspace_id] = self._workspace_dir(workspace_id) / "runs"
+        return path
 
     def _run_dir(self, workspace_id: UUID, run_id: UUID) -> Path:
         """Get directory path for a specific run."""
@@ -68,22 +197,27 @@ class WorkspaceStorage:
 
     # --- Workspace CRUD ---
 
+    def _scan_models(self, directory: Path, filename: str, model: type[ModelT]) -> list[ModelT]:
+        """Load `filename` from every subdirectory of `directory`, skipping invalid ones.
+
+        Uses os.scandir so directory entries come with their file type from
+        readdir; the only per-entry syscall is the stat done by the model cache.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                paths = [Path(entry.path, filename) for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+
+        if len(paths) >= PARALLEL_LOAD_THRESHOLD:
+            loaded = _get_load_pool().map(lambda path: _load_model_cached(path, model), paths)
+        else:
+            loaded = (_load_model_cached(path, model) for path in paths)
+        return [m for m in loaded if m is not None]
+
     def list_workspaces(self) -> list[Workspace]:
         """List all workspaces sorted by updated_at descending."""
-        workspaces = []
-        if not self.base_dir.exists():
-            return workspaces
-
-        for entry in self.base_dir.iterdir():
-            if entry.is_dir():
-                workspace_file = entry / "workspace.json"
-                if workspace_file.exists():
-                    try:
-                        data = json.loads(workspace_file.read_text())
-                        workspaces.append(Workspace(**data))
-                    except (json.JSONDecodeError, ValueError):
-                        # Skip invalid workspace files
-                        continue
+        workspaces = self._scan_models(self.base_dir, "workspace.json", Workspace)
 
         # Sort by updated_at descending
         workspaces.sort(key=lambda w: w.updated_at, reverse=True)
@@ -103,21 +237,15 @@ class WorkspaceStorage:
         (workspace_dir / "runs").mkdir(exist_ok=True)
 
         # Save workspace metadata
-        atomic_write(
-            self._workspace_file(workspace.id),
-            workspace.model_dump_json(indent=2)
-        )
+        workspace_file = self._workspace_file(workspace.id)
+        atomic_write(workspace_file, _dump_model(workspace))
+        _seed_model_cache(workspace_file, workspace)
 
         return workspace
 
     def get_workspace(self, workspace_id: UUID) -> Optional[Workspace]:
         """Get a workspace by ID."""
-        workspace_file = self._workspace_file(workspace_id)
-        if not workspace_file.exists():
-            return None
-
-        data = json.loads(workspace_file.read_text())
-        return Workspace(**data)
+        return _load_model_cached(self._workspace_file(workspace_id), Workspace, skip_invalid=False)
 
     def get_workspace_detail(self, workspace_id: UUID) -> Optional[WorkspaceDetail]:
         """Get workspace with computed fields (has_census, run_count)."""
@@ -136,9 +264,9 @@ class WorkspaceStorage:
             has_census = total > 0
         except Exception:
             # Fall back to file-based check
-            has_census = self._census_file(workspace_id).exists()
+            has_census, _ = self.census_status(workspace_id)
 
-        run_count = len(self.list_runs(workspace_id))
+        run_count = self._count_runs(workspace_id)
 
         return WorkspaceDetail(
             **workspace.model_dump(),
@@ -148,21 +276,19 @@ class WorkspaceStorage:
 
     def update_workspace(self, workspace_id: UUID, data: WorkspaceUpdate) -> Optional[Workspace]:
         """Update a workspace."""
-        workspace = self.get_workspace(workspace_id)
+        workspace_file = self._workspace_file(workspace_id)
+        # Reuse the cached parse when the file is unchanged since it was last read
+        workspace = _load_model_cached(workspace_file, Workspace)
         if not workspace:
             return None
 
-        # Update only provided fields
+        # Update only provided fields; WorkspaceUpdate has already validated them
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(workspace, field, value)
-
-        workspace.updated_at = datetime.utcnow()
+        update_data["updated_at"] = datetime.utcnow()
+        workspace = workspace.model_copy(update=update_data)
 
-        atomic_write(
-            self._workspace_file(workspace_id),
-            workspace.model_dump_json(indent=2)
-        )
+        atomic_write(workspace_file, _dump_model(workspace))
+        _seed_model_cache(workspace_file, workspace)
 
         return workspace
 
@@ -173,6 +299,10 @@ class WorkspaceStorage:
             return False
 
         shutil.rmtree(workspace_dir)
+        _invalidate_model_cache(workspace_dir)
+        self._workspace_dirs.pop(workspace_id, None)
+        self._runs_dirs.pop(workspace_id, None)
+        self._run_counts.pop(workspace_id, None)
         return True
 
     # --- Census operations ---
@@ -183,14 +313,13 @@ class WorkspaceStorage:
         if not summary_file.exists():
             return None
 
-        data = json.loads(summary_file.read_text())
-        return CensusSummary(**data)
+        return CensusSummary.model_validate_json(summary_file.read_bytes())
 
     def save_census_summary(self, workspace_id: UUID, summary: CensusSummary) -> None:
         """Save census summary."""
         summary_file = self._census_summary_file(workspace_id)
         summary_file.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write(summary_file, summary.model_dump_json(indent=2))
+        atomic_write(summary_file, _dump_model(summary))
 
     def save_census_data(self, workspace_id: UUID, csv_content: str) -> None:
         """Save census CSV data."""
@@ -198,64 +327,95 @@ class WorkspaceStorage:
         census_file.parent.mkdir(parents=True, exist_ok=True)
         atomic_write(census_file, csv_content)
 
+    def save_census_data_stream(
+        self, workspace_id: UUID, src: Union[BinaryIO, Iterable[bytes]]
+    ) -> None:
+        """Save census CSV data from a binary file object or an iterable of byte chunks.
+
+        The data is copied to disk as it is read, so the whole CSV is never
+        held in memory.
+        """
+        if hasattr(src, "read"):
+            src = iter(partial(src.read, CENSUS_COPY_CHUNK_SIZE), b"")
+        census_file = self._census_file(workspace_id)
+        census_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(census_file, src)
+
+    def census_status(self, workspace_id: UUID) -> tuple[bool, Path]:
+        """Get whether the census CSV file exists, together with its path, in one stat."""
+        census_file = self._census_file(workspace_id)
+        return census_file.exists(), census_file
+
     def get_census_data_path(self, workspace_id: UUID) -> Optional[Path]:
         """Get path to census CSV file if it exists."""
-        census_file = self._census_file(workspace_id)
-        if census_file.exists():
-            return census_file
-        return None
+        exists, census_file = self.census_status(workspace_id)
+        return census_file if exists else None
 
     # --- Run operations ---
 
     def list_runs(self, workspace_id: UUID) -> list[Run]:
         """List all runs for a workspace."""
-        runs_dir = self._runs_dir(workspace_id)
-        runs = []
-
-        if not runs_dir.exists():
-            return runs
-
-        for entry in runs_dir.iterdir():
-            if entry.is_dir():
-                metadata_file = entry / "run_metadata.json"
-                if metadata_file.exists():
-                    try:
-                        data = json.loads(metadata_file.read_text())
-                        runs.append(Run(**data))
-                    except (json.JSONDecodeError, ValueError):
-                        continue
+        runs = self._scan_models(self._runs_dir(workspace_id), "run_metadata.json", Run)
 
         # Sort by created_at descending
         runs.sort(key=lambda r: r.created_at, reverse=True)
         return runs
 
+    def _count_runs(self, workspace_id: UUID) -> int:
+        """Count runs with metadata without parsing any of it.
+
+        The count is kept per workspace and reused until the runs directory's
+        mtime changes (a run directory added or removed outside this process)
+        or this storage creates or deletes a run.
+        """
+        runs_dir = self._runs_dir(workspace_id)
+        try:
+            mtime_ns = runs_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+        cached = self._run_counts.get(workspace_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            with os.scandir(runs_dir) as entries:
+                count = sum(
+                    1
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and os.path.isfile(os.path.join(entry.path, "run_metadata.json"))
+                )
+        except FileNotFoundError:
+            return 0
+        # Like git's racy-index rule: a directory changed within the timestamp
+        # granularity window could change again without its mtime moving
+        if time.time_ns() - mtime_ns > RACY_MTIME_WINDOW_NS:
+            self._run_counts[workspace_id] = (mtime_ns, count)
+        return count
+
     def create_run(self, workspace_id: UUID, run: Run) -> Run:
         """Create a new run."""
-        run_dir = self._run_dir(workspace_id, run.id)
-        run_dir.mkdir(parents=True, exist_ok=True)
+        metadata_file = self._run_metadata_file(workspace_id, run.id)
+        metadata_file.parent.mkdir(parents=True, exist_ok=True)
 
-        atomic_write(
-            self._run_metadata_file(workspace_id, run.id),
-            run.model_dump_json(indent=2)
-        )
+        atomic_write(metadata_file, _dump_model(run))
+        _seed_model_cache(metadata_file, run)
+        self._run_counts.pop(workspace_id, None)
 
         return run
 
     def get_run(self, workspace_id: UUID, run_id: UUID) -> Optional[Run]:
         """Get a run by ID."""
-        metadata_file = self._run_metadata_file(workspace_id, run_id)
-        if not metadata_file.exists():
-            return None
-
-        data = json.loads(metadata_file.read_text())
-        return Run(**data)
+        return _load_model_cached(
+            self._run_metadata_file(workspace_id, run_id), Run, skip_invalid=False
+        )
 
     def update_run(self, workspace_id: UUID, run: Run) -> None:
         """Update run metadata."""
-        atomic_write(
-            self._run_metadata_file(workspace_id, run.id),
-            run.model_dump_json(indent=2)
-        )
+        metadata_file = self._run_metadata_file(workspace_id, run.id)
+        atomic_write(metadata_file, _dump_model(run))
+        _seed_model_cache(metadata_file, run)
 
     def delete_run(self, workspace_id: UUID, run_id: UUID) -> bool:
         """Delete a run and its results."""
@@ -264,14 +424,31 @@ class WorkspaceStorage:
             return False
 
         shutil.rmtree(run_dir)
+        _invalidate_model_cache(run_dir)
+        self._run_counts.pop(workspace_id, None)
         return True
 
+    def _dump_run_results(self, results: dict) -> bytes:
+        """Serialize run results for storage."""
+        # Results are built from calculator output and may carry numpy scalars
+        return orjson.dumps(results, option=_json_option(orjson.OPT_SERIALIZE_NUMPY))
+
     def save_run_results(self, workspace_id: UUID, run_id: UUID, results: dict) -> None:
         """Save run results."""
-        atomic_write(
-            self._run_results_file(workspace_id, run_id),
-            json.dumps(results, indent=2)
-        )
+        atomic_write(self._run_results_file(workspace_id, run_id), self._dump_run_results(results))
+
+    def save_run_with_results(self, workspace_id: UUID, run: Run, results: dict) -> None:
+        """Save run results and the updated run metadata in one batched write.
+
+        Results are renamed into place before the metadata, so a run never
+        reads as finished without its results file.
+        """
+        metadata_file = self._run_metadata_file(workspace_id, run.id)
+        atomic_write_many([
+            (self._run_results_file(workspace_id, run.id), self._dump_run_results(results)),
+            (metadata_file, _dump_model(run)),
+        ])
+        _seed_model_cache(metadata_file, run)
 
     def get_run_results(self, workspace_id: UUID, run_id: UUID) -> Optional[dict]:
         """Get run results."""
@@ -279,16 +456,13 @@ class WorkspaceStorage:
         if not results_file.exists():
             return None
 
-        return json.loads(results_file.read_text())
-
-
-# Global instance for convenience
-_storage: Optional[WorkspaceStorage] = None
+        return orjson.loads(results_file.read_bytes())
 
 
+@cache
 def get_workspace_storage() -> WorkspaceStorage:
-    """Get the global workspace storage instance."""
-    global _storage
-    if _storage is None:
-        _storage = WorkspaceStorage()
-    return _storage
+    """Get the global workspace storage instance.
+
+    Call get_workspace_storage.cache_clear() to pick up a new ACP_WORKSPACE_DIR.
+    """
+    return WorkspaceStorage()
@@ -5,7 +5,6 @@ T078: Validates that API responses match the openapi.yaml contract.
 """
 
 import io
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -34,11 +33,10 @@ def openapi_spec() -> dict:
 
 
 @pytest.fixture(scope="function", autouse=True)
-def reset_db():
+def reset_db(tmp_path):
     """Reset database for each test."""
     database.close_db()
-    temp_dir = tempfile.mkdtemp()
-    test_db_path = Path(temp_dir) / "test_contract.db"
+    test_db_path = tmp_path / "test_contract.db"
     database.init_database(str(test_db_path))
     database._connection = database.create_connection(str(test_db_path))
     yield
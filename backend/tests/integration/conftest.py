@@ -0,0 +1,85 @@
+"""
+Shared fixtures for API integration tests.
+
+The workspace database is opened in memory once per session; tests get a
+clean database by having its tables emptied rather than recreated. Under
+pytest-xdist every worker is its own session, so each gets a private
+in-memory database and temp workspace dir and workers never share state.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.routers.main import app
+from app.storage import database
+
+TEST_WORKSPACE_ID = "00000000-0000-0000-0000-00000000a11d"
+
+# Child tables first so foreign keys never block the wipe
+_TABLES_TO_WIPE = (
+    "validation_issue",
+    "import_session",
+    "mapping_profile",
+    "import_log",
+    "import_metadata",
+    "analysis_result",
+    "grid_analysis",
+    "participant",
+    "census",
+)
+
+
+@pytest.fixture(scope="session")
+def workspace_headers() -> dict:
+    """Headers scoping API requests to the test workspace."""
+    return {"X-Workspace-ID": TEST_WORKSPACE_ID}
+
+
+@pytest.fixture(scope="session")
+def workspace_db(tmp_path_factory):
+    """Open the test workspace once, as an in-memory database.
+
+    Workspace databases are also pointed at a temp dir, so a connection that
+    gets reopened after close_db() never lands in the user's workspace.
+    """
+    original_base_dir = database.WORKSPACE_BASE_DIR
+    database.close_db()
+    database.WORKSPACE_BASE_DIR = tmp_path_factory.mktemp("workspaces")
+
+    conn = database.create_connection(":memory:")
+    database.init_database(conn)
+    database._connections[TEST_WORKSPACE_ID] = conn
+
+    yield conn
+
+    database.close_db()
+    database.WORKSPACE_BASE_DIR = original_base_dir
+
+
+def _empty_workspace_db():
+    """Delete every row from the test workspace database."""
+    # Look the connection up again in case another module's fixture closed it
+    conn = database.get_db(TEST_WORKSPACE_ID)
+    for table in _TABLES_TO_WIPE:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def clean_workspace_db(workspace_db):
+    """Empty every table of the test workspace before the test runs."""
+    return _empty_workspace_db()
+
+
+@pytest.fixture(scope="module")
+def clean_module_workspace_db(workspace_db):
+    """Empty every table once per module, for modules whose tests only read."""
+    return _empty_workspace_db()
+
+
+@pytest.fixture(scope="session")
+def client(workspace_db, workspace_headers):
+    """Test client shared by the whole session; app startup and shutdown run once."""
+    with TestClient(app, headers=workspace_headers) as test_client:
+        yield test_client
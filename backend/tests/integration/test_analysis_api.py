@@ -5,32 +5,15 @@ T067-T068: Full API workflow tests for scenario and grid analysis.
 """
 
 import io
-import tempfile
-from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.routers.main import app
-from app.storage import database
+from app.routers.routes.analysis import _run_scenario_cached
 
 
-@pytest.fixture(scope="function", autouse=True)
-def reset_db():
-    """Reset database for each test."""
-    database.close_db()
-    temp_dir = tempfile.mkdtemp()
-    test_db_path = Path(temp_dir) / "test_integration.db"
-    database.init_database(str(test_db_path))
-    database._connection = database.create_connection(str(test_db_path))
-    yield
-    database.close_db()
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+@pytest.fixture(autouse=True)
+def reset_db(clean_workspace_db):
+    """Start each test from an empty workspace database."""
 
 
 @pytest.fixture
@@ -159,10 +142,13 @@ class TestSingleScenarioWorkflow:
         }
 
         response1 = client.post("/api/v1/v2/scenario", json=request_data)
+        hits_before = _run_scenario_cached.cache_info().hits
         response2 = client.post("/api/v1/v2/scenario", json=request_data)
 
         assert response1.status_code == 200
         assert response2.status_code == 200
+        # The repeat request is served from the scenario cache
+        assert _run_scenario_cached.cache_info().hits == hits_before + 1
 
         result1 = response1.json()
         result2 = response2.json()
@@ -6,65 +6,11 @@ Tests census upload, analysis, and export endpoints.
 
 import io
 import pytest
-from fastapi.testclient import TestClient
-
-from app.routers.main import app
-from app.storage.database import reset_database
-
-
-@pytest.fixture(scope="function", autouse=True)
-def reset_db():
-    """Reset database before each test."""
-    from app.storage import database
-    from pathlib import Path
-    import tempfile
-    import os
-
-    # Use a unique temp database per test
-    test_db_path = Path(tempfile.gettempdir()) / f"test_acp_{os.getpid()}_{id(reset_db)}.db"
-
-    # Close any existing connection
-    database.close_db()
-
-    # Remove old test database if it exists
-    for f in Path(tempfile.gettempdir()).glob("test_acp_*.db*"):
-        try:
-            f.unlink()
-        except Exception:
-            pass
-
-    # Patch DATABASE_PATH for testing
-    from app.services import constants
-    original_path = constants.DATABASE_PATH
-    constants.DATABASE_PATH = test_db_path
-
-    # Initialize fresh database
-    database.init_database(test_db_path)
-    database._connection = database.create_connection(test_db_path)
-
-    yield
-
-    # Cleanup
-    database.close_db()
-    constants.DATABASE_PATH = original_path
-
-    # Remove test database
-    try:
-        if test_db_path.exists():
-            test_db_path.unlink()
-        # Remove WAL files
-        for ext in ["-wal", "-shm"]:
-            wal = Path(str(test_db_path) + ext)
-            if wal.exists():
-                wal.unlink()
-    except Exception:
-        pass
-
-
-@pytest.fixture(scope="function")
-def client(reset_db):
-    """Create test client."""
-    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_db(clean_workspace_db):
+    """Start each test from an empty workspace database."""
 
 
 @pytest.fixture
@@ -5,60 +5,43 @@ Tests CSV and PDF export via API with proper audit metadata.
 """
 
 import io
-import tempfile
-from pathlib import Path
+import uuid
+from datetime import datetime
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.routers.main import app
-from app.storage import database
+from app.storage.models import AnalysisResult, GridAnalysis
+from app.storage.repository import AnalysisResultRepository, GridAnalysisRepository
 
+_CSV_BYTES = b"""Employee ID,HCE Status,Annual Compensation,Current Deferral Rate,Current Match Rate,Current After-Tax Rate
+E001,TRUE,180000,10,4,0
+E002,FALSE,75000,6,3,2
+E003,TRUE,200000,10,4,3
+E004,FALSE,65000,5,2.5,1
+E005,TRUE,150000,8,4,2
+"""
 
-@pytest.fixture(scope="function", autouse=True)
-def reset_db():
-    """Reset database for each test."""
-    # Close existing connection
-    database.close_db()
-
-    # Create temp database
-    temp_dir = tempfile.mkdtemp()
-    test_db_path = Path(temp_dir) / "test_export.db"
-
-    # Initialize fresh database
-    database.init_database(str(test_db_path))
-    database._connection = database.create_connection(str(test_db_path))
-
-    yield
-
-    # Cleanup
-    database.close_db()
 
+@pytest.fixture(scope="module", autouse=True)
+def reset_db(clean_module_workspace_db):
+    """Start the module from an empty workspace database.
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+    Export tests only read, so the census fixtures below are built once per
+    module and shared between tests.
+    """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_content() -> bytes:
     """Sample CSV census file with required columns."""
-    return b"""Employee ID,HCE Status,Annual Compensation,Current Deferral Rate,Current Match Rate,Current After-Tax Rate
-E001,TRUE,180000,10,4,0
-E002,FALSE,75000,6,3,2
-E003,TRUE,200000,10,4,3
-E004,FALSE,65000,5,2.5,1
-E005,TRUE,150000,8,4,2
-"""
+    return _CSV_BYTES
 
 
-@pytest.fixture
-def uploaded_census(client, sample_csv_content) -> dict:
-    """Upload a census and return the response data."""
+def _upload_census(client, csv_content: bytes) -> dict:
+    """Upload a census and return its id and name."""
     response = client.post(
         "/api/v1/census",
-        files={"file": ("test_census.csv", io.BytesIO(sample_csv_content), "text/csv")},
+        files={"file": ("test_census.csv", io.BytesIO(csv_content), "text/csv")},
         data={"name": "Export Test Census", "plan_year": "2025"},
     )
     assert response.status_code == 201
@@ -67,10 +50,17 @@ def uploaded_census(client, sample_csv_content) -> dict:
     return {"census_id": data["id"], "name": data["name"]}
 
 
-@pytest.fixture
-def census_with_results(client, uploaded_census) -> dict:
-    """Census with analysis results."""
-    census_id = uploaded_census["census_id"]
+@pytest.fixture(scope="module")
+def _uploaded_census_m(client, sample_csv_content) -> dict:
+    """Census without results, uploaded once per module."""
+    return _upload_census(client, sample_csv_content)
+
+
+@pytest.fixture(scope="module")
+def _census_with_results_m(client, sample_csv_content) -> dict:
+    """Census with single scenario results, built once per module."""
+    census = _upload_census(client, sample_csv_content)
+    census_id = census["census_id"]
 
     # Run single scenario analysis
     response = client.post(
@@ -83,13 +73,14 @@ def census_with_results(client, uploaded_census) -> dict:
     )
     assert response.status_code == 200
 
-    return {"census_id": census_id, "census_name": uploaded_census["name"]}
+    return {"census_id": census_id, "census_name": census["name"]}
 
 
-@pytest.fixture
-def census_with_grid_results(client, uploaded_census) -> dict:
-    """Census with grid analysis results."""
-    census_id = uploaded_census["census_id"]
+@pytest.fixture(scope="module")
+def _census_with_grid_results_m(client, sample_csv_content) -> dict:
+    """Census with grid results, built once per module."""
+    census = _upload_census(client, sample_csv_content)
+    census_id = census["census_id"]
 
     # Run grid analysis
     response = client.post(
@@ -104,11 +95,111 @@ def census_with_grid_results(client, uploaded_census) -> dict:
 
     return {
         "census_id": census_id,
-        "census_name": uploaded_census["name"],
+        "census_name": census["name"],
         "grid_id": response.json()["id"],  # Response uses "id" not "grid_id"
     }
 
 
+def _save_result(
+    conn,
+    census_id: str,
+    grid_id: str | None = None,
+    adoption_rate: float = 0.5,
+    contribution_rate: float = 0.06,
+) -> None:
+    """Save one passing analysis result straight through the repository."""
+    AnalysisResultRepository(conn).save(
+        AnalysisResult(
+            id=str(uuid.uuid4()),
+            census_id=census_id,
+            grid_analysis_id=grid_id,
+            adoption_rate=adoption_rate,
+            contribution_rate=contribution_rate,
+            seed=42,
+            nhce_acp=3.0,
+            hce_acp=4.0,
+            threshold=5.0,
+            margin=1.0,
+            result="PASS",
+            limiting_test="+2.0",
+            run_timestamp=datetime(2025, 1, 15, 10, 30),
+            version="1.0.0",
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def _stored_results_m(client, sample_csv_content, clean_module_workspace_db) -> dict:
+    """Census with a single result saved through the repository, built once per module."""
+    census = _upload_census(client, sample_csv_content)
+    _save_result(clean_module_workspace_db, census["census_id"])
+    return {"census_id": census["census_id"], "census_name": census["name"]}
+
+
+@pytest.fixture(scope="module")
+def _stored_grid_results_m(client, sample_csv_content, clean_module_workspace_db) -> dict:
+    """Census with a 2x2 grid saved through the repositories, built once per module."""
+    census = _upload_census(client, sample_csv_content)
+    census_id = census["census_id"]
+    grid = GridAnalysis(
+        id=str(uuid.uuid4()),
+        census_id=census_id,
+        name="Export grid",
+        created_timestamp=datetime(2025, 1, 15, 10, 30),
+        seed=42,
+        adoption_rates=[0.25, 0.5],
+        contribution_rates=[0.04, 0.06],
+        version="1.0.0",
+    )
+    GridAnalysisRepository(clean_module_workspace_db).save(grid)
+    for adoption_rate in grid.adoption_rates:
+        for contribution_rate in grid.contribution_rates:
+            _save_result(
+                clean_module_workspace_db, census_id, grid.id, adoption_rate, contribution_rate
+            )
+    return {"census_id": census_id, "census_name": census["name"], "grid_id": grid.id}
+
+
+@pytest.fixture
+def uploaded_census(_uploaded_census_m) -> dict:
+    """Upload a census and return the response data."""
+    return dict(_uploaded_census_m)
+
+
+@pytest.fixture
+def census_with_results(_census_with_results_m) -> dict:
+    """Census with analysis results."""
+    return dict(_census_with_results_m)
+
+
+@pytest.fixture
+def census_with_grid_results(_census_with_grid_results_m) -> dict:
+    """Census with grid analysis results."""
+    return dict(_census_with_grid_results_m)
+
+
+@pytest.fixture(scope="module")
+def pdf_responses(client, _stored_results_m, _stored_grid_results_m) -> dict:
+    """PDF exports rendered once per module, keyed by the kind of results exported.
+
+    Inputs are fixed, so every test can share one render per census.
+    """
+    single_id = _stored_results_m["census_id"]
+    grid_id = _stored_grid_results_m["grid_id"]
+    grid_census_id = _stored_grid_results_m["census_id"]
+    return {
+        "single": client.get(f"/api/v1/export/{single_id}/pdf"),
+        "grid": client.get(f"/api/v1/export/{grid_census_id}/pdf?grid_id={grid_id}"),
+    }
+
+
+def _stream_csv_head(client, url: str) -> str:
+    """Read only the first streamed chunk of a CSV export: the metadata header block."""
+    with client.stream("GET", url) as response:
+        assert response.status_code == 200
+        return next(response.iter_text())
+
+
 class TestCSVExportAPI:
     """Tests for CSV export API endpoint."""
 
@@ -135,8 +226,7 @@ class TestCSVExportAPI:
         """CSV export includes full audit metadata."""
         census_id = census_with_results["census_id"]
 
-        response = client.get(f"/api/v1/export/{census_id}/csv")
-        content = response.text
+        content = _stream_csv_head(client, f"/api/v1/export/{census_id}/csv")
 
         # Check audit metadata
         assert "# Census Name:" in content
@@ -150,37 +240,17 @@ class TestCSVExportAPI:
         census_id = census_with_grid_results["census_id"]
         grid_id = census_with_grid_results["grid_id"]
 
-        response = client.get(f"/api/v1/export/{census_id}/csv?grid_id={grid_id}")
-
-        assert response.status_code == 200
-        content = response.text
+        content = _stream_csv_head(client, f"/api/v1/export/{census_id}/csv?grid_id={grid_id}")
         assert "# Seed: 42" in content
 
-    def test_export_csv_census_not_found(self, client) -> None:
-        """CSV export returns 404 for non-existent census."""
-        response = client.get("/api/v1/export/nonexistent-id/csv")
-
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_export_csv_no_results(self, client, uploaded_census) -> None:
-        """CSV export returns 404 when no analysis results exist."""
-        census_id = uploaded_census["census_id"]
-
-        response = client.get(f"/api/v1/export/{census_id}/csv")
-
-        assert response.status_code == 404
-        assert "No analysis results" in response.json()["detail"]
-
 
 class TestPDFExportAPI:
     """Tests for PDF export API endpoint."""
 
-    def test_export_pdf_success(self, client, census_with_results) -> None:
-        """T073: Export PDF returns valid PDF content."""
-        census_id = census_with_results["census_id"]
-
-        response = client.get(f"/api/v1/export/{census_id}/pdf")
+    @pytest.mark.parametrize("kind", ["single", "grid"])
+    def test_export_pdf_success(self, pdf_responses, kind) -> None:
+        """T073: Export PDF returns valid PDF content, for single and grid results."""
+        response = pdf_responses[kind]
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/pdf"
@@ -190,28 +260,63 @@ class TestPDFExportAPI:
         # Verify PDF magic bytes
         assert response.content[:4] == b"%PDF"
 
-    def test_export_pdf_grid_results(self, client, census_with_grid_results) -> None:
-        """PDF export works with grid analysis results."""
-        census_id = census_with_grid_results["census_id"]
-        grid_id = census_with_grid_results["grid_id"]
+    def test_export_pdf_from_stored_results(
+        self, client, sample_csv_content, clean_module_workspace_db
+    ) -> None:
+        """PDF export renders results read straight from the repository."""
+        census_id = _upload_census(client, sample_csv_content)["census_id"]
+        _save_result(clean_module_workspace_db, census_id)
 
-        response = client.get(f"/api/v1/export/{census_id}/pdf?grid_id={grid_id}")
+        response = client.get(f"/api/v1/export/{census_id}/pdf")
 
         assert response.status_code == 200
         assert response.content[:4] == b"%PDF"
 
-    def test_export_pdf_census_not_found(self, client) -> None:
-        """PDF export returns 404 for non-existent census."""
-        response = client.get("/api/v1/export/nonexistent-id/pdf")
+    def test_export_pdf_byte_range(self, client, _stored_results_m) -> None:
+        """A Range request returns just the requested prefix of the PDF."""
+        census_id = _stored_results_m["census_id"]
+
+        response = client.get(
+            f"/api/v1/export/{census_id}/pdf", headers={"Range": "bytes=0-3"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == b"%PDF"
+        assert response.headers["content-range"].startswith("bytes 0-3/")
+        assert "accept-ranges" not in response.headers
+
+    @pytest.mark.parametrize("range_header", ["bytes=100-199", "bytes=-50", "bytes=5-3"])
+    def test_export_pdf_ignores_non_prefix_ranges(
+        self, client, _stored_results_m, range_header
+    ) -> None:
+        """Resume, suffix and malformed ranges get the full PDF, not a slice."""
+        census_id = _stored_results_m["census_id"]
+
+        response = client.get(
+            f"/api/v1/export/{census_id}/pdf", headers={"Range": range_header}
+        )
+
+        assert response.status_code == 200
+        assert response.content[:4] == b"%PDF"
+
+
+class TestExportErrors:
+    """Tests for export error responses, shared by both formats."""
+
+    @pytest.mark.parametrize("fmt", ["csv", "pdf"])
+    def test_export_census_not_found(self, client, fmt) -> None:
+        """Export returns 404 for non-existent census."""
+        response = client.get(f"/api/v1/export/nonexistent-id/{fmt}")
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_export_pdf_no_results(self, client, uploaded_census) -> None:
-        """PDF export returns 404 when no analysis results exist."""
+    @pytest.mark.parametrize("fmt", ["csv", "pdf"])
+    def test_export_no_results(self, client, uploaded_census, fmt) -> None:
+        """Export returns 404 when no analysis results exist."""
         census_id = uploaded_census["census_id"]
 
-        response = client.get(f"/api/v1/export/{census_id}/pdf")
+        response = client.get(f"/api/v1/export/{census_id}/{fmt}")
 
         assert response.status_code == 404
         assert "No analysis results" in response.json()["detail"]
@@ -231,13 +336,9 @@ class TestExportFilenames:
         assert "acp_results_" in disposition
         assert ".csv" in disposition
 
-    def test_pdf_filename_format(self, client, census_with_results) -> None:
+    def test_pdf_filename_format(self, pdf_responses) -> None:
         """PDF filename includes date."""
-        census_id = census_with_results["census_id"]
-
-        response = client.get(f"/api/v1/export/{census_id}/pdf")
-
-        disposition = response.headers["content-disposition"]
-        # Should be like: attachment; filename="acp_report_2025-01-15.pdf"
-        assert "acp_report_" in disposition
+        disposition = pdf_responses["single"].headers["content-disposition"]
+        # Should be like: attachment; filename="Export_Test_Census_2025_Jan2025.pdf"
+        assert 'filename="Export_Test_Census_2025_' in disposition
         assert ".pdf" in disposition
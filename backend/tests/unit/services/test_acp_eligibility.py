@@ -8,14 +8,17 @@ entry dates, and plan year boundaries.
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
 from app.services.acp_eligibility import (
     ACPInclusionError,
     ACPInclusionResult,
+    _next_entry_date,
     determine_acp_inclusion,
+    determine_acp_inclusion_batch,
     plan_year_bounds,
 )
 
@@ -200,73 +203,77 @@ class TestDetermineACPInclusion:
         )
         assert result.acp_includable is True
 
-    def test_accepts_various_date_formats(self):
-        """Function accepts various string date formats."""
-        # ISO format
-        result1 = determine_acp_inclusion(
-            dob="1990-01-10",
-            hire_date="2020-01-01",
-            termination_date=None,
-            plan_year_start=date(2024, 1, 1),
-            plan_year_end=date(2024, 12, 31),
-        )
-        assert result1.acp_includable is True
-
-        # US format MM/DD/YYYY
-        result2 = determine_acp_inclusion(
-            dob="01/10/1990",
-            hire_date="01/01/2020",
+    @pytest.mark.parametrize(
+        ("dob", "hire_date"),
+        [("1990-01-10", "2020-01-01"), ("01/10/1990", "01/01/2020")],
+        ids=["iso", "us_mm_dd_yyyy"],
+    )
+    def test_accepts_various_date_formats(self, dob, hire_date):
+        """Function accepts ISO and US MM/DD/YYYY string dates."""
+        result = determine_acp_inclusion(
+            dob=dob,
+            hire_date=hire_date,
             termination_date=None,
             plan_year_start=date(2024, 1, 1),
             plan_year_end=date(2024, 12, 31),
         )
-        assert result2.acp_includable is True
-
-    # --- Error handling ---
+        assert result.acp_includable is True
 
-    def test_missing_dob_raises_error(self):
-        """Missing DOB raises ACPInclusionError."""
-        with pytest.raises(ACPInclusionError, match="Missing DOB"):
+    def test_day_first_dates_used_when_month_first_is_invalid(self):
+        """DD/MM/YYYY is accepted when the value cannot be MM/DD/YYYY."""
+        results = [
             determine_acp_inclusion(
-                dob=None,
+                dob="01/10/1990",
                 hire_date="2020-01-01",
-                termination_date=None,
+                termination_date=termination_date,
                 plan_year_start=date(2024, 1, 1),
                 plan_year_end=date(2024, 12, 31),
             )
+            for termination_date in ("12/13/2020", "13/12/2020")
+        ]
+        # Both parse to 2020-12-13, before the 2021-01-01 entry date
+        for result in results:
+            assert result.entry_date == date(2021, 1, 1)
+            assert result.acp_exclusion_reason == "TERMINATED_BEFORE_ENTRY"
 
-    def test_missing_hire_date_raises_error(self):
-        """Missing hire date raises ACPInclusionError."""
-        with pytest.raises(ACPInclusionError, match="Missing hire date"):
-            determine_acp_inclusion(
-                dob="1990-01-10",
-                hire_date=None,
-                termination_date=None,
-                plan_year_start=date(2024, 1, 1),
-                plan_year_end=date(2024, 12, 31),
-            )
+    # --- Error handling ---
 
-    def test_empty_dob_raises_error(self):
-        """Empty string DOB raises ACPInclusionError."""
-        with pytest.raises(ACPInclusionError, match="Missing DOB"):
+    @pytest.mark.parametrize(
+        ("dob", "hire_date", "expected_match"),
+        [
+            (None, "2020-01-01", "Missing DOB"),
+            ("1990-01-10", None, "Missing hire date"),
+            ("", "2020-01-01", "Missing DOB"),
+            ("not-a-date", "2020-01-01", "Invalid DOB format"),
+        ],
+        ids=["missing_dob", "missing_hire_date", "empty_dob", "invalid_date_format"],
+    )
+    def test_invalid_inputs_raise_error(self, dob, hire_date, expected_match):
+        """Missing, empty or unparseable dates raise ACPInclusionError."""
+        with pytest.raises(ACPInclusionError, match=expected_match):
             determine_acp_inclusion(
-                dob="",
-                hire_date="2020-01-01",
+                dob=dob,
+                hire_date=hire_date,
                 termination_date=None,
                 plan_year_start=date(2024, 1, 1),
                 plan_year_end=date(2024, 12, 31),
             )
 
-    def test_invalid_date_format_raises_error(self):
-        """Invalid date format raises ACPInclusionError."""
-        with pytest.raises(ACPInclusionError, match="Invalid DOB format"):
-            determine_acp_inclusion(
-                dob="not-a-date",
-                hire_date="2020-01-01",
-                termination_date=None,
-                plan_year_start=date(2024, 1, 1),
-                plan_year_end=date(2024, 12, 31),
+
+class TestNextEntryDate:
+    """Tests for the semi-annual entry date rule."""
+
+    def test_matches_reference_rule_for_every_day(self):
+        """First Jan 1 or Jul 1 on or after each day of a leap and a common year."""
+        day = date(2023, 1, 1)
+        while day <= date(2024, 12, 31):
+            candidates = (
+                date(day.year, 1, 1),
+                date(day.year, 7, 1),
+                date(day.year + 1, 1, 1),
             )
+            assert _next_entry_date(day) == next(c for c in candidates if c >= day)
+            day += timedelta(days=1)
 
 
 class TestACPInclusionResult:
@@ -293,3 +300,49 @@ class TestACPInclusionResult:
         )
         assert result.acp_includable is False
         assert result.acp_exclusion_reason == "NOT_ELIGIBLE_DURING_YEAR"
+
+
+class TestDetermineACPInclusionBatch:
+    """Tests for the vectorized census-wide inclusion check."""
+
+    def test_matches_scalar_function(self):
+        """Every row agrees with determine_acp_inclusion, including Feb 29 dates."""
+        dobs = [date(1980, 5, 17), date(2000, 2, 29), date(2003, 7, 1), date(2003, 12, 31)]
+        hires = [date(2020, 2, 29), date(2023, 1, 1), date(2023, 6, 15), date(2024, 1, 2)]
+        terms = [None, date(2023, 12, 31), date(2024, 7, 1), date(2024, 6, 30)]
+        rows = [
+            (dob + timedelta(days=shift), hire, term)
+            for dob in dobs
+            for hire in hires
+            for term in terms
+            for shift in (0, 1, 183)
+        ]
+        plan_year_start, plan_year_end = plan_year_bounds(2024)
+
+        batch = determine_acp_inclusion_batch(*zip(*rows), plan_year_start, plan_year_end)
+
+        for i, (dob, hire, term) in enumerate(rows):
+            expected = determine_acp_inclusion(
+                dob=dob,
+                hire_date=hire,
+                termination_date=term,
+                plan_year_start=plan_year_start,
+                plan_year_end=plan_year_end,
+            )
+            assert batch.eligibility_date[i] == np.datetime64(expected.eligibility_date, "D")
+            assert batch.entry_date[i] == np.datetime64(expected.entry_date, "D")
+            assert batch.acp_includable[i] == expected.acp_includable
+            assert batch.acp_exclusion_reason[i] == expected.acp_exclusion_reason
+
+    def test_missing_dates_are_includable(self):
+        """Rows missing DOB or hire date fail open."""
+        batch = determine_acp_inclusion_batch(
+            [None, date(1990, 1, 1)],
+            [date(2020, 1, 1), None],
+            [date(2020, 2, 1), None],
+            date(2024, 1, 1),
+            date(2024, 12, 31),
+        )
+        assert batch.acp_includable.tolist() == [True, True]
+        assert batch.acp_exclusion_reason.tolist() == [None, None]
+        assert np.isnat(batch.entry_date).all()
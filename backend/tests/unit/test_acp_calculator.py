@@ -10,13 +10,17 @@ from decimal import Decimal
 import pytest
 
 from app.services.acp_calculator import (
+    CensusColumns,
     calculate_individual_acp,
     calculate_group_acp,
     calculate_nhce_acp,
     calculate_hce_acp,
     apply_acp_test,
+    apply_acp_test_into,
     calculate_margin,
+    calculate_total_mega_backdoor,
     ACPResult,
+    acp_limits_for,
 )
 
 
@@ -292,6 +296,35 @@ class TestIRSDualTest:
         assert fail_result.margin < 0
 
 
+class TestApplyACPTestInto:
+    """Dual test written into a reused ACPResult."""
+
+    def test_overwrites_result_in_place(self):
+        """Reusing a holder gives the same values as a fresh result."""
+        holder = apply_acp_test(nhce_acp=Decimal("1.0"), hce_acp=Decimal("1.5"))
+
+        updated = apply_acp_test_into(holder, Decimal("4.0"), Decimal("6.5"))
+
+        assert updated is holder
+        assert holder == apply_acp_test(nhce_acp=Decimal("4.0"), hce_acp=Decimal("6.5"))
+        assert holder.result == "FAIL"
+
+
+class TestACPLimitsFor:
+    """Cached float limits for stored NHCE ACPs."""
+
+    def test_matches_scalar_test(self):
+        for n in (0.0, 1.0, 4.0, 8.0, 3.123458):
+            expected = apply_acp_test(Decimal(str(n)), Decimal("0"))
+            limits = acp_limits_for(n)
+            assert limits.effective_limit == float(expected.effective_limit)
+            assert limits.limit_2pct_capped == float(expected.limit_2pct_capped)
+            assert limits.binding_rule == expected.binding_rule
+
+    def test_repeated_nhce_acp_reuses_record(self):
+        assert acp_limits_for(5.5) is acp_limits_for(5.5)
+
+
 class TestMarginCalculation:
     """Tests for margin calculation."""
 
@@ -435,6 +468,52 @@ class TestEdgeCases:
         assert result.result == "FAIL"
         assert result.margin < 0
 
+    def test_group_acp_matches_individual_acps_beyond_int64_range(self):
+        """Contributions too large for the vectorized path average the same way."""
+        participants = [
+            {"internal_id": "nhce1", "is_hce": False, "match_cents": 10**12, "after_tax_cents": 1, "compensation_cents": 3},
+            {"internal_id": "nhce2", "is_hce": False, "match_cents": 1000, "after_tax_cents": 0, "compensation_cents": 0},
+            {"internal_id": "nhce3", "is_hce": False, "match_cents": 2000, "after_tax_cents": 7, "compensation_cents": 60001},
+        ]
+
+        expected = calculate_group_acp([
+            calculate_individual_acp(p["match_cents"], p["after_tax_cents"], p["compensation_cents"])
+            for p in participants
+        ])
+
+        assert calculate_nhce_acp(participants) == expected
+        assert calculate_nhce_acp(participants[1:]) == calculate_group_acp([
+            calculate_individual_acp(p["match_cents"], p["after_tax_cents"], p["compensation_cents"])
+            for p in participants[1:]
+        ])
+
+
+class TestCensusColumns:
+    """Calculations over CensusColumns match the participant-dict path."""
+
+    PARTICIPANTS = [
+        {"internal_id": "nhce1", "is_hce": False, "match_cents": 150000, "after_tax_cents": 0, "compensation_cents": 5000000},
+        {"internal_id": "nhce2", "is_hce": False, "match_cents": 90000, "after_tax_cents": 20001, "compensation_cents": 4000003},
+        {"internal_id": "nhce3", "is_hce": False, "match_cents": 0, "after_tax_cents": 0, "compensation_cents": 0},
+        {"internal_id": "hce1", "is_hce": True, "match_cents": 300000, "after_tax_cents": 0, "compensation_cents": 10000000},
+        {"internal_id": "hce2", "is_hce": True, "match_cents": 400000, "after_tax_cents": 5000, "compensation_cents": 15000001},
+        {"internal_id": "hce3", "is_hce": True, "match_cents": 0, "after_tax_cents": 0, "compensation_cents": 0},
+    ]
+
+    @pytest.mark.parametrize("contribution_rate", [Decimal("0"), Decimal("6.0"), Decimal("7.000000000000001")])
+    def test_columns_match_dicts(self, contribution_rate):
+        """NHCE/HCE ACPs and mega-backdoor totals agree for both input forms."""
+        columns = CensusColumns.from_dicts(self.PARTICIPANTS)
+        adopting = ["hce2", "hce3", "nhce1"]
+
+        assert calculate_nhce_acp(columns) == calculate_nhce_acp(self.PARTICIPANTS)
+        assert calculate_hce_acp(columns, adopting, contribution_rate) == calculate_hce_acp(
+            self.PARTICIPANTS, adopting, contribution_rate
+        )
+        assert calculate_total_mega_backdoor(
+            columns, adopting, contribution_rate
+        ) == calculate_total_mega_backdoor(self.PARTICIPANTS, adopting, contribution_rate)
+
 
 class TestIRC415cLimitWarning:
     """T088: IRC 415(c) limit warning tests."""
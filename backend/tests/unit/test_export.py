@@ -4,60 +4,88 @@ Unit tests for export module.
 Tests CSV and PDF export generation with audit metadata.
 """
 
+import hashlib
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
 
 import pytest
 
+from app.services import export
 from app.services.export import (
     format_csv_export,
     generate_pdf_report,
     add_formula_strings,
+    iter_csv_export,
 )
 
 
-@pytest.fixture
-def sample_census() -> dict:
-    """Sample census metadata for testing."""
-    return {
+def _fake_pdf_backend(
+    census, results, grid_summary, excluded_count, hce_count, nhce_count
+) -> bytes:
+    """Stand-in PDF renderer: a PDF header plus a digest of the inputs."""
+    digest = hashlib.blake2b(
+        repr((dict(census), results, grid_summary, excluded_count, hce_count, nhce_count)).encode(),
+        digest_size=16,
+    ).digest()
+    return b"%PDF-1.4\n" + digest
+
+
+@pytest.fixture(autouse=True)
+def fast_pdf_backend(request, monkeypatch) -> None:
+    """Render PDFs with the fake backend unless the test is marked pdf_fidelity."""
+    if request.node.get_closest_marker("pdf_fidelity") is None:
+        monkeypatch.setattr(export, "_default_pdf_backend", _fake_pdf_backend)
+
+
+@pytest.fixture(scope="session")
+def sample_census() -> MappingProxyType:
+    """Sample census metadata for testing, shared read-only by every test."""
+    return MappingProxyType({
         "id": "test-census-123456789",
         "name": "Test Company 2025",
         "plan_year": 2025,
         "participant_count": 100,
         "hce_count": 20,
         "nhce_count": 80,
-    }
+    })
+
+
+_SAMPLE_RESULTS = (
+    {
+        "adoption_rate": 50.0,
+        "contribution_rate": 6.0,
+        "nhce_acp": 4.500,
+        "hce_acp": 5.200,
+        "threshold": 6.500,
+        "margin": 1.300,
+        "result": "PASS",
+        "limiting_test": "+2.0",
+        "seed": 42,
+        "run_timestamp": "2025-01-15T10:30:00",
+    },
+    {
+        "adoption_rate": 75.0,
+        "contribution_rate": 8.0,
+        "nhce_acp": 4.500,
+        "hce_acp": 7.800,
+        "threshold": 6.500,
+        "margin": -1.300,
+        "result": "FAIL",
+        "limiting_test": "+2.0",
+        "seed": 42,
+        "run_timestamp": "2025-01-15T10:30:01",
+    },
+)
 
 
 @pytest.fixture
 def sample_results() -> list[dict]:
-    """Sample analysis results for testing."""
-    return [
-        {
-            "adoption_rate": 50.0,
-            "contribution_rate": 6.0,
-            "nhce_acp": 4.500,
-            "hce_acp": 5.200,
-            "threshold": 6.500,
-            "margin": 1.300,
-            "result": "PASS",
-            "limiting_test": "+2.0",
-            "seed": 42,
-            "run_timestamp": "2025-01-15T10:30:00",
-        },
-        {
-            "adoption_rate": 75.0,
-            "contribution_rate": 8.0,
-            "nhce_acp": 4.500,
-            "hce_acp": 7.800,
-            "threshold": 6.500,
-            "margin": -1.300,
-            "result": "FAIL",
-            "limiting_test": "+2.0",
-            "seed": 42,
-            "run_timestamp": "2025-01-15T10:30:01",
-        },
-    ]
+    """Sample analysis results for testing.
+
+    Copied per test because exports fill in derived limit fields in place.
+    """
+    return [dict(result) for result in _SAMPLE_RESULTS]
 
 
 class TestCSVExport:
@@ -146,10 +174,28 @@ class TestCSVExport:
         lines = [line for line in csv_output.split("\n") if not line.startswith("#")]
         assert len(lines) == 1  # Just the column header
 
+    def test_csv_export_streams_rows_in_chunks(
+        self, sample_census: dict, sample_results: list[dict], monkeypatch
+    ) -> None:
+        """Streamed CSV chunks join to the same text as the buffered export."""
+        monkeypatch.setattr(export, "CSV_EXPORT_CHUNK_ROWS", 1)
+        many_results = [dict(r) for r in sample_results * 3]
+
+        chunks = list(iter_csv_export(sample_census, iter(many_results), seed=42))
+
+        assert len(chunks) == 1 + len(many_results)
+        expected = format_csv_export(sample_census, [dict(r) for r in many_results], seed=42)
+        # Only the Generated timestamp may differ between the two calls
+        def strip(text: str) -> list[str]:
+            return [line for line in text.split("\n") if not line.startswith("# Generated")]
+
+        assert strip("".join(chunks)) == strip(expected)
+
 
 class TestPDFExport:
     """Tests for PDF export functionality."""
 
+    @pytest.mark.pdf_fidelity
     def test_pdf_export_returns_bytes(
         self, sample_census: dict, sample_results: list[dict]
     ) -> None:
@@ -185,6 +231,23 @@ class TestPDFExport:
         assert isinstance(pdf_output, bytes)
         assert pdf_output[:4] == b"%PDF"
 
+    def test_pdf_export_uses_given_backend(
+        self, sample_census: dict, sample_results: list[dict]
+    ) -> None:
+        """An explicit backend renders the report with the same arguments."""
+        calls = []
+
+        def backend(*args) -> bytes:
+            calls.append(args)
+            return b"%PDF-stub"
+
+        pdf_output = generate_pdf_report(sample_census, sample_results, backend=backend)
+
+        assert pdf_output == b"%PDF-stub"
+        assert calls == [(sample_census, sample_results, None, 0, None, None)]
+
+    @pytest.mark.slow
+    @pytest.mark.pdf_fidelity
     def test_pdf_export_truncates_large_results(
         self, sample_census: dict
     ) -> None:
@@ -212,6 +275,21 @@ class TestPDFExport:
         assert isinstance(pdf_output, bytes)
         assert pdf_output[:4] == b"%PDF"
 
+    @pytest.mark.pdf_fidelity
+    def test_pdf_export_accepts_result_generator(
+        self, sample_census: dict
+    ) -> None:
+        """PDF renders from a one-shot iterable, counting rows past the display limit."""
+        results = (
+            {**_SAMPLE_RESULTS[0], "adoption_rate": float(i)}
+            for i in range(export.PDF_MAX_RESULT_ROWS + 5)
+        )
+
+        pdf_output = generate_pdf_report(sample_census, results)
+
+        assert pdf_output[:4] == b"%PDF"
+        assert next(results, None) is None
+
 
 class TestPostExclusionCounts:
     """Tests for post-exclusion count functionality in exports."""
@@ -249,6 +327,7 @@ class TestPostExclusionCounts:
 
         assert "# Excluded:" not in csv_output
 
+    @pytest.mark.pdf_fidelity
     def test_pdf_export_with_post_exclusion_counts(
         self, sample_census: dict, sample_results: list[dict]
     ) -> None:
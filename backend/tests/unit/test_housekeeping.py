@@ -0,0 +1,134 @@
+"""
+Unit Tests for Workspace Housekeeping.
+
+Tests for the Housekeeper queue and expired import session cleanup.
+"""
+
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import duckdb
+import pytest
+
+from app.storage import housekeeping
+from app.storage.database import init_database
+from app.storage.housekeeping import Housekeeper
+from app.storage.models import ImportSession, ValidationIssue
+from app.storage.repository import ImportSessionRepository, ValidationIssueRepository
+
+
+@pytest.fixture
+def conn():
+    connection = duckdb.connect()
+    init_database(connection)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    """Record housekeeping runs instead of touching a database.
+
+    Runs block until the returned release event is set, so tests can
+    schedule while a run is still in flight.
+    """
+    calls: list[str] = []
+    release = threading.Event()
+
+    def fake_run(conn) -> int:
+        release.wait(5)
+        calls.append(conn)
+        return 0
+
+    monkeypatch.setattr(housekeeping, "run_housekeeping", fake_run)
+    return calls, release
+
+
+def _save_session(conn, session_id: str, expires_at: datetime, issue_count: int) -> None:
+    now = datetime.utcnow()
+    ImportSessionRepository(conn).save(
+        ImportSession(id=session_id, created_at=now, updated_at=now, expires_at=expires_at)
+    )
+    ValidationIssueRepository(conn).bulk_insert(
+        ValidationIssue(
+            id=str(uuid.uuid4()),
+            session_id=session_id,
+            row_number=row,
+            field_name="hire_date",
+            severity="error",
+            issue_code="INVALID_DATE",
+            message="Invalid date",
+        )
+        for row in range(1, issue_count + 1)
+    )
+
+
+def test_schedule_skips_workspace_already_queued(runs):
+    calls, release = runs
+    keeper = Housekeeper(interval_seconds=0)
+
+    keeper.schedule("ws-1", "conn-1")
+    keeper.schedule("ws-1", "conn-1")
+    release.set()
+    keeper.stop(timeout=5)
+
+    assert calls == ["conn-1"]
+
+
+def test_schedule_waits_for_interval_between_runs(runs):
+    calls, release = runs
+    release.set()
+    keeper = Housekeeper(interval_seconds=3600)
+
+    keeper.schedule("ws-1", "conn-1")
+    keeper.stop(timeout=5)
+    keeper.schedule("ws-1", "conn-1")
+    keeper.schedule("ws-2", "conn-2")
+    keeper.stop(timeout=5)
+
+    assert calls == ["conn-1", "conn-2"]
+
+
+def test_schedule_runs_again_once_interval_elapsed(runs):
+    calls, release = runs
+    release.set()
+    keeper = Housekeeper(interval_seconds=0)
+
+    keeper.schedule("ws-1", "conn-1")
+    keeper.stop(timeout=5)
+    keeper.schedule("ws-1", "conn-1")
+    keeper.stop(timeout=5)
+
+    assert calls == ["conn-1", "conn-1"]
+
+
+def test_stop_drains_queued_work(runs):
+    calls, release = runs
+    keeper = Housekeeper()
+
+    for n in range(3):
+        keeper.schedule(f"ws-{n}", f"conn-{n}")
+    release.set()
+    keeper.stop(timeout=5)
+
+    assert calls == ["conn-0", "conn-1", "conn-2"]
+    assert keeper._thread is None
+
+
+def test_delete_expired_removes_sessions_and_issues(conn):
+    now = datetime.utcnow()
+    _save_session(conn, "expired-1", now - timedelta(hours=1), issue_count=2)
+    _save_session(conn, "expired-2", now - timedelta(minutes=1), issue_count=1)
+    _save_session(conn, "live", now + timedelta(hours=1), issue_count=3)
+
+    deleted = ImportSessionRepository(conn).delete_expired()
+
+    assert deleted == 2
+    remaining = conn.execute("SELECT id FROM import_session").fetchall()
+    assert remaining == [("live",)]
+    issue_sessions = conn.execute(
+        "SELECT DISTINCT session_id FROM validation_issue"
+    ).fetchall()
+    assert issue_sessions == [("live",)]
+    assert ImportSessionRepository(conn).delete_expired() == 0
@@ -760,6 +760,43 @@ class TestGridDeterminismV2:
         # Per FR-017: same seed used for all scenarios in grid
         assert result.seed_used == 42
 
+    def test_grid_v2_parallel_matches_sequential(self, monkeypatch):
+        """Grids run across worker processes return the same scenarios, in order."""
+        from app.services import scenario_runner
+
+        participants = [
+            {"internal_id": "nhce1", "match_cents": 150000, "after_tax_cents": 0, "compensation_cents": 5000000, "is_hce": False},
+            {"internal_id": "nhce2", "match_cents": 90000, "after_tax_cents": 20000, "compensation_cents": 4000000, "is_hce": False},
+            {"internal_id": "hce1", "match_cents": 300000, "after_tax_cents": 0, "compensation_cents": 10000000, "is_hce": True},
+            {"internal_id": "hce2", "match_cents": 400000, "after_tax_cents": 0, "compensation_cents": 15000000, "is_hce": True},
+        ]
+        kwargs = {
+            "participants": participants,
+            "adoption_rates": [0.25, 0.5, 0.75],
+            "contribution_rates": [0.04, 0.06, 0.08],
+            "seed": 7,
+        }
+
+        sequential = scenario_runner.run_grid_scenarios_v2(**kwargs)
+        monkeypatch.setattr(scenario_runner, "GRID_PARALLEL_MIN_WORK", 0)
+        monkeypatch.setattr(scenario_runner.os, "cpu_count", lambda: 2)
+        parallel = scenario_runner.run_grid_scenarios_v2(**kwargs)
+        executor = scenario_runner._grid_executor
+        again = scenario_runner.run_grid_scenarios_v2(**kwargs)
+
+        assert parallel == sequential
+        assert again == sequential
+        assert scenario_runner._grid_executor is executor
+        scenario_runner.shutdown_grid_executor()
+        assert scenario_runner._grid_executor is None
+
+    def test_grid_workers_spawn_without_forkserver(self, monkeypatch):
+        """Platforms without forkserver (Windows) spawn grid workers instead."""
+        from app.services import scenario_runner
+
+        monkeypatch.setattr(scenario_runner.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+        assert scenario_runner._grid_mp_context().get_start_method() == "spawn"
+
 
 # ============================================================================
 # Phase 8 (T065-T066): Performance Benchmarks
@@ -0,0 +1,133 @@
+"""
+Unit Tests for Storage Utilities.
+
+Tests for atomic_write, UnitOfWork and the auto_commit repository decorator.
+"""
+
+import duckdb
+import pytest
+
+from app.storage.database import init_database
+from app.storage.repository import CensusRepository
+from app.storage.utils import (
+    UnitOfWork,
+    atomic_write,
+    atomic_write_many,
+    auto_commit,
+    in_unit_of_work,
+)
+
+
+class _Repo:
+    """Minimal repository exercising @auto_commit."""
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection):
+        self.conn = conn
+
+    @auto_commit
+    def add(self, value: int) -> int:
+        self.conn.execute("INSERT INTO t VALUES (?)", (value,))
+        return value
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect(":memory:")
+    conn.execute("CREATE TABLE t (v INTEGER)")
+    yield conn
+    conn.close()
+
+
+def test_atomic_write_replaces_file_without_leaving_temp_files(tmp_path):
+    target = tmp_path / "nested" / "data.json"
+    atomic_write(target, "old")
+    atomic_write(target, "ünïcode " * 10_000)
+    assert target.read_text(encoding="utf-8") == "ünïcode " * 10_000
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_atomic_write_accepts_bytes_and_chunks(tmp_path):
+    target = tmp_path / "data.bin"
+    atomic_write(target, b"\x00\xffraw")
+    assert target.read_bytes() == b"\x00\xffraw"
+
+    chunks = [b"a" * 5000, bytearray(b"b" * 3), memoryview(b""), memoryview(b"c" * 7)]
+    atomic_write(target, iter(chunks))
+    assert target.read_bytes() == b"a" * 5000 + b"b" * 3 + b"c" * 7
+
+
+def _values(conn) -> list[int]:
+    return [row[0] for row in conn.execute("SELECT v FROM t ORDER BY v").fetchall()]
+
+
+def test_auto_commit_outside_unit_of_work(conn):
+    repo = _Repo(conn)
+    assert repo.add(1) == 1
+    assert _values(conn) == [1]
+
+
+def test_unit_of_work_commits_once_on_exit(conn):
+    repo = _Repo(conn)
+    with UnitOfWork(conn):
+        repo.add(1)
+        repo.add(2)
+        assert in_unit_of_work(conn)
+    assert not in_unit_of_work(conn)
+    assert _values(conn) == [1, 2]
+
+
+def test_unit_of_work_rolls_back_on_error(conn):
+    repo = _Repo(conn)
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(conn):
+            repo.add(1)
+            raise RuntimeError("boom")
+    assert not in_unit_of_work(conn)
+    assert _values(conn) == []
+
+
+def test_nested_unit_of_work_joins_outer_transaction(conn):
+    repo = _Repo(conn)
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(conn):
+            with UnitOfWork(conn):
+                repo.add(1)
+            assert in_unit_of_work(conn)
+            raise RuntimeError("boom")
+    assert _values(conn) == []
+
+
+def test_repository_writes_join_unit_of_work():
+    conn = duckdb.connect(":memory:")
+    init_database(conn)
+    try:
+        # An inner commit would end the transaction early and make the
+        # rollback fail, hiding the original error
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(conn):
+                CensusRepository(conn).delete("missing")
+                raise RuntimeError("boom")
+    finally:
+        conn.close()
+
+
+def test_atomic_write_many_writes_every_file(tmp_path):
+    first = tmp_path / "a" / "one.json"
+    second = tmp_path / "b" / "two.json"
+    atomic_write_many([(first, "1"), (second, b"2")])
+    assert first.read_text() == "1"
+    assert second.read_bytes() == b"2"
+
+
+def test_atomic_write_many_leaves_targets_untouched_on_failure(tmp_path):
+    target = tmp_path / "keep.json"
+    atomic_write(target, "old")
+
+    def chunks():
+        yield b"partial"
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        atomic_write_many([(target, "new"), (tmp_path / "other.json", chunks())])
+    assert target.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [target]
@@ -0,0 +1,193 @@
+"""
+Unit Tests for File-based Workspace Storage.
+
+Tests for WorkspaceStorage listing, caching and invalidation.
+"""
+
+import io
+import os
+
+import numpy as np
+import pytest
+
+from app.models.run import Run
+from app.models.workspace import WorkspaceCreate, WorkspaceUpdate
+from app.storage.workspace_storage import WorkspaceStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return WorkspaceStorage(base_dir=tmp_path)
+
+
+def test_list_workspaces_reflects_updates_and_deletes(storage):
+    first = storage.create_workspace(WorkspaceCreate(name="First"))
+    second = storage.create_workspace(WorkspaceCreate(name="Second"))
+    assert {w.name for w in storage.list_workspaces()} == {"First", "Second"}
+
+    storage.update_workspace(first.id, WorkspaceUpdate(name="Renamed"))
+    listed = storage.list_workspaces()
+    assert listed[0].id == first.id
+    assert listed[0].name == "Renamed"
+
+    storage.delete_workspace(second.id)
+    assert [w.id for w in storage.list_workspaces()] == [first.id]
+
+
+def test_list_workspaces_picks_up_external_edits(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Original"))
+    storage.list_workspaces()
+
+    workspace_file = storage._workspace_file(workspace.id)
+    edited = workspace.model_copy(update={"name": "Edited on disk"})
+    workspace_file.write_text(edited.model_dump_json())
+    st = workspace_file.stat()
+    os.utime(workspace_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert storage.list_workspaces()[0].name == "Edited on disk"
+
+
+def test_same_size_edit_within_one_mtime_tick_is_picked_up(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Before"))
+    storage.get_workspace(workspace.id)
+
+    # Another process renames in an edit of the same size; the mtime is pinned
+    # to model a coarse clock that did not advance
+    workspace_file = storage._workspace_file(workspace.id)
+    st = workspace_file.stat()
+    edited = workspace_file.with_suffix(".tmp")
+    edited.write_text(workspace.model_copy(update={"name": "After!"}).model_dump_json())
+    assert edited.stat().st_size == st.st_size
+    os.utime(edited, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(edited, workspace_file)
+
+    assert storage.get_workspace(workspace.id).name == "After!"
+
+
+def test_listed_models_are_independent_copies(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Shared"))
+    storage.list_workspaces()[0].name = "Mutated"
+    assert storage.list_workspaces()[0].name == "Shared"
+    assert storage.get_workspace(workspace.id).name == "Shared"
+
+
+def test_list_runs_skips_invalid_metadata(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Runs"))
+    run = storage.create_run(
+        workspace.id,
+        Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=7),
+    )
+    broken_dir = storage._runs_dir(workspace.id) / "broken"
+    broken_dir.mkdir()
+    (broken_dir / "run_metadata.json").write_text("{not json")
+
+    assert [r.id for r in storage.list_runs(workspace.id)] == [run.id]
+
+    storage.delete_run(workspace.id, run.id)
+    assert storage.list_runs(workspace.id) == []
+
+
+def test_run_results_round_trip_with_numpy_scalars(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Results"))
+    results = {"summary": {"pass_count": np.int64(3), "margin": np.float64(0.25)}, "seed_used": 42}
+    storage.save_run_results(workspace.id, workspace.id, results)
+    assert storage.get_run_results(workspace.id, workspace.id) == {
+        "summary": {"pass_count": 3, "margin": 0.25},
+        "seed_used": 42,
+    }
+
+
+def test_metadata_is_compact_unless_pretty_json_requested(storage, monkeypatch):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Compact"))
+    assert b"\n" not in storage._workspace_file(workspace.id).read_bytes()
+
+    monkeypatch.setenv("ACP_PRETTY_JSON", "1")
+    storage.update_workspace(workspace.id, WorkspaceUpdate(name="Pretty"))
+    assert b'\n  "name": "Pretty"' in storage._workspace_file(workspace.id).read_bytes()
+
+
+def test_workspace_detail_counts_runs(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Detail"))
+    assert storage.get_workspace_detail(workspace.id).run_count == 0
+
+    for seed in (1, 2):
+        storage.create_run(
+            workspace.id,
+            Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=seed),
+        )
+    (storage._runs_dir(workspace.id) / "empty").mkdir()
+    assert storage.get_workspace_detail(workspace.id).run_count == 2
+
+
+def test_list_workspaces_loads_large_listings_in_parallel(storage):
+    created = {storage.create_workspace(WorkspaceCreate(name=f"WS {i}")).id for i in range(20)}
+    (storage.base_dir / "not-a-workspace").mkdir()
+    assert {w.id for w in storage.list_workspaces()} == created
+
+
+def test_save_census_data_stream_accepts_file_objects_and_chunks(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Census"))
+    storage.save_census_data_stream(workspace.id, io.BytesIO(b"id,comp\n1,100\n"))
+    assert storage.get_census_data_path(workspace.id).read_bytes() == b"id,comp\n1,100\n"
+
+    storage.save_census_data_stream(workspace.id, iter([b"id,comp\n", b"2,200\n"]))
+    assert storage.get_census_data_path(workspace.id).read_bytes() == b"id,comp\n2,200\n"
+
+
+def test_run_count_tracks_runs_added_and_removed(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Counts"))
+    run = storage.create_run(
+        workspace.id,
+        Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=3),
+    )
+    assert storage.get_workspace_detail(workspace.id).run_count == 1
+
+    # A run written by another process shows up via the runs directory mtime
+    other = WorkspaceStorage(base_dir=storage.base_dir)
+    other.create_run(
+        workspace.id,
+        Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=4),
+    )
+    assert storage.get_workspace_detail(workspace.id).run_count == 2
+
+    storage.delete_run(workspace.id, run.id)
+    assert storage.get_workspace_detail(workspace.id).run_count == 1
+
+
+def test_run_count_is_reused_while_runs_directory_is_unchanged(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Stable"))
+    storage.create_run(
+        workspace.id,
+        Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=5),
+    )
+    runs_dir = storage._runs_dir(workspace.id)
+    os.utime(runs_dir, ns=(0, 1_000_000_000))
+    assert storage.get_workspace_detail(workspace.id).run_count == 1
+
+    # Metadata removed behind the storage's back without touching the directory mtime
+    next(runs_dir.iterdir()).joinpath("run_metadata.json").unlink()
+    os.utime(runs_dir, ns=(0, 1_000_000_000))
+    assert storage.get_workspace_detail(workspace.id).run_count == 1
+
+    os.utime(runs_dir, ns=(0, 2_000_000_000))
+    assert storage.get_workspace_detail(workspace.id).run_count == 0
+
+
+def test_written_models_are_cached_as_independent_copies(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Seeded"))
+    workspace.name = "Mutated after create"
+    assert storage.get_workspace(workspace.id).name == "Seeded"
+
+    run = storage.create_run(
+        workspace.id,
+        Run(workspace_id=workspace.id, adoption_rates=[0.1, 0.2], contribution_rates=[2.0, 4.0], seed=6),
+    )
+    run.seed = 99
+    assert storage.get_run(workspace.id, run.id).seed == 6
+
+
+def test_get_workspace_raises_on_corrupt_file(storage):
+    workspace = storage.create_workspace(WorkspaceCreate(name="Corrupt"))
+    storage._workspace_file(workspace.id).write_text("{not json")
+    with pytest.raises(ValueError):
+        storage.get_workspace(workspace.id)
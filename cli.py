@@ -6,6 +6,8 @@ Launch and manage the mega backdoor Roth compliance analysis tool.
 """
 
 import os
+import select
+import selectors
 import shutil
 import signal
 import subprocess
@@ -41,9 +43,64 @@ def get_npm_command() -> str:
     return ""
 
 
+# Kernel socket tables and the state code of a listening socket in them
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+TCP_LISTEN = "0A"
+
+
+def _listening_inodes(port: int) -> set[int]:
+    """Return the socket inodes listening on the given TCP port, from /proc/net."""
+    inodes = set()
+    for path in PROC_NET_TCP:
+        try:
+            with open(path) as table:
+                next(table, None)  # Header
+                for line in table:
+                    fields = line.split()
+                    if (
+                        len(fields) > 9
+                        and fields[3] == TCP_LISTEN
+                        and int(fields[1].rsplit(":", 1)[1], 16) == port
+                    ):
+                        inodes.add(int(fields[9]))
+        except FileNotFoundError:
+            # No IPv6 table when IPv6 is disabled
+            pass
+    return inodes
+
+
+def _pids_for_inodes(inodes: set[int]) -> set[int]:
+    """Return the PIDs holding any of the given socket inodes open."""
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids = set()
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        fd_dir = f"/proc/{entry}/fd"
+        try:
+            for fd in os.listdir(fd_dir):
+                if os.readlink(f"{fd_dir}/{fd}") in targets:
+                    pids.add(int(entry))
+                    break
+        except OSError:
+            # Process exited, or belongs to another user
+            continue
+    return pids
+
+
 def kill_port(port: int) -> bool:
     """Kill any process using the specified port (cross-platform)."""
-    if sys.platform == "win32":
+    if sys.platform.startswith("linux") and os.path.exists(PROC_NET_TCP[0]):
+        # Linux: read the socket tables directly instead of forking lsof
+        inodes = _listening_inodes(port)
+        pids = _pids_for_inodes(inodes) if inodes else set()
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        return bool(pids)
+    elif sys.platform == "win32":
         # Windows: use netstat + taskkill
         try:
             result = subprocess.run(
@@ -69,7 +126,7 @@ def kill_port(port: int) -> bool:
         except Exception:
             pass
     else:
-        # Unix/Mac: use lsof
+        # Mac and other Unix: use lsof
         try:
             result = subprocess.run(
                 ["lsof", "-ti", f":{port}"],
@@ -109,6 +166,63 @@ def cleanup(signum=None, frame=None):
         sys.exit(0)
 
 
+def _wait_for_first_exit(procs: list[subprocess.Popen]) -> None:
+    """Block until any of the given processes exits.
+
+    Waits in the kernel on pidfds (Linux) or kqueue (macOS) so a dead service
+    is noticed at once; elsewhere, polls once a second.
+    """
+    if hasattr(os, "pidfd_open"):
+        pidfds = []
+        try:
+            for proc in procs:
+                pidfds.append(os.pidfd_open(proc.pid))
+        except ProcessLookupError:
+            # Already gone
+            for fd in pidfds:
+                os.close(fd)
+            return
+        except OSError:
+            # Kernel without pidfd support
+            for fd in pidfds:
+                os.close(fd)
+        else:
+            try:
+                with selectors.DefaultSelector() as sel:
+                    for fd in pidfds:
+                        sel.register(fd, selectors.EVENT_READ)
+                    sel.select()
+            finally:
+                for fd in pidfds:
+                    os.close(fd)
+            return
+    elif hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            kq.control(
+                [
+                    select.kevent(
+                        proc.pid,
+                        filter=select.KQ_FILTER_PROC,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                        fflags=select.KQ_NOTE_EXIT,
+                    )
+                    for proc in procs
+                ],
+                1,
+                None,
+            )
+        except ProcessLookupError:
+            # Already gone
+            pass
+        finally:
+            kq.close()
+        return
+
+    while all(proc.poll() is None for proc in procs):
+        time.sleep(1)
+
+
 signal.signal(signal.SIGINT, cleanup)
 if sys.platform != "win32":
     signal.signal(signal.SIGTERM, cleanup)
@@ -185,16 +299,31 @@ def start(api_port, ui_port, api_only, ui_only, no_browser):
     env = os.environ.copy()
     env["PYTHONPATH"] = str(ROOT_DIR)
 
+    api_cmd = [
+        sys.executable, "-m", "uvicorn",
+        "app.routers.main:app",
+        "--host", "0.0.0.0",
+        "--port", str(api_port),
+        "--reload",
+    ]
+    ui_cmd = [npm_cmd, "run", "dev", "--", "--port", str(ui_port), "--host"]
+    if no_browser:
+        ui_cmd.append("--no-open")
+    else:
+        ui_cmd.append("--open")
+
+    # A single service replaces this process, so it receives signals directly
+    # and no supervisor is left running. Windows has no real exec, so it
+    # always supervises.
+    if start_api != start_ui and sys.platform != "win32":
+        cmd, cwd = (api_cmd, BACKEND_DIR) if start_api else (ui_cmd, FRONTEND_DIR)
+        os.chdir(cwd)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvpe(cmd[0], cmd, env)
+
     # Start API server
     if start_api:
-        api_cmd = [
-            sys.executable, "-m", "uvicorn",
-            "app.routers.main:app",
-            "--host", "0.0.0.0",
-            "--port", str(api_port),
-            "--reload",
-        ]
-
         api_proc = subprocess.Popen(
             api_cmd,
             cwd=BACKEND_DIR,
@@ -205,12 +334,6 @@ def start(api_port, ui_port, api_only, ui_only, no_browser):
 
     # Start React frontend with Vite
     if start_ui:
-        ui_cmd = [npm_cmd, "run", "dev", "--", "--port", str(ui_port), "--host"]
-        if no_browser:
-            ui_cmd.append("--no-open")
-        else:
-            ui_cmd.append("--open")
-
         ui_proc = subprocess.Popen(
             ui_cmd,
             cwd=FRONTEND_DIR,
@@ -220,13 +343,10 @@ def start(api_port, ui_port, api_only, ui_only, no_browser):
 
     # Wait for processes
     try:
-        while True:
-            for proc in processes:
-                if proc.poll() is not None:
-                    click.secho("\nA service has stopped unexpectedly.", fg="red")
-                    cleanup()
-                    sys.exit(1)
-            time.sleep(1)
+        _wait_for_first_exit(processes)
+        click.secho("\nA service has stopped unexpectedly.", fg="red")
+        cleanup()
+        sys.exit(1)
     except KeyboardInterrupt:
         cleanup()
 